@@ -17,6 +17,9 @@ Examples:
   synthetic-generator web                         # Start web UI
   synthetic-generator generate --template customer_data --rows 1000 --out data.parquet
   synthetic-generator generate --in real.csv --rows 5000 --out synthetic.csv
+  synthetic-generator generate --in real.csv --save-model model.npz --rows 5000 --out synthetic.csv
+  synthetic-generator generate --model model.npz --rows 5000 --out synthetic.csv
+  synthetic-generator generate --template customer_data --rows 100000000 --chunk-size 1000000 --out data.parquet
   synthetic-generator web --port 8080            # Start web UI on port 8080
   synthetic-generator web --host 0.0.0.0         # Start web UI accessible from network
 		"""
@@ -35,9 +38,13 @@ Examples:
 	gen_parser.add_argument('--template', help='Built-in template name (e.g., customer_data, ecommerce_data)')
 	gen_parser.add_argument('--schema', help='Path to schema JSON file (alternative to --template)')
 	gen_parser.add_argument('--in', dest='in_path', help='Path to real data (CSV/JSON/Parquet/Excel) to fit from')
+	gen_parser.add_argument('--model', help='Path to a model saved with --save-model (skips fitting)')
+	gen_parser.add_argument('--save-model', help='Save the model fitted from --in to this path')
 	gen_parser.add_argument('--rows', type=int, default=1000, help='Number of rows to generate (default: 1000)')
 	gen_parser.add_argument('--seed', type=int, help='Optional random seed')
-	gen_parser.add_argument('--out', required=True, help='Output file path (.csv, .parquet)')
+	gen_parser.add_argument('--out', required=True, help='Output file path (.csv, .jsonl, .parquet)')
+	gen_parser.add_argument('--chunk-size', type=int, help='Generate and write this many rows at a time (constant memory)')
+	gen_parser.add_argument('--max-rows-per-file', type=int, help='With --chunk-size, rotate to a new numbered file after this many rows')
 
 	args = parser.parse_args()
 	
@@ -48,31 +55,61 @@ Examples:
 	elif args.command == 'generate':
 		# Lazy import quick API
 		import json
-		from .quick import dataset, fit as quick_fit
+		from .quick import QuickModel, dataset, fit as quick_fit
 		
-		if args.in_path:
+		if args.model:
+			model = QuickModel.load(args.model)
+		elif args.in_path:
 			model = quick_fit(args.in_path)
-			df = model.sample(args.rows, seed=args.seed)
+			if args.save_model:
+				model.save(args.save_model)
 		else:
+			if not args.template and not args.schema:
+				gen_parser.error('one of --template, --schema, --in or --model is required')
 			loaded_schema = None
 			if args.schema:
 				with open(args.schema, 'r', encoding='utf-8') as f:
 					loaded_schema = json.load(f)
-			df = dataset(template=args.template, schema=loaded_schema, rows=args.rows, seed=args.seed)
+			model = None
 		
-		# Save
 		out_path = args.out
-		if out_path.lower().endswith('.parquet'):
-			df.to_parquet(out_path, index=False)
-		elif out_path.lower().endswith('.csv'):
-			df.to_csv(out_path, index=False)
+		if args.chunk_size:
+			# Stream chunks straight to the output
+			from .export import export_data
+			from .schemas import DataSchema, load_template
+			if model is None:
+				schema = load_template(args.template) if args.template else DataSchema.from_dict(loaded_schema)
+				model = QuickModel(schema)
+			chunks = model.sample_chunks(args.rows, args.chunk_size, seed=args.seed)
+			# Count the rows written, as constraints may drop some
+			sizes = []
+			def counted():
+				for chunk in chunks:
+					sizes.append(len(chunk))
+					yield chunk
+			files = export_data(counted(), _output_format(out_path), filepath=out_path, max_rows=args.max_rows_per_file)
+			print(f"Wrote {sum(sizes):,} rows to {', '.join(files)}")
+			return
+		
+		if model is not None:
+			df = model.sample(args.rows, seed=args.seed)
 		else:
-			df.to_csv(out_path, index=False)
+			df = dataset(template=args.template, schema=loaded_schema, rows=args.rows, seed=args.seed)
+		
+		# Save, in the temporal formats the schema sets
+		from .export import export_data
+		export_data(df, _output_format(out_path), filepath=out_path)
 		print(f"Wrote {len(df):,} rows to {out_path}")
 	else:
 		parser.print_help()
 		sys.exit(1)
 
 
+def _output_format(path):
+	"""Export format of an output path, by extension (CSV by default)."""
+	extension = path.lower().rsplit('.', 1)[-1]
+	return extension if extension in ('parquet', 'jsonl') else 'csv'
+
+
 if __name__ == '__main__':
 	main()
@@ -5,16 +5,27 @@ This module provides utilities for exporting generated data
 to various formats and databases.
 """
 
+import pandas as pd
 from .formats import DataExporter
 from .database import DatabaseExporter
+from .writers import ChunkWriter, CSVChunkWriter, JSONLinesChunkWriter, ParquetChunkWriter, chunk_writer
+from .partitioned import write_partitioned_parquet
 
 __all__ = [
     'DataExporter',
     'DatabaseExporter',
+    'ChunkWriter',
+    'CSVChunkWriter',
+    'JSONLinesChunkWriter',
+    'ParquetChunkWriter',
+    'chunk_writer',
+    'write_partitioned_parquet',
     'export_data'
 ]
 
 def export_data(data, format_type: str, **kwargs):
-    """Export data to specified format."""
+    """Export data to specified format; an iterator of chunks is streamed."""
     exporter = DataExporter()
-    return exporter.export(data, format_type, **kwargs) 
\ No newline at end of file
+    if not isinstance(data, pd.DataFrame):
+        return exporter.export_chunks(data, format_type, **kwargs)
+    return exporter.export(data, format_type, **kwargs)
@@ -3,18 +3,52 @@ Data export functionality for SynGen.
 """
 
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional
+from ..generators.temporal_generators import TemporalGenerator, temporal_formats
+from .writers import chunk_writer
+from .partitioned import write_partitioned_parquet
 
 
 class DataExporter:
     """Export data to various formats."""
     
-    def export(self, data: pd.DataFrame, format_type: str, **kwargs):
-        """Export data to specified format."""
+    def export(
+        self,
+        data: pd.DataFrame,
+        format_type: str,
+        date_formats: Optional[Dict[str, str]] = None,
+        schema: Optional[Any] = None,
+        **kwargs
+    ):
+        """
+        Export data to specified format.
+        
+        Temporal columns are written in the formats their schema sets
+        (``format_string`` or ``parameters['format']``); JSON writes the
+        other ones as ISO 8601 strings.
+        
+        Args:
+            data: Data to export
+            format_type: One of 'csv', 'json', 'jsonl', 'parquet' or 'excel'
+            date_formats: Optional mapping of temporal column name to a
+                ``strftime`` format applied at export time; defaults to
+                the formats of ``schema``, or of the schema that generated
+                ``data`` (``data.attrs['date_formats']``)
+            schema: Optional schema of the data
+            **kwargs: Passed through to the format-specific writer; for
+                'parquet', ``partition_by`` (and ``workers``) writes a
+                Hive-partitioned dataset directory instead of one file
+        """
+        date_formats = _date_formats(data, date_formats, schema)
+        if date_formats:
+            data = format_temporal_columns(data, date_formats)
+        
         if format_type == 'csv':
             return self._export_csv(data, **kwargs)
         elif format_type == 'json':
             return self._export_json(data, **kwargs)
+        elif format_type == 'jsonl':
+            return self._export_jsonl(data, **kwargs)
         elif format_type == 'parquet':
             return self._export_parquet(data, **kwargs)
         elif format_type == 'excel':
@@ -22,6 +56,58 @@ class DataExporter:
         else:
             raise ValueError(f"Unsupported format: {format_type}")
     
+    def export_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        format_type: str,
+        filepath: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        date_formats: Optional[Dict[str, str]] = None,
+        schema: Optional[Any] = None,
+        **kwargs
+    ) -> List[str]:
+        """
+        Export a stream of chunks, appending each one as it arrives.
+        
+        Only one chunk is held in memory at a time, so e.g. the output of
+        ``DataGenerator.generate_chunks`` is exported in constant memory.
+        
+        Args:
+            chunks: DataFrames to export, all with the same columns
+            format_type: One of 'csv', 'jsonl' (or 'json', written as JSON
+                Lines) and 'parquet', which gets one row group per chunk
+            filepath: Output path
+            max_rows: Rotate to a new numbered file after this many rows
+            max_bytes: Rotate to a new numbered file once this size is reached
+            date_formats: Optional mapping of temporal column name to a
+                ``strftime`` format applied at export time; defaults as in
+                ``export``, from ``schema`` or each chunk's ``attrs``
+            schema: Optional schema of the data
+            **kwargs: Passed through to the format-specific writer; for
+                'parquet', ``partition_by`` (and ``workers``) writes every
+                chunk into a Hive-partitioned dataset directory
+            
+        Returns:
+            Paths of the files written (relative to the dataset directory
+            when partitioned)
+        """
+        chunks = (
+            format_temporal_columns(chunk, _date_formats(chunk, date_formats, schema))
+            for chunk in chunks
+        )
+        
+        if format_type == 'parquet' and kwargs.get('partition_by'):
+            if max_rows is not None or max_bytes is not None:
+                raise ValueError("Partitioned datasets are not rotated; every chunk writes its own files")
+            return self._export_partitioned(chunks, filepath, **kwargs)
+        
+        if filepath is None:
+            extension = {'json': 'jsonl'}.get(format_type, format_type)
+            filepath = f'synthetic_data.{extension}'
+        writer = chunk_writer(format_type, filepath, max_rows=max_rows, max_bytes=max_bytes, **kwargs)
+        return writer.write_chunks(chunks)
+    
     def _export_csv(self, data: pd.DataFrame, **kwargs):
         """Export to CSV format."""
         filepath = kwargs.pop('filepath', 'synthetic_data.csv')
@@ -30,14 +116,59 @@ class DataExporter:
     def _export_json(self, data: pd.DataFrame, **kwargs):
         """Export to JSON format."""
         filepath = kwargs.pop('filepath', 'synthetic_data.json')
+        kwargs.setdefault('date_format', 'iso')
         return data.to_json(filepath, orient='records', **kwargs)
     
+    def _export_jsonl(self, data: pd.DataFrame, **kwargs):
+        """Export to JSON Lines format."""
+        filepath = kwargs.pop('filepath', 'synthetic_data.jsonl')
+        kwargs.setdefault('date_format', 'iso')
+        return data.to_json(filepath, orient='records', lines=True, **kwargs)
+    
     def _export_parquet(self, data: pd.DataFrame, **kwargs):
         """Export to Parquet format."""
+        if kwargs.get('partition_by'):
+            return self._export_partitioned([data], kwargs.pop('filepath', None), **kwargs)
         filepath = kwargs.pop('filepath', 'synthetic_data.parquet')
         return data.to_parquet(filepath, index=False, **kwargs)
     
+    def _export_partitioned(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        filepath: Optional[str],
+        partition_by: List[str],
+        workers: Optional[int] = None,
+        **kwargs
+    ) -> List[str]:
+        """Export to a Hive-partitioned Parquet dataset directory."""
+        return write_partitioned_parquet(
+            chunks, filepath or 'synthetic_data', partition_by, workers=workers, **kwargs
+        )
+    
     def _export_excel(self, data: pd.DataFrame, **kwargs):
         """Export to Excel format."""
         filepath = kwargs.pop('filepath', 'synthetic_data.xlsx')
-        return data.to_excel(filepath, index=False, **kwargs) 
\ No newline at end of file
+        return data.to_excel(filepath, index=False, **kwargs)
+
+
+def _date_formats(
+    data: pd.DataFrame,
+    date_formats: Optional[Dict[str, str]],
+    schema: Optional[Any]
+) -> Dict[str, str]:
+    """Resolve the export formats of temporal columns: given, from the schema, or from ``attrs``."""
+    if date_formats is not None:
+        return date_formats
+    if schema is not None:
+        return temporal_formats(schema, defaults=False)
+    return data.attrs.get('date_formats') or {}
+
+
+def format_temporal_columns(data: pd.DataFrame, date_formats: Dict[str, str]) -> pd.DataFrame:
+    """Render typed temporal columns as strings using the requested formats."""
+    formatted = {
+        col: TemporalGenerator.format_temporal(data[col].to_numpy(), fmt)
+        for col, fmt in date_formats.items()
+        if col in data.columns
+    }
+    return data.assign(**formatted) if formatted else data
@@ -0,0 +1,118 @@
+"""
+Partitioned Parquet datasets for SynGen.
+
+Rows are split by the values of the partition columns into a Hive-style
+directory tree (``country=FR/year=2024/part-00000.parquet``), the files of
+each chunk are written concurrently in worker processes, and a
+``_metadata`` file gathers the footers of all files, so readers can plan
+a scan without opening every file.
+"""
+
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = pq = None
+
+
+# Directory name of missing partition values, as written by Hive and Spark
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def write_partitioned_parquet(
+    chunks: Iterable[pd.DataFrame],
+    path: str,
+    partition_by: List[str],
+    workers: Optional[int] = None,
+    **kwargs
+) -> List[str]:
+    """
+    Write DataFrames as one Hive-partitioned Parquet dataset.
+
+    Every chunk writes one file (``part-<chunk>.parquet``) into each
+    partition directory it has rows for. The partition columns are encoded
+    in the directory names and left out of the files.
+
+    Args:
+        chunks: DataFrames to write, all with the same columns
+        path: Dataset directory
+        partition_by: Partition columns, outermost first
+        workers: Maximum number of worker processes; 1 writes serially
+        **kwargs: Passed through to ``pyarrow.parquet.write_table``
+            (e.g. ``compression``)
+
+    Returns:
+        Paths of the data files written, relative to ``path``
+    """
+    if pq is None:
+        raise ImportError("Partitioned Parquet export requires pyarrow")
+    if not partition_by:
+        raise ValueError("partition_by must name at least one column")
+
+    os.makedirs(path, exist_ok=True)
+    schema = None
+    files: List[str] = []
+    footers = []
+    # One pool for all chunks, rather than one per chunk
+    executor = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        for number, chunk in enumerate(chunks):
+            missing = [col for col in partition_by if col not in chunk.columns]
+            if missing:
+                raise ValueError(f"Partition columns not in data: {missing}")
+            if schema is None:
+                # One schema for every file, so their footers can be merged
+                schema = pa.Schema.from_pandas(chunk.drop(columns=partition_by), preserve_index=False)
+
+            tasks = [
+                (part, os.path.join(path, directory, f"part-{number:05d}.parquet"), schema, kwargs)
+                for directory, part in _split(chunk, partition_by)
+            ]
+            for task in tasks:
+                os.makedirs(os.path.dirname(task[1]), exist_ok=True)
+            footers.extend((executor.map if executor else map)(_write_file, tasks))
+            files.extend(os.path.relpath(task[1], path) for task in tasks)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if schema is not None:
+        _write_metadata(path, schema, files, footers)
+    return files
+
+
+def _split(chunk: pd.DataFrame, partition_by: List[str]) -> List[Tuple[str, pd.DataFrame]]:
+    """Split a chunk into (partition directory, rows without partition columns) pairs."""
+    groups = chunk.groupby(partition_by, sort=True, dropna=False, observed=True)
+    parts = []
+    for values, part in groups:
+        values = values if isinstance(values, tuple) else (values,)
+        directory = os.path.join(*[
+            f"{col}={NULL_PARTITION if pd.isna(value) else quote(str(value), safe='')}"
+            for col, value in zip(partition_by, values)
+        ])
+        parts.append((directory, part.drop(columns=partition_by)))
+    return parts
+
+
+def _write_file(task: Tuple[pd.DataFrame, str, Any, Dict[str, Any]]):
+    """Write one data file, returning its footer."""
+    part, filepath, schema, kwargs = task
+    footers: list = []
+    table = pa.Table.from_pandas(part, schema=schema, preserve_index=False)
+    pq.write_table(table, filepath, metadata_collector=footers, **kwargs)
+    return footers[0]
+
+
+def _write_metadata(path: str, schema, files: List[str], footers: list):
+    """Write the ``_common_metadata`` schema and the ``_metadata`` footer summary."""
+    pq.write_metadata(schema, os.path.join(path, '_common_metadata'))
+    for filepath, footer in zip(files, footers):
+        footer.set_file_path(filepath.replace(os.sep, '/'))
+    pq.write_metadata(schema, os.path.join(path, '_metadata'), metadata_collector=footers)
@@ -0,0 +1,287 @@
+"""
+Streaming chunk writers for SynGen.
+
+A chunk writer appends DataFrames to its output one at a time, so data
+generated in chunks is exported without ever being held whole in memory.
+Output can be rotated over numbered files by row count or file size.
+"""
+
+import os
+import pandas as pd
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Type
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = pq = None
+
+
+class ChunkWriter(ABC):
+    """
+    Base class of the streaming writers.
+
+    Subclasses implement ``_open_file``, ``_write`` and ``_close_file``.
+    Without rotation, everything is written to ``path``. With ``max_rows``
+    or ``max_bytes``, files are numbered (``data.csv`` becomes
+    ``data-00000.csv``, ``data-00001.csv``, ...): a file holds at most
+    ``max_rows`` rows, and is closed after the chunk that brings it to
+    ``max_bytes``.
+
+    Attributes:
+        path: Output path
+        files: Paths of the files written so far
+        rows: Number of rows written so far
+    """
+
+    extension = ''
+
+    def __init__(self, path: str, max_rows: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the writer; files are only created by ``write``.
+
+        Args:
+            path: Output path
+            max_rows: Maximum number of rows per file
+            max_bytes: File size after which the next file is started
+        """
+        if max_rows is not None and max_rows <= 0:
+            raise ValueError("max_rows must be positive")
+        self.path = path
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.files: List[str] = []
+        self.rows = 0
+        self._file_rows = 0
+        self._open = False
+
+    def __enter__(self) -> 'ChunkWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, chunk: pd.DataFrame):
+        """
+        Append a chunk, splitting it over files when ``max_rows`` is reached.
+
+        Files are created on the first row they receive, so empty chunks
+        write nothing.
+
+        Args:
+            chunk: Rows to append
+        """
+        start = 0
+        while start < len(chunk):
+            if not self._open:
+                self._start_file()
+            room = len(chunk) - start if self.max_rows is None else self.max_rows - self._file_rows
+            part = chunk.iloc[start:start + room]
+            self._write(part)
+            self._file_rows += len(part)
+            self.rows += len(part)
+            start += len(part)
+
+            full = self.max_rows is not None and self._file_rows >= self.max_rows
+            if full or (self.max_bytes is not None and self._size() >= self.max_bytes):
+                self._close()
+
+    def write_chunks(self, chunks: Iterable[pd.DataFrame]) -> List[str]:
+        """
+        Write every chunk of an iterator, then close the writer.
+
+        Args:
+            chunks: DataFrames to append
+
+        Returns:
+            Paths of the files written
+        """
+        with self:
+            for chunk in chunks:
+                self.write(chunk)
+        return self.files
+
+    def close(self):
+        """Finish the current file."""
+        if self._open:
+            self._close()
+
+    def _start_file(self):
+        """Start the next output file and record its path."""
+        if self.max_rows is None and self.max_bytes is None:
+            path = self.path
+        else:
+            stem, extension = os.path.splitext(self.path)
+            path = f"{stem}-{len(self.files):05d}{extension or self.extension}"
+        self.files.append(path)
+        self._file_rows = 0
+        self._open = True
+        self._open_file(path)
+
+    def _close(self):
+        """Finish the current file, so the next write starts a new one."""
+        self._close_file()
+        self._open = False
+
+    def _size(self) -> int:
+        """Get the size of the current file in bytes."""
+        return os.path.getsize(self.files[-1])
+
+    @abstractmethod
+    def _open_file(self, path: str):
+        """Open a new output file."""
+
+    @abstractmethod
+    def _write(self, chunk: pd.DataFrame):
+        """Append rows to the current file."""
+
+    @abstractmethod
+    def _close_file(self):
+        """Close the current file."""
+
+
+class CSVChunkWriter(ChunkWriter):
+    """Writes CSV, with the header once at the top of every file."""
+
+    extension = '.csv'
+
+    def __init__(self, path: str, max_rows: Optional[int] = None, max_bytes: Optional[int] = None, **kwargs):
+        """
+        Initialize the CSV writer.
+
+        Args:
+            path: Output path
+            max_rows: Maximum number of rows per file
+            max_bytes: File size after which the next file is started
+            **kwargs: Passed through to ``DataFrame.to_csv``
+        """
+        super().__init__(path, max_rows, max_bytes)
+        self.kwargs = kwargs
+        self._file = None
+
+    def _open_file(self, path: str):
+        """Open a CSV file; its first chunk writes the header."""
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._header = True
+
+    def _write(self, chunk: pd.DataFrame):
+        """Append rows as CSV."""
+        chunk.to_csv(self._file, index=False, header=self._header, **self.kwargs)
+        self._header = False
+
+    def _size(self) -> int:
+        """Get the number of bytes written to the open file."""
+        return self._file.tell()
+
+    def _close_file(self):
+        """Close the CSV file."""
+        self._file.close()
+
+
+class JSONLinesChunkWriter(ChunkWriter):
+    """Writes JSON Lines, one record per row."""
+
+    extension = '.jsonl'
+
+    def __init__(self, path: str, max_rows: Optional[int] = None, max_bytes: Optional[int] = None, **kwargs):
+        """
+        Initialize the JSON Lines writer.
+
+        Args:
+            path: Output path
+            max_rows: Maximum number of rows per file
+            max_bytes: File size after which the next file is started
+            **kwargs: Passed through to ``DataFrame.to_json``; dates are
+                written as ISO 8601 strings unless ``date_format`` is given
+        """
+        super().__init__(path, max_rows, max_bytes)
+        kwargs.setdefault('date_format', 'iso')
+        self.kwargs = kwargs
+        self._file = None
+
+    def _open_file(self, path: str):
+        """Open a JSON Lines file."""
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def _write(self, chunk: pd.DataFrame):
+        """Append rows as JSON records, one per line."""
+        text = chunk.to_json(orient='records', lines=True, **self.kwargs)
+        self._file.write(text if text.endswith('\n') else text + '\n')
+
+    def _size(self) -> int:
+        """Get the number of bytes written to the open file."""
+        return self._file.tell()
+
+    def _close_file(self):
+        """Close the JSON Lines file."""
+        self._file.close()
+
+
+class ParquetChunkWriter(ChunkWriter):
+    """Writes Parquet with ``pyarrow.parquet.ParquetWriter``, one row group per chunk."""
+
+    extension = '.parquet'
+
+    def __init__(self, path: str, max_rows: Optional[int] = None, max_bytes: Optional[int] = None, **kwargs):
+        """
+        Initialize the Parquet writer.
+
+        Args:
+            path: Output path
+            max_rows: Maximum number of rows per file
+            max_bytes: File size after which the next file is started
+            **kwargs: Passed through to ``pyarrow.parquet.ParquetWriter``
+                (e.g. ``compression``)
+        """
+        if pq is None:
+            raise ImportError("Streaming Parquet export requires pyarrow")
+        super().__init__(path, max_rows, max_bytes)
+        self.kwargs = kwargs
+        # Schema of the first chunk, which every later chunk must match
+        self.schema: Optional['pa.Schema'] = None
+        self._writer = None
+
+    def _open_file(self, path: str):
+        """Remember the path; the file is created with the first chunk's schema."""
+        self._path = path
+
+    def _write(self, chunk: pd.DataFrame):
+        """Append rows as one row group."""
+        table = pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+        if self.schema is None:
+            self.schema = table.schema
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._path, self.schema, **self.kwargs)
+        self._writer.write_table(table, row_group_size=max(len(table), 1))
+
+    def _close_file(self):
+        """Write the Parquet footer and close the file."""
+        self._writer.close()
+        self._writer = None
+
+
+# Writers by export format
+CHUNK_WRITERS: Dict[str, Type[ChunkWriter]] = {
+    'csv': CSVChunkWriter,
+    'jsonl': JSONLinesChunkWriter,
+    'parquet': ParquetChunkWriter,
+}
+
+
+def chunk_writer(format_type: str, path: str, **kwargs) -> ChunkWriter:
+    """
+    Create the streaming writer of an export format.
+
+    Args:
+        format_type: One of 'csv', 'jsonl' (or 'json') and 'parquet'
+        path: Output path
+        **kwargs: ``max_rows``, ``max_bytes`` and writer options
+
+    Returns:
+        The writer
+    """
+    format_type = 'jsonl' if format_type == 'json' else format_type
+    if format_type not in CHUNK_WRITERS:
+        raise ValueError(f"Unsupported streaming format: {format_type}")
+    return CHUNK_WRITERS[format_type](path, **kwargs)
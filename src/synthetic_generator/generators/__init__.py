@@ -9,10 +9,13 @@ from .base import DataGenerator
 from .distributions import DistributionGenerator
 from .correlations import CorrelationManager
 from .constraints import ConstraintManager
+from .relational import RelationalGenerator, generate_partitions
 
 __all__ = [
     'DataGenerator',
     'DistributionGenerator',
     'CorrelationManager', 
-    'ConstraintManager'
+    'ConstraintManager',
+    'RelationalGenerator',
+    'generate_partitions'
 ] 
\ No newline at end of file
@@ -4,9 +4,11 @@ Main data generator class for SynGen.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from ..schemas import DataSchema, ColumnSchema, DataType, DistributionType
 from .distributions import DistributionGenerator
+from .temporal_generators import EventStream, temporal_formats
+from ..utils.sketches import OnlineCovariance, QuantileSketch
 from .correlations import CorrelationManager
 from .constraints import ConstraintManager
 
@@ -14,24 +16,44 @@ from .constraints import ConstraintManager
 class DataGenerator:
     """Main class for generating synthetic data based on a schema."""
     
-    def __init__(self, schema: DataSchema, constraints: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        schema: DataSchema,
+        constraints: Optional[Dict[str, Any]] = None,
+        correlation_method: str = 'copula'
+    ):
         """
         Initialize the data generator.
         
         Args:
             schema: Data schema defining the structure
             constraints: Additional constraints for data generation
+            correlation_method: How schema correlations are applied
+                ('copula', 'iman_conover' or 'pairwise')
         """
         self.schema = schema
         self.constraints = constraints or {}
+        self.correlation_method = correlation_method
         self.distribution_generator = DistributionGenerator()
         self.correlation_manager = CorrelationManager()
         self.constraint_manager = ConstraintManager()
         
+        # Per-column event streams, kept across chunks of one generation run
+        self._event_streams: Dict[str, EventStream] = {}
+        
+        # Running statistics of the correlated columns, fed by generate_chunks
+        self.correlation_stats: Optional[OnlineCovariance] = None
+        
+        # Per-column quantile sketches for quality constraints, fed by generate_chunks
+        self.quantile_sketches: Optional[Dict[str, QuantileSketch]] = None
+        
         # Validate schema
         errors = schema.validate()
         if errors:
             raise ValueError(f"Invalid schema: {errors}")
+        
+        # Compile constraint expressions once per schema
+        self.constraint_manager.compile_constraints(schema.constraints)
     
     def generate(self, n_samples: int, seed: Optional[int] = None) -> pd.DataFrame:
         """
@@ -42,11 +64,113 @@ class DataGenerator:
             seed: Random seed for reproducibility
             
         Returns:
-            DataFrame with synthetic data
+            DataFrame with synthetic data; ``attrs['constraint_report']``
+            holds the per-constraint counters (see ``constraint_report``)
+            and ``attrs['date_formats']`` the formats the schema sets for
+            temporal columns, applied by the exporters
+        """
+        if seed is not None:
+            np.random.seed(seed)
+        
+        self._event_streams = {}
+        self.quantile_sketches = None
+        self.constraint_manager.reset_report()
+        df = self._generate_frame(n_samples)
+        
+        # Also travel with the frame, e.g. when returned by generate_data()
+        df.attrs['constraint_report'] = self.constraint_report
+        df.attrs['date_formats'] = temporal_formats(self.schema, defaults=False)
+        return df
+    
+    @property
+    def constraint_report(self) -> List[Dict[str, Any]]:
+        """
+        Per-constraint counters of the last ``generate`` or ``generate_chunks`` run.
+        
+        Each entry has the constraint name, its type and action, and the
+        number of rows evaluated, violations found, repairs made, rows
+        dropped and the elapsed milliseconds, summed over all chunks.
+        """
+        return self.constraint_manager.get_report()
+    
+    def prepare(self) -> 'DataGenerator':
+        """
+        Precompute per-schema state, such as correlation factors, ahead of
+        the first ``generate`` call.
+        
+        Returns:
+            This generator, for chaining
+        """
+        if self.schema.correlations:
+            numeric = {
+                col.name for col in self.schema.columns
+                if col.data_type in [DataType.INTEGER, DataType.FLOAT]
+            }
+            # Same order as the correlated columns of a generated frame
+            names = []
+            for col1, corr_dict in self.schema.correlations.items():
+                for name in [col1, *corr_dict.keys()]:
+                    if name in numeric and name not in names:
+                        names.append(name)
+            self.correlation_manager.prepare(names, self.schema.correlations, self.correlation_method)
+        return self
+    
+    def generate_chunks(
+        self,
+        chunk_size: int,
+        n_samples: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
         """
+        Generate synthetic data incrementally as a sequence of DataFrames.
+        
+        Event-stream columns (``DATETIME`` with a ``POISSON`` distribution)
+        continue from one chunk to the next, so timestamps stay ordered
+        across the whole run. Column constraints such as uniqueness are
+        enforced per chunk. When the schema has correlations, every chunk
+        is also folded into ``correlation_stats``, which can be passed to
+        ``CorrelationManager.validate_correlations`` once the run is done.
+        Quality constraints judge outliers against quartiles from
+        ``quantile_sketches``, which summarize every chunk generated so far.
+        
+        Args:
+            chunk_size: Number of rows per chunk
+            n_samples: Total number of rows, or None to stream indefinitely
+            seed: Random seed for reproducibility
+            
+        Yields:
+            DataFrames of at most ``chunk_size`` rows, with the schema's
+            temporal formats in ``attrs['date_formats']``
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        
         if seed is not None:
             np.random.seed(seed)
         
+        self._event_streams = {}
+        self.correlation_stats = None
+        self.quantile_sketches = {}
+        self.constraint_manager.reset_report()
+        date_formats = temporal_formats(self.schema, defaults=False)
+        produced = 0
+        while n_samples is None or produced < n_samples:
+            size = chunk_size if n_samples is None else min(chunk_size, n_samples - produced)
+            chunk = self._generate_frame(size)
+            chunk.attrs['date_formats'] = date_formats
+            
+            if self.schema.correlations:
+                if self.correlation_stats is None:
+                    self.correlation_stats = self.correlation_manager.correlation_accumulator(
+                        chunk, self.schema.correlations
+                    )
+                self.correlation_stats.update(chunk)
+            
+            yield chunk
+            produced += size
+    
+    def _generate_frame(self, n_samples: int) -> pd.DataFrame:
+        """Generate one DataFrame of ``n_samples`` rows."""
         # Sort columns by dependencies
         ordered_columns = self._topological_sort()
         
@@ -70,12 +194,19 @@ class DataGenerator:
         # Apply correlations if specified
         if self.schema.correlations:
             df = self.correlation_manager.apply_correlations(
-                df, self.schema.correlations
+                df, self.schema.correlations, self.schema.columns,
+                method=self.correlation_method
+            )
+        
+        # Ordered column pairs hold by construction
+        if self.schema.constraints and 'ordering_constraints' in self.schema.constraints:
+            df = self.constraint_manager.apply_ordering_constraints(
+                df, self.schema.constraints['ordering_constraints']
             )
         
         # Apply global constraints
         df = self.constraint_manager.apply_global_constraints(
-            df, self.schema.constraints
+            df, self.schema.constraints, self.quantile_sketches
         )
         
         return df
@@ -123,12 +254,15 @@ class DataGenerator:
             return self._generate_dependent_data(column, n_samples, existing_data)
         
         # Generate base data based on distribution
-        base_data = self.distribution_generator.generate(
-            column.distribution,
-            column.data_type,
-            column.parameters,
-            n_samples
-        )
+        if column.data_type == DataType.DATETIME and column.distribution == DistributionType.POISSON:
+            base_data = self._event_stream(column).take(n_samples)
+        else:
+            base_data = self.distribution_generator.generate(
+                column.distribution,
+                column.data_type,
+                column.parameters,
+                n_samples
+            )
         
         # Apply data type conversion
         base_data = self._apply_data_type(base_data, column.data_type)
@@ -148,6 +282,12 @@ class DataGenerator:
         
         return pd.Series(base_data, name=column.name)
     
+    def _event_stream(self, column: ColumnSchema) -> EventStream:
+        """Get the event stream of a column, starting it on first use."""
+        if column.name not in self._event_streams:
+            self._event_streams[column.name] = EventStream(column.parameters)
+        return self._event_streams[column.name]
+    
     def _generate_dependent_data(
         self,
         column: ColumnSchema,
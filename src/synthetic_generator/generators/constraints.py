@@ -5,10 +5,15 @@ This module provides functionality to handle constraints
 and validation in synthetic data generation.
 """
 
+import warnings
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
-from ..schemas import ColumnSchema
+from typing import Dict, Any, Optional, List, Tuple
+from ..schemas import ColumnSchema, DataType, DistributionType
+from .distributions import DistributionGenerator
+from .expressions import CompiledExpression
+from ..utils.sketches import QuantileSketch
+from ..utils.timer import PerformanceTimer
 
 
 class ConstraintManager:
@@ -16,7 +21,85 @@ class ConstraintManager:
     
     def __init__(self):
         """Initialize the constraint manager."""
-        pass
+        # Compiled condition expressions keyed by their text
+        self._expressions: Dict[str, CompiledExpression] = {}
+        self.distribution_generator = DistributionGenerator()
+        # Per-constraint counters, accumulated until reset_report()
+        self.report: Dict[str, Dict[str, Any]] = {}
+    
+    def compile_expression(self, expression: str) -> CompiledExpression:
+        """
+        Compile a condition expression, reusing earlier compilations.
+        
+        Args:
+            expression: Boolean expression, e.g. "end_date < start_date or amount > credit_limit"
+            
+        Returns:
+            Compiled expression
+        """
+        if expression not in self._expressions:
+            self._expressions[expression] = CompiledExpression(expression)
+        return self._expressions[expression]
+    
+    def reset_report(self):
+        """Clear the per-constraint counters."""
+        self.report = {}
+    
+    def get_report(self) -> List[Dict[str, Any]]:
+        """
+        Get the per-constraint report.
+        
+        Every entry names a global or ordering constraint and counts, over
+        all frames processed since the last reset, the rows it was
+        evaluated on, the violations it found, the cells or rows it
+        repaired, the rows it dropped and the time it took.
+        
+        Returns:
+            List of report entries, in the order constraints were applied
+        """
+        return [dict(entry) for entry in self.report.values()]
+    
+    def _record(
+        self,
+        name: str,
+        kind: str,
+        action: str,
+        elapsed_ms: float,
+        evaluated: int = 0,
+        violations: int = 0,
+        repairs: int = 0,
+        drops: int = 0
+    ):
+        """Add counts to a constraint's report entry."""
+        entry = self.report.setdefault(name, {
+            'constraint': name, 'type': kind, 'action': action,
+            'evaluated': 0, 'violations': 0, 'repairs': 0, 'drops': 0,
+            'elapsed_ms': 0.0
+        })
+        entry['evaluated'] += int(evaluated)
+        entry['violations'] += int(violations)
+        entry['repairs'] += int(repairs)
+        entry['drops'] += int(drops)
+        entry['elapsed_ms'] += elapsed_ms
+    
+    def compile_constraints(self, constraints: Optional[Dict[str, Any]]):
+        """
+        Compile every expression condition of a schema's global constraints.
+        
+        Called once per schema so that invalid expressions fail early and
+        generation only evaluates already compiled expressions.
+        
+        Args:
+            constraints: Global constraints
+        """
+        if not constraints:
+            return
+        
+        for key in ['row_constraints', 'cross_column_constraints']:
+            for constraint in constraints.get(key, []):
+                condition = constraint.get('condition')
+                if isinstance(condition, str):
+                    self.compile_expression(condition)
     
     def apply_constraints(
         self,
@@ -59,14 +142,24 @@ class ConstraintManager:
     def apply_global_constraints(
         self,
         df: pd.DataFrame,
-        constraints: Optional[Dict[str, Any]]
+        constraints: Optional[Dict[str, Any]],
+        quantile_sketches: Optional[Dict[str, QuantileSketch]] = None
     ) -> pd.DataFrame:
         """
         Apply global constraints to the entire DataFrame.
         
+        Constraints are executed in place: conditions produce boolean masks,
+        modifications write only the affected cells of ``df`` through
+        ``.loc`` (so pandas copy-on-write only copies a column block if it
+        is shared), and rows to drop are accumulated in one mask that is
+        applied once before the quality constraints.
+        
         Args:
-            df: Input DataFrame
+            df: Input DataFrame, modified in place
             constraints: Global constraints
+            quantile_sketches: Per-column quantile sketches for streaming
+                generation; quality constraints then use the quartiles of
+                every chunk seen so far
             
         Returns:
             Constrained DataFrame
@@ -74,24 +167,129 @@ class ConstraintManager:
         if not constraints:
             return df
         
+        keep = np.ones(len(df), dtype=bool)
+        
         # Apply row-level constraints
         if 'row_constraints' in constraints:
-            df = self._apply_row_constraints(df, constraints['row_constraints'])
+            self._apply_row_constraints(df, constraints['row_constraints'], keep)
         
         # Apply cross-column constraints
         if 'cross_column_constraints' in constraints:
-            df = self._apply_cross_column_constraints(
-                df, constraints['cross_column_constraints']
+            self._apply_cross_column_constraints(
+                df, constraints['cross_column_constraints'], keep
             )
         
+        # Drop rejected rows once
+        if not keep.all():
+            df = df[keep]
+        
         # Apply data quality constraints
         if 'quality_constraints' in constraints:
             df = self._apply_quality_constraints(
-                df, constraints['quality_constraints']
+                df, constraints['quality_constraints'], quantile_sketches
+            )
+        
+        return df
+    
+    def apply_ordering_constraints(
+        self,
+        df: pd.DataFrame,
+        orderings: List[Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """
+        Make ordered column pairs hold by construction.
+        
+        Each ordering states ``column1 <operator> column2`` with one of
+        '>', '>=', '<', '<='. With ``method='swap'`` (default) the two values
+        of every violating row are swapped. With ``method='offset'`` the
+        greater column is rebuilt as the lesser one plus an offset drawn
+        from ``offset`` ({'distribution', 'parameters', 'unit'}; the unit
+        applies to dates/datetimes). Strict operators bump remaining ties
+        by the smallest step of the column's type. Rows with a missing
+        value are left untouched. Columns are replaced in place; no rows
+        are rejected or repaired afterwards.
+        
+        Args:
+            df: Input DataFrame
+            orderings: Ordering constraints
+            
+        Returns:
+            The same DataFrame with orderings enforced
+        """
+        for i, ordering in enumerate(orderings):
+            greater, lesser, strict = self._normalize_ordering(ordering)
+            if greater not in df.columns or lesser not in df.columns:
+                continue
+            
+            method = ordering.get('method', 'swap')
+            with PerformanceTimer('ms') as timer:
+                low = df[lesser].to_numpy()
+                high = df[greater].to_numpy()
+                violations = np.count_nonzero(high <= low if strict else high < low)
+                if method == 'swap':
+                    swap = high < low
+                    repairs = np.count_nonzero(swap)
+                    high, low = np.where(swap, low, high), np.where(swap, high, low)
+                elif method == 'offset':
+                    high = low + self._sample_offsets(low, ordering.get('offset', {}))
+                    repairs = len(df)
+                else:
+                    raise ValueError(f"Unsupported ordering method: {method}")
+                
+                if strict:
+                    ties = high == low
+                    if ties.any():
+                        high = high.copy()
+                        high[ties] = self._next_up(high[ties])
+                        if method == 'swap':
+                            repairs += np.count_nonzero(ties)
+                
+                df[greater] = high
+                df[lesser] = low
+            
+            name = ordering.get('name', f'ordering_constraints[{i}]')
+            self._record(
+                name, 'ordering', method, timer(),
+                evaluated=len(df), violations=violations, repairs=repairs
             )
         
         return df
     
+    @staticmethod
+    def _normalize_ordering(ordering: Dict[str, Any]) -> Tuple[str, str, bool]:
+        """Rewrite an ordering as (greater column, lesser column, strict)."""
+        col1, col2 = ordering.get('column1'), ordering.get('column2')
+        operator = ordering.get('operator', '>')
+        if operator in ['>', '>=']:
+            return col1, col2, operator == '>'
+        if operator in ['<', '<=']:
+            return col2, col1, operator == '<'
+        raise ValueError(f"Unsupported ordering operator: {operator}")
+    
+    def _sample_offsets(self, base: np.ndarray, offset: Dict[str, Any]) -> np.ndarray:
+        """Draw non-negative offsets matching the type of ``base``."""
+        distribution = DistributionType(offset.get('distribution', 'exponential'))
+        values = self.distribution_generator.generate(
+            distribution, DataType.FLOAT, offset.get('parameters', {}), len(base)
+        )
+        values = np.maximum(values, 0)
+        
+        if base.dtype.kind == 'M':
+            unit = offset.get('unit', np.datetime_data(base.dtype)[0])
+            return np.round(values).astype(np.int64).astype(f'timedelta64[{unit}]')
+        if base.dtype.kind in 'iu':
+            return np.round(values).astype(np.int64)
+        return values
+    
+    @staticmethod
+    def _next_up(values: np.ndarray) -> np.ndarray:
+        """Smallest representable step above each value."""
+        if values.dtype.kind == 'M':
+            return values + np.timedelta64(1, np.datetime_data(values.dtype)[0])
+        if values.dtype.kind in 'iu':
+            return values + 1
+        return np.nextafter(values, np.inf)
+    
     def _ensure_uniqueness(self, data: pd.Series) -> pd.Series:
         """Ensure unique values in the data."""
         unique_values = data.unique()
@@ -153,94 +351,270 @@ class ConstraintManager:
             
             # Apply value set constraints
             if 'allowed_values' in col_constraints:
-                allowed_values = col_constraints['allowed_values']
-                data = data.apply(lambda x: x if x in allowed_values else np.random.choice(allowed_values))
+                data = self._apply_allowed_values(data, col_constraints['allowed_values'])
         
         return data
     
+    def _apply_allowed_values(self, data: pd.Series, allowed_values: List[Any]) -> pd.Series:
+        """Replace values outside ``allowed_values`` with random allowed ones."""
+        allowed = pd.Index(allowed_values)
+        if len(allowed) == 0:
+            raise ValueError(f"Column {data.name}: 'allowed_values' must not be empty")
+        
+        # Hash-based membership test, then one bulk draw for every violation
+        violations = ~data.isin(allowed).to_numpy()
+        n_violations = int(violations.sum())
+        if n_violations == 0:
+            return data
+        
+        replacements = allowed.take(np.random.randint(0, len(allowed), n_violations))
+        data = data.copy()
+        data[violations] = replacements.to_numpy()
+        return data
+    
     def _apply_row_constraints(
         self,
         df: pd.DataFrame,
-        row_constraints: Dict[str, Any]
-    ) -> pd.DataFrame:
-        """Apply row-level constraints."""
+        row_constraints: List[Dict[str, Any]],
+        keep: np.ndarray
+    ):
+        """Apply row-level constraints, marking dropped rows in ``keep``."""
         
-        for constraint in row_constraints:
+        for i, constraint in enumerate(row_constraints):
             condition = constraint.get('condition', {})
             action = constraint.get('action', 'drop')
             
-            # Apply condition
-            mask = self._evaluate_row_condition(df, condition)
+            with PerformanceTimer('ms') as timer:
+                evaluated = np.count_nonzero(keep)
+                
+                # Apply condition to the rows still kept
+                mask = self._evaluate_row_condition(df, condition).to_numpy(dtype=bool) & keep
+                violations = np.count_nonzero(mask)
+                
+                if action == 'drop':
+                    keep &= ~mask
+                elif action == 'modify':
+                    modification = constraint.get('modification', {})
+                    self._apply_row_modification(df, mask, modification)
             
-            if action == 'drop':
-                df = df[~mask]
-            elif action == 'modify':
-                modification = constraint.get('modification', {})
-                df = self._apply_row_modification(df, mask, modification)
-        
-        return df
+            name = constraint.get('name', f'row_constraints[{i}]')
+            self._record(
+                name, 'row', action, timer(), evaluated=evaluated, violations=violations,
+                repairs=violations if action == 'modify' else 0,
+                drops=violations if action == 'drop' else 0
+            )
     
     def _apply_cross_column_constraints(
         self,
         df: pd.DataFrame,
-        cross_constraints: Dict[str, Any]
-    ) -> pd.DataFrame:
-        """Apply cross-column constraints."""
+        cross_constraints: List[Dict[str, Any]],
+        keep: np.ndarray
+    ):
+        """Apply cross-column constraints to the rows still kept."""
         
-        for constraint in cross_constraints:
+        for i, constraint in enumerate(cross_constraints):
             condition = constraint.get('condition', {})
             action = constraint.get('action', 'modify')
             
-            # Apply condition
-            mask = self._evaluate_cross_column_condition(df, condition)
+            with PerformanceTimer('ms') as timer:
+                evaluated = np.count_nonzero(keep)
+                
+                # Apply condition
+                mask = self._evaluate_cross_column_condition(df, condition).to_numpy(dtype=bool) & keep
+                violations = np.count_nonzero(mask)
+                
+                if action == 'modify':
+                    modification = constraint.get('modification', {})
+                    self._apply_cross_column_modification(df, mask, modification, keep)
             
-            if action == 'modify':
-                modification = constraint.get('modification', {})
-                df = self._apply_cross_column_modification(df, mask, modification)
-        
-        return df
+            name = constraint.get('name', f'cross_column_constraints[{i}]')
+            self._record(
+                name, 'cross_column', action, timer(), evaluated=evaluated, violations=violations,
+                repairs=violations if action == 'modify' else 0
+            )
     
     def _apply_quality_constraints(
         self,
         df: pd.DataFrame,
-        quality_constraints: Dict[str, Any]
+        quality_constraints: Dict[str, Any],
+        quantile_sketches: Optional[Dict[str, QuantileSketch]] = None
     ) -> pd.DataFrame:
-        """Apply data quality constraints."""
+        """
+        Apply data quality constraints.
+        
+        Quartiles and medians of all numeric columns are computed together in
+        one partition-based pass. With ``quantile_sketches`` (streaming mode),
+        each chunk is folded into a per-column sketch first and the quartiles
+        come from the sketch, so every chunk is judged against the
+        distribution of the whole stream so far.
+        """
+        with PerformanceTimer('ms') as stats_timer:
+            numeric = list(df.select_dtypes(include=[np.number]).columns)
+            q1, median, q3 = self.column_quartiles(df, numeric, quantile_sketches)
+        # The shared statistics are charged to the first quality rule
+        stats_ms = stats_timer()
         
         # Apply missing value constraints
         if 'max_missing_ratio' in quality_constraints:
             max_ratio = quality_constraints['max_missing_ratio']
-            for col in df.columns:
-                missing_ratio = df[col].isnull().mean()
-                if missing_ratio > max_ratio:
-                    # Reduce missing values
-                    n_missing = int(len(df) * max_ratio)
-                    missing_indices = df[col].isnull().nlargest(n_missing).index
-                    df.loc[missing_indices, col] = df[col].median()  # Fill with median
+            violations = repairs = 0
+            with PerformanceTimer('ms') as timer:
+                for col in df.columns:
+                    missing = df[col].isnull().to_numpy()
+                    n_missing = np.count_nonzero(missing)
+                    violations += n_missing
+                    excess = n_missing - int(len(df) * max_ratio)
+                    if excess > 0:
+                        # Fill just enough missing values to meet the ratio
+                        if col in median:
+                            fill = median[col]
+                        else:
+                            mode = df[col].mode()
+                            if mode.empty:
+                                continue
+                            fill = mode.iloc[0]
+                        rows = np.flatnonzero(missing)[:excess]
+                        df.iloc[rows, df.columns.get_loc(col)] = fill
+                        repairs += excess
+            
+            self._record(
+                'quality_constraints.max_missing_ratio', 'quality', 'fill', timer() + stats_ms,
+                evaluated=len(df), violations=violations, repairs=repairs
+            )
+            stats_ms = 0.0
         
         # Apply outlier constraints
         if 'max_outlier_ratio' in quality_constraints:
             max_ratio = quality_constraints['max_outlier_ratio']
-            for col in df.select_dtypes(include=[np.number]).columns:
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = (df[col] < lower_bound) | (df[col] > upper_bound)
-                outlier_ratio = outliers.mean()
-                
-                if outlier_ratio > max_ratio:
-                    # Reduce outliers
-                    n_outliers = int(len(df) * max_ratio)
-                    outlier_indices = outliers.nlargest(n_outliers).index
-                    df.loc[outlier_indices, col] = df[col].median()
+            violations = repairs = 0
+            with PerformanceTimer('ms') as timer:
+                for col in numeric:
+                    IQR = q3[col] - q1[col]
+                    lower_bound = q1[col] - 1.5 * IQR
+                    upper_bound = q3[col] + 1.5 * IQR
+                    
+                    values = df[col].to_numpy(dtype=float, na_value=np.nan)
+                    outliers = (values < lower_bound) | (values > upper_bound)
+                    n_outliers = np.count_nonzero(outliers)
+                    violations += n_outliers
+                    excess = n_outliers - int(len(df) * max_ratio)
+                    
+                    if excess > 0:
+                        # Replace just enough outliers to meet the ratio
+                        rows = np.flatnonzero(outliers)[:excess]
+                        df.iloc[rows, df.columns.get_loc(col)] = self._cast_like(median[col], df[col])
+                        repairs += excess
+            
+            self._record(
+                'quality_constraints.max_outlier_ratio', 'quality', 'replace', timer() + stats_ms,
+                evaluated=len(df), violations=violations, repairs=repairs
+            )
         
         return df
     
-    def _evaluate_row_condition(self, df: pd.DataFrame, condition: Dict[str, Any]) -> pd.Series:
-        """Evaluate a row-level condition."""
+    @staticmethod
+    def column_quartiles(
+        df: pd.DataFrame,
+        columns: List[str],
+        quantile_sketches: Optional[Dict[str, QuantileSketch]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]:
+        """
+        Compute the first quartile, median and third quartile of columns.
+        
+        Args:
+            df: Input DataFrame
+            columns: Numeric columns
+            quantile_sketches: Optional per-column sketches, updated with
+                ``df`` and used instead of the exact quartiles
+            
+        Returns:
+            Tuple of (Q1, median, Q3) dictionaries keyed by column
+        """
+        probabilities = [0.25, 0.5, 0.75]
+        if not columns:
+            return {}, {}, {}
+        
+        if quantile_sketches is not None:
+            rows = []
+            for col in columns:
+                # Fixed seed keeps seeded streaming runs reproducible
+                sketch = quantile_sketches.setdefault(col, QuantileSketch(seed=0))
+                rows.append(sketch.update(df[col]).quantile(probabilities))
+            quartiles = np.array(rows).T
+        else:
+            block = df[columns].to_numpy(dtype=float, na_value=np.nan)
+            with warnings.catch_warnings():
+                # All-missing columns yield NaN quartiles
+                warnings.simplefilter('ignore', RuntimeWarning)
+                if np.isnan(block).any():
+                    quartiles = np.nanquantile(block, probabilities, axis=0)
+                else:
+                    quartiles = np.quantile(block, probabilities, axis=0)
+        
+        return tuple(dict(zip(columns, row)) for row in quartiles)
+    
+    @staticmethod
+    def _cast_like(value: float, column: pd.Series) -> Any:
+        """Round a statistic for integer columns so the dtype is kept."""
+        if column.dtype.kind in 'iu':
+            return int(np.round(value))
+        return value
+    
+    def _evaluate_expression(self, df: pd.DataFrame, expression: str) -> pd.Series:
+        """Evaluate a condition expression as a row mask."""
+        return pd.Series(self.compile_expression(expression).evaluate(df), index=df.index)
+    
+    def _condition_to_expression(self, df: pd.DataFrame, condition: Dict[str, Any]) -> Optional[str]:
+        """
+        Translate a dict condition into an expression, so all of its clauses
+        are evaluated in one pass. Returns None, leaving the condition to
+        pandas, if a value is not a plain literal, a list mixes types, a
+        column is not numeric, boolean or temporal (text columns may hold
+        nulls), or a string is compared to a temporal column (which pandas
+        parses as a timestamp, but an expression would compare as text).
+        """
+        clauses = []
+        for col, cond in condition.items():
+            if col not in df.columns or '`' in col:
+                continue
+            
+            operator = cond.get('operator', '==')
+            value = cond.get('value')
+            
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            kind = df[col].dtype.kind
+            if kind not in 'biufM' or len({type(v) for v in values}) > 1:
+                return None
+            if kind == 'M' and any(isinstance(v, str) for v in values):
+                return None
+            
+            if operator in ['in', 'not_in']:
+                if not isinstance(value, (list, tuple, set)) or \
+                        not all(self._is_literal(v) for v in value):
+                    return None
+                keyword = 'in' if operator == 'in' else 'not in'
+                clauses.append(f"`{col}` {keyword} {list(value)!r}")
+            elif operator in ['==', '!=', '>', '<', '>=', '<=']:
+                if not self._is_literal(value):
+                    return None
+                clauses.append(f"`{col}` {operator} {value!r}")
+        
+        return ' and '.join(clauses) if clauses else None
+    
+    @staticmethod
+    def _is_literal(value: Any) -> bool:
+        """Whether a value round-trips through its repr as an expression literal."""
+        return type(value) in (int, float, str, bool)
+    
+    def _evaluate_row_condition(self, df: pd.DataFrame, condition: Any) -> pd.Series:
+        """Evaluate a row-level condition (an expression string or a dict)."""
+        if isinstance(condition, str):
+            return self._evaluate_expression(df, condition)
+        
+        expression = self._condition_to_expression(df, condition)
+        if expression is not None:
+            return self._evaluate_expression(df, expression)
+        
         mask = pd.Series(True, index=df.index)
         
         for col, cond in condition.items():
@@ -267,14 +641,18 @@ class ConstraintManager:
             elif operator == 'not_in':
                 mask &= ~df[col].isin(value)
         
-        return mask
+        # Comparisons on nullable columns give <NA> for missing values
+        return mask.fillna(False).astype(bool)
     
     def _evaluate_cross_column_condition(
         self,
         df: pd.DataFrame,
-        condition: Dict[str, Any]
+        condition: Any
     ) -> pd.Series:
-        """Evaluate a cross-column condition."""
+        """Evaluate a cross-column condition (an expression string or a dict)."""
+        if isinstance(condition, str):
+            return self._evaluate_expression(df, condition)
+        
         mask = pd.Series(True, index=df.index)
         
         # Example: col1 > col2
@@ -303,37 +681,40 @@ class ConstraintManager:
     def _apply_row_modification(
         self,
         df: pd.DataFrame,
-        mask: pd.Series,
+        mask: np.ndarray,
         modification: Dict[str, Any]
-    ) -> pd.DataFrame:
-        """Apply row modification."""
-        df_copy = df.copy()
+    ):
+        """Apply row modification to the masked cells, in place."""
+        if not mask.any():
+            return
         
         for col, value in modification.items():
             if col in df.columns:
-                df_copy.loc[mask, col] = value
-        
-        return df_copy
+                df.loc[mask, col] = value
     
     def _apply_cross_column_modification(
         self,
         df: pd.DataFrame,
-        mask: pd.Series,
-        modification: Dict[str, Any]
-    ) -> pd.DataFrame:
-        """Apply cross-column modification."""
-        df_copy = df.copy()
+        mask: np.ndarray,
+        modification: Dict[str, Any],
+        keep: np.ndarray
+    ):
+        """Apply cross-column modification to the masked cells, in place."""
+        if not mask.any():
+            return
         
         for col, rule in modification.items():
             if col in df.columns:
                 if rule.get('type') == 'function':
+                    # Statistics describe the rows that are kept
+                    column = df[col] if keep.all() else df[col][keep]
+                    
                     # Apply a function to the column
                     func_name = rule.get('function')
                     if func_name == 'mean':
-                        df_copy.loc[mask, col] = df[col].mean()
+                        df.loc[mask, col] = column.mean()
                     elif func_name == 'median':
-                        df_copy.loc[mask, col] = df[col].median()
+                        df.loc[mask, col] = column.median()
                     elif func_name == 'mode':
-                        df_copy.loc[mask, col] = df[col].mode().iloc[0] if not df[col].mode().empty else df[col].median()
-        
-        return df_copy 
\ No newline at end of file
+                        mode = column.mode()
+                        df.loc[mask, col] = mode.iloc[0] if not mode.empty else column.median()
@@ -7,7 +7,11 @@ between variables in synthetic data generation.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from scipy import linalg, stats
+from typing import Dict, Any, List, Optional, Tuple, Union
+from ..schemas import ColumnSchema
+from ..utils.sketches import OnlineCovariance
+from .distributions import DistributionGenerator
 
 
 class CorrelationManager:
@@ -15,116 +19,363 @@ class CorrelationManager:
     
     def __init__(self):
         """Initialize the correlation manager."""
-        pass
+        self.distribution_generator = DistributionGenerator()
+        
+        # Cholesky factors keyed by (column names, correlation spec)
+        self._factors: Dict[Tuple, np.ndarray] = {}
     
     def apply_correlations(
         self, 
         df: pd.DataFrame, 
-        correlations: Dict[str, Dict[str, float]]
+        correlations: Dict[str, Dict[str, float]],
+        columns: Optional[List[ColumnSchema]] = None,
+        method: str = 'copula'
     ) -> pd.DataFrame:
         """
         Apply correlations to the DataFrame.
         
+        Only the correlated numeric columns are touched: they are written
+        back into ``df`` in place, so memory and time scale with those
+        columns rather than with the width of the frame.
+        
+        The default ``'copula'`` method builds the full target matrix over
+        all correlated numeric columns, draws correlated normals with its
+        Cholesky factor and maps them through each column's marginal
+        inverse CDF (Gaussian copula). The factor is cached, so applying
+        the same correlations chunk by chunk reuses it.
+        ``'iman_conover'`` treats the targets as rank correlations and only
+        reorders each column's sampled values, so marginals are preserved
+        exactly. ``'pairwise'`` is the legacy per-pair rescaling.
+        
         Args:
             df: Input DataFrame
             correlations: Dictionary of correlation specifications
+            columns: Column schemas, used to look up parametric marginals
+            method: 'copula', 'iman_conover' or 'pairwise'
             
         Returns:
-            DataFrame with applied correlations
+            The same DataFrame with applied correlations
         """
         if not correlations:
             return df
         
-        # Get numeric columns only
-        numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        if method == 'copula':
+            return self._apply_copula(df, correlations, columns or [])
+        if method == 'iman_conover':
+            return self._apply_iman_conover(df, correlations)
+        if method != 'pairwise':
+            raise ValueError(f"Unsupported correlation method: {method}")
         
-        # Convert DataFrame to numpy array for easier manipulation
-        data = df.values
-        columns = df.columns.tolist()
+        # Work on a float block holding only the correlated numeric columns
+        names = self._correlated_columns(df, correlations)
+        if len(names) < 2:
+            return df
+        
+        index = {name: i for i, name in enumerate(names)}
+        block = np.asfortranarray(df[names].to_numpy(dtype=float, na_value=np.nan))
+        adjusted = set()
         
-        # Apply correlations only for numeric columns
         for col1, corr_dict in correlations.items():
-            if col1 not in columns or col1 not in numeric_columns:
+            if col1 not in index:
                 continue
-                
-            col1_idx = columns.index(col1)
             
             for col2, target_corr in corr_dict.items():
-                if col2 not in columns or col2 not in numeric_columns or col1 == col2:
+                if col2 not in index or col1 == col2:
                     continue
-                    
-                col2_idx = columns.index(col2)
                 
                 # Apply correlation
-                data = self._apply_correlation(
-                    data, col1_idx, col2_idx, target_corr
-                )
+                if self._apply_correlation(block, index[col1], index[col2], target_corr):
+                    adjusted.add(col2)
+        
+        # Write back only the adjusted columns, keeping their dtypes
+        for name in adjusted:
+            df[name] = self._restore_dtype(block[:, index[name]], df[name].dtype)
+        
+        return df
+    
+    def _apply_copula(
+        self,
+        df: pd.DataFrame,
+        correlations: Dict[str, Dict[str, float]],
+        columns: List[ColumnSchema]
+    ) -> pd.DataFrame:
+        """Apply correlations with a Gaussian copula over all correlated columns."""
+        names = self._correlated_columns(df, correlations)
+        if len(names) < 2:
+            return df
+        
+        factor = self._cholesky_factor(names, correlations)
+        
+        # One matrix multiply for all correlated normals, then to uniforms
+        normals = np.random.standard_normal((len(df), len(names))) @ factor.T
+        uniforms = np.clip(stats.norm.cdf(normals), 1e-12, 1 - 1e-12)
+        
+        schemas = {col.name: col for col in columns}
+        for j, name in enumerate(names):
+            df[name] = self._map_marginal(
+                df[name].to_numpy(), schemas.get(name), normals[:, j], uniforms[:, j]
+            )
+        
+        return df
+    
+    def _apply_iman_conover(
+        self,
+        df: pd.DataFrame,
+        correlations: Dict[str, Dict[str, float]]
+    ) -> pd.DataFrame:
+        """
+        Apply rank correlations by reordering sampled values (Iman-Conover).
+        
+        Van der Waerden scores are randomly permuted per column, their sample
+        correlation is whitened away and the target factor applied, so the
+        scores carry the target correlation exactly. Each column is then
+        rearranged to follow the ranks of its scores. Only argsorts are
+        involved, so the cost is O(n log n) per column; missing values sort
+        last and keep their count.
+        """
+        names = self._correlated_columns(df, correlations)
+        n_rows = len(df)
+        if len(names) < 2 or n_rows < len(names) + 1:
+            return df
+        
+        block = df[names].to_numpy(dtype=float, na_value=np.nan)
+        target_factor = self._cholesky_factor(names, correlations, rank=True)
+        scores = self._iman_conover_scores(n_rows, target_factor)
+        
+        # Rearrange each column's sorted values to follow the score ranks
+        ranked = np.empty_like(block)
+        np.put_along_axis(ranked, np.argsort(scores, axis=0), np.sort(block, axis=0), axis=0)
         
-        # Convert back to DataFrame
-        return pd.DataFrame(data, columns=columns)
+        for j, name in enumerate(names):
+            df[name] = self._restore_dtype(ranked[:, j], df[name].dtype)
+        
+        return df
+    
+    @staticmethod
+    def _iman_conover_scores(n_rows: int, target_factor: np.ndarray) -> np.ndarray:
+        """
+        Draw normal scores whose sample correlation is exactly the target.
+        
+        Van der Waerden scores are permuted independently per column; with
+        ``S = L_s L_s^T`` their sample correlation and ``T = L_t L_t^T`` the
+        target, multiplying by ``L_s^-T L_t^T`` turns ``S`` into ``T``.
+        """
+        scores = stats.norm.ppf(np.arange(1, n_rows + 1) / (n_rows + 1))
+        permutations = np.argsort(np.random.random((n_rows, len(target_factor))), axis=0)
+        scores = scores[permutations]
+        
+        sample_factor = np.linalg.cholesky(np.corrcoef(scores, rowvar=False))
+        transform = linalg.solve_triangular(sample_factor, target_factor.T, lower=True, trans='T')
+        return scores @ transform
+    
+    def _map_marginal(
+        self,
+        values: np.ndarray,
+        column: Optional[ColumnSchema],
+        normals: np.ndarray,
+        uniforms: np.ndarray
+    ) -> np.ndarray:
+        """
+        Map copula draws to a column's marginal.
+        
+        Columns with a parametric distribution use its inverse CDF, clipped
+        to the range already sampled (which honours min/max constraints)
+        and cast back to the column's dtype. Other columns, and unique
+        columns, use the empirical inverse CDF: their sampled values are
+        reordered to follow the ranks of the normals. Nulls stay in place.
+        """
+        present = ~pd.isna(values)
+        result = values.copy()
+        if present.sum() < 2:
+            return result
+        
+        observed = values[present]
+        quantiles = None
+        if column is not None and not column.unique:
+            quantiles = self.distribution_generator.inverse_cdf(
+                column.distribution, column.parameters, uniforms[present]
+            )
+        
+        if quantiles is None:
+            # Empirical inverse CDF: the k-th smallest normal gets the k-th smallest value
+            ranked = np.empty_like(observed)
+            ranked[np.argsort(normals[present], kind='stable')] = np.sort(observed)
+            result[present] = ranked
+            return result
+        
+        quantiles = np.clip(quantiles, observed.min(), observed.max())
+        if np.issubdtype(values.dtype, np.integer):
+            quantiles = np.round(quantiles)
+        result[present] = quantiles.astype(values.dtype)
+        return result
+    
+    def _correlated_columns(
+        self,
+        df: pd.DataFrame,
+        correlations: Dict[str, Dict[str, float]]
+    ) -> List[str]:
+        """Numeric (non-boolean) columns referenced by the correlation spec, in order."""
+        names = []
+        for col1, corr_dict in correlations.items():
+            for name in [col1, *corr_dict.keys()]:
+                if name in names or name not in df.columns:
+                    continue
+                dtype = df[name].dtype
+                if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                    names.append(name)
+        return names
+    
+    def _cholesky_factor(
+        self,
+        names: List[str],
+        correlations: Dict[str, Dict[str, float]],
+        rank: bool = False
+    ) -> np.ndarray:
+        """
+        Get the (cached) Cholesky factor of the repaired target matrix.
+        
+        With ``rank=True`` the targets are Spearman correlations and are
+        converted to the equivalent normal-score correlations
+        ``2 sin(pi * rho / 6)`` first.
+        """
+        key = (
+            rank,
+            tuple(names),
+            tuple(sorted(
+                (col1, col2, float(value))
+                for col1, corr_dict in correlations.items()
+                for col2, value in corr_dict.items()
+            ))
+        )
+        if key not in self._factors:
+            target = self.build_correlation_matrix(names, correlations)
+            if rank:
+                target = 2 * np.sin(np.pi * target / 6)
+            self._factors[key] = np.linalg.cholesky(self.nearest_psd(target))
+        return self._factors[key]
+    
+    def prepare(
+        self,
+        names: List[str],
+        correlations: Dict[str, Dict[str, float]],
+        method: str = 'copula'
+    ) -> None:
+        """
+        Compute the Cholesky factor a correlation method will need ahead of time.
+        
+        Args:
+            names: Correlated numeric columns, in the order used when applying
+            correlations: Dictionary of correlation specifications
+            method: 'copula', 'iman_conover' or 'pairwise' (which needs none)
+        """
+        if method in ['copula', 'iman_conover'] and len(names) >= 2:
+            self._cholesky_factor(names, correlations, rank=method == 'iman_conover')
+    
+    def get_factors(self) -> List[Tuple[Tuple, np.ndarray]]:
+        """Cached Cholesky factors with their cache keys, e.g. to persist them."""
+        return list(self._factors.items())
+    
+    def set_factors(self, factors: List[Tuple[Tuple, np.ndarray]]) -> None:
+        """Restore Cholesky factors returned by ``get_factors``."""
+        self._factors.update(factors)
+    
+    @staticmethod
+    def build_correlation_matrix(
+        names: List[str],
+        correlations: Dict[str, Dict[str, float]]
+    ) -> np.ndarray:
+        """
+        Build the full symmetric target matrix from a correlation spec.
+        
+        Unspecified pairs are uncorrelated; pairs naming columns outside
+        ``names`` are ignored.
+        """
+        index = {name: i for i, name in enumerate(names)}
+        matrix = np.eye(len(names))
+        for col1, corr_dict in correlations.items():
+            for col2, value in corr_dict.items():
+                if col1 in index and col2 in index and col1 != col2:
+                    i, j = index[col1], index[col2]
+                    matrix[i, j] = matrix[j, i] = value
+        return matrix
+    
+    @staticmethod
+    def nearest_psd(matrix: np.ndarray, min_eigenvalue: float = 1e-6) -> np.ndarray:
+        """
+        Repair a correlation matrix that is not positive definite.
+        
+        Negative eigenvalues are clipped and the result is rescaled back
+        to a unit diagonal.
+        """
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        if eigenvalues.min() >= min_eigenvalue:
+            return matrix
+        
+        repaired = (eigenvectors * np.maximum(eigenvalues, min_eigenvalue)) @ eigenvectors.T
+        scale = 1.0 / np.sqrt(np.diag(repaired))
+        repaired = repaired * np.outer(scale, scale)
+        np.fill_diagonal(repaired, 1.0)
+        return repaired
     
     def _apply_correlation(
         self, 
-        data: np.ndarray, 
+        block: np.ndarray, 
         col1_idx: int, 
         col2_idx: int, 
         target_corr: float
-    ) -> np.ndarray:
+    ) -> bool:
         """
-        Apply correlation between two columns.
+        Apply correlation between two columns of a float block, in place.
         
         Args:
-            data: Data array
+            block: Float array of the correlated columns
             col1_idx: Index of first column
             col2_idx: Index of second column
             target_corr: Target correlation coefficient
             
         Returns:
-            Modified data array
+            Whether the second column was modified
         """
-        # Check if both columns are numeric
-        col1_data = data[:, col1_idx]
-        col2_data = data[:, col2_idx]
+        col1_data = block[:, col1_idx]
+        col2_data = block[:, col2_idx]
         
-        # Convert to numeric if possible, skip if not
-        try:
-            col1_numeric = pd.to_numeric(col1_data, errors='coerce')
-            col2_numeric = pd.to_numeric(col2_data, errors='coerce')
-            
-            # Check if we have enough numeric data
-            if pd.isna(col1_numeric).sum() > len(col1_numeric) * 0.5 or pd.isna(col2_numeric).sum() > len(col2_numeric) * 0.5:
-                return data  # Skip correlation if too much non-numeric data
-                
-            # Get current correlation
-            current_corr = np.corrcoef(col1_numeric, col2_numeric)[0, 1]
-            
-            if np.isnan(current_corr):
-                return data
-            
-            # Calculate adjustment factor
-            if abs(current_corr) < 1e-6:
-                # No current correlation, create one
-                adjustment = target_corr
-            else:
-                # Adjust existing correlation
-                adjustment = target_corr / current_corr
-            
-            # Apply adjustment to second column
-            mean_col2 = np.mean(col2_numeric)
-            adjusted_col2 = mean_col2 + adjustment * (col2_numeric - mean_col2)
-            
-            # Update the data array
-            data[:, col2_idx] = adjusted_col2
-            
-        except (ValueError, TypeError):
-            # If conversion fails, skip correlation
-            pass
+        # Skip if too much missing data
+        valid = ~(np.isnan(col1_data) | np.isnan(col2_data))
+        if valid.sum() < max(2, len(valid) * 0.5):
+            return False
+        
+        # Get current correlation
+        current_corr = np.corrcoef(col1_data[valid], col2_data[valid])[0, 1]
+        
+        if np.isnan(current_corr):
+            return False
         
-        return data
+        # Calculate adjustment factor
+        if abs(current_corr) < 1e-6:
+            # No current correlation, create one
+            adjustment = target_corr
+        else:
+            # Adjust existing correlation
+            adjustment = target_corr / current_corr
+        
+        # Apply adjustment to second column (a view into the block)
+        mean_col2 = np.nanmean(col2_data)
+        col2_data -= mean_col2
+        col2_data *= adjustment
+        col2_data += mean_col2
+        
+        return True
+    
+    @staticmethod
+    def _restore_dtype(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """Cast float results back to an integer column dtype when possible."""
+        if np.issubdtype(dtype, np.integer) and not np.isnan(values).any():
+            return np.round(values).astype(dtype)
+        return values
     
     def calculate_correlations(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Calculate correlation matrix for the DataFrame.
+        Calculate correlation matrix for the numeric columns of the DataFrame.
         
         Args:
             df: Input DataFrame
@@ -132,19 +383,47 @@ class CorrelationManager:
         Returns:
             Correlation matrix
         """
-        return df.corr()
+        return df.corr(numeric_only=True)
+    
+    def correlation_accumulator(
+        self,
+        df: pd.DataFrame,
+        target_correlations: Dict[str, Dict[str, float]]
+    ) -> OnlineCovariance:
+        """
+        Create an empty accumulator for the columns of a correlation spec.
+        
+        Feed it every chunk with ``update`` (or ``merge`` accumulators from
+        parallel workers) and pass it to :meth:`validate_correlations`.
+        
+        Args:
+            df: A DataFrame (or chunk) with the output columns and dtypes
+            target_correlations: Target correlation specifications
+            
+        Returns:
+            Accumulator over the numeric columns referenced by the spec
+        """
+        return OnlineCovariance(self._correlated_columns(df, target_correlations))
     
     def validate_correlations(
         self, 
-        df: pd.DataFrame, 
-        target_correlations: Dict[str, Dict[str, float]]
+        data: Union[pd.DataFrame, OnlineCovariance], 
+        target_correlations: Dict[str, Dict[str, float]],
+        tolerance: float = 0.1
     ) -> Dict[str, Any]:
         """
         Validate that target correlations are achieved.
         
+        Only the requested pairs are evaluated. ``data`` can be a DataFrame
+        or an accumulator that was fed during streaming or parallel
+        generation, in which case no pass over the data is needed. An
+        accumulator only tracks numeric columns, so columns it lacks are
+        skipped as non-numeric, as in a DataFrame.
+        
         Args:
-            df: Generated DataFrame
+            data: Generated DataFrame, or an accumulator of its statistics
             target_correlations: Target correlation specifications
+            tolerance: Largest acceptable absolute difference
             
         Returns:
             Validation results
@@ -156,25 +435,38 @@ class CorrelationManager:
             'correlations': {}
         }
         
-        actual_corr_matrix = self.calculate_correlations(df)
+        if isinstance(data, pd.DataFrame):
+            accumulator = self.correlation_accumulator(data, target_correlations).update(data)
+            available = set(data.columns)
+        else:
+            accumulator = data
+            available = None  # unknown: missing columns count as non-numeric
+        
+        tracked = set(accumulator.columns)
+        actual_corr_matrix = accumulator.correlation()
         
         for col1, corr_dict in target_correlations.items():
-            if col1 not in df.columns:
+            if available is not None and col1 not in available:
                 results['errors'].append(f"Column {col1} not found in data")
                 results['valid'] = False
                 continue
             
             for col2, target_corr in corr_dict.items():
-                if col2 not in df.columns:
+                if available is not None and col2 not in available:
                     results['errors'].append(f"Column {col2} not found in data")
                     results['valid'] = False
                     continue
                 
-                actual_corr = actual_corr_matrix.loc[col1, col2]
+                if col1 not in tracked or col2 not in tracked:
+                    results['warnings'].append(
+                        f"Correlation between {col1} and {col2} skipped: non-numeric column"
+                    )
+                    continue
+                
+                actual_corr = float(actual_corr_matrix.loc[col1, col2])
                 
                 # Check if correlation is within acceptable range
-                tolerance = 0.1  # 10% tolerance
-                if abs(actual_corr - target_corr) > tolerance:
+                if not abs(actual_corr - target_corr) <= tolerance:
                     results['warnings'].append(
                         f"Correlation between {col1} and {col2}: "
                         f"target={target_corr:.3f}, actual={actual_corr:.3f}"
@@ -186,4 +478,4 @@ class CorrelationManager:
                     'difference': abs(actual_corr - target_corr)
                 }
         
-        return results 
\ No newline at end of file
+        return results
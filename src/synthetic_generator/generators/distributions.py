@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional
 from ..schemas import DataType, DistributionType
+from ..schemas.fitting import frozen_distribution
 from .text_generators import TextGenerator
 from .temporal_generators import TemporalGenerator
 
@@ -40,7 +41,21 @@ class DistributionGenerator:
         Returns:
             Array of generated values
         """
-        
+
+        # Uniform dates/datetimes are sampled as typed datetime64 arrays
+        if distribution == DistributionType.UNIFORM and data_type in [DataType.DATE, DataType.DATETIME]:
+            return self.generate_temporal(data_type, parameters, n_samples)
+
+        # Uniform text values are drawn by the type's text generator
+        if distribution == DistributionType.UNIFORM and data_type in [
+            DataType.STRING, DataType.EMAIL, DataType.PHONE, DataType.ADDRESS, DataType.NAME
+        ]:
+            return self.generate_text(data_type, parameters, n_samples)
+
+        # Poisson datetimes are event arrival times rather than counts
+        if distribution == DistributionType.POISSON and data_type == DataType.DATETIME:
+            return self.temporal_generator.generate_events(parameters, n_samples)
+
         if distribution == DistributionType.NORMAL:
             return self._generate_normal(parameters, n_samples)
         elif distribution == DistributionType.UNIFORM:
@@ -63,6 +78,8 @@ class DistributionGenerator:
             return self._generate_categorical(parameters, n_samples)
         elif distribution == DistributionType.CONSTANT:
             return self._generate_constant(parameters, n_samples)
+        elif distribution == DistributionType.EMPIRICAL:
+            return self._generate_empirical(parameters, n_samples)
         else:
             raise ValueError(f"Unsupported distribution: {distribution}")
     
@@ -143,6 +160,44 @@ class DistributionGenerator:
         value = parameters.get('value', 0)
         return np.full(n_samples, value)
     
+    def _generate_empirical(self, parameters: Dict[str, Any], n_samples: int) -> np.ndarray:
+        """Generate from a quantile table by inverse-CDF interpolation."""
+        return self._interpolate_quantiles(parameters, np.random.random(n_samples))
+    
+    @staticmethod
+    def _interpolate_quantiles(parameters: Dict[str, Any], u: np.ndarray) -> np.ndarray:
+        """Map probabilities through a table of evenly spaced quantiles."""
+        quantiles = np.asarray(parameters['quantiles'], dtype=float)
+        return np.interp(u, np.linspace(0, 1, len(quantiles)), quantiles)
+    
+    def inverse_cdf(
+        self,
+        distribution: DistributionType,
+        parameters: Dict[str, Any],
+        u: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Map uniform probabilities through a distribution's inverse CDF.
+        
+        Uses the same parameter names and defaults as the samplers above.
+        
+        Args:
+            distribution: Type of distribution
+            parameters: Distribution parameters
+            u: Probabilities in (0, 1)
+            
+        Returns:
+            Quantiles, or None if the distribution has no parametric inverse CDF
+        """
+        if distribution == DistributionType.EMPIRICAL:
+            return self._interpolate_quantiles(parameters, u)
+        
+        marginal = frozen_distribution(distribution, parameters)
+        if marginal is None:
+            return None
+        
+        return marginal.ppf(u)
+    
     def generate_text(
         self,
         data_type: DataType,
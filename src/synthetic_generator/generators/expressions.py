@@ -0,0 +1,228 @@
+"""
+Constraint expressions for SynGen.
+
+This module compiles boolean constraint expressions such as
+``"end_date > start_date and amount <= credit_limit"`` once, and evaluates
+them over whole columns in a single call.
+"""
+
+import ast
+import re
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional
+
+try:
+    import numexpr
+except ImportError:  # optional dependency
+    numexpr = None
+
+
+# `column name` -> placeholder identifier, so any column name can be referenced
+_BACKTICKS = re.compile(r'`([^`]*)`')
+
+_BOOL_OPS = {ast.And: '&', ast.Or: '|'}
+_BIN_OPS = {
+    ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/',
+    ast.Mod: '%', ast.Pow: '**'
+}
+_COMPARE_OPS = {
+    ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<',
+    ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>='
+}
+_UNARY_OPS = {ast.Invert: '~', ast.USub: '-', ast.UAdd: '+'}
+
+
+def _isin(values: Any, candidates: List[Any]) -> np.ndarray:
+    """Element-wise membership with pandas semantics (mixed types, nulls never match)."""
+    return pd.Series(np.atleast_1d(values)).isin(candidates).to_numpy()
+
+
+# Globals of the numpy fallback; column names starting with '__' must be
+# backticked, so they can never shadow these
+_HELPERS = {'__builtins__': {}, '__np__': np, '__isin__': _isin}
+
+
+class CompiledExpression:
+    """
+    A boolean expression over DataFrame columns, compiled once.
+
+    Supported syntax: column names (or `backticked names`), numeric,
+    string and boolean literals, arithmetic, comparisons (including
+    chained ones), ``in`` / ``not in`` with a literal list, and
+    ``and`` / ``or`` / ``not``. The expression is translated into one
+    element-wise expression. With numexpr installed, numeric expressions
+    are evaluated in a single fused pass without intermediate arrays;
+    otherwise, or when numexpr cannot handle the operands (e.g. strings),
+    a pre-compiled numpy version is used, in which text columns are
+    pandas Series so that nulls compare False as they do in pandas.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Compile an expression.
+
+        Args:
+            expression: Boolean expression text
+
+        Raises:
+            ValueError: If the expression is not valid or uses unsupported syntax
+        """
+        self.expression = expression
+        self._placeholders: Dict[str, str] = {}
+
+        source = _BACKTICKS.sub(self._placeholder, expression)
+        try:
+            tree = ast.parse(source.strip(), mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid constraint expression {expression!r}: {e.msg}") from e
+
+        self._names: Dict[str, str] = {}
+        self._fusable = True
+        self.source = self._translate(tree.body)
+        self._code = compile(self.source, '<constraint>', 'eval')
+
+    @property
+    def columns(self) -> List[str]:
+        """Columns referenced by the expression."""
+        return list(self._names.values())
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate the expression on every row.
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        missing = [col for col in self.columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Constraint expression {self.expression!r} references unknown columns: {missing}")
+
+        arrays = {name: df[col].to_numpy() for name, col in self._names.items()}
+
+        result = None
+        if numexpr is not None and self._fusable:
+            result = self._evaluate_numexpr(arrays)
+        if result is None:
+            result = self._evaluate_numpy(arrays)
+
+        return np.broadcast_to(np.asarray(result, dtype=bool), (len(df),))
+
+    def _evaluate_numpy(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        """Evaluate with numpy, comparing text columns through pandas."""
+        operands = {
+            name: values if values.dtype.kind in 'biufmM' else pd.Series(values)
+            for name, values in arrays.items()
+        }
+        result = eval(self._code, _HELPERS, operands)
+        if isinstance(result, pd.Series):
+            # Nullable comparisons give <NA> for missing values
+            result = result.to_numpy(dtype=bool, na_value=False)
+        return result
+
+    def _evaluate_numexpr(self, arrays: Dict[str, np.ndarray]) -> Optional[np.ndarray]:
+        """Evaluate in one fused pass with numexpr, or None if it cannot."""
+        temporal = [values.dtype for values in arrays.values() if values.dtype.kind == 'M']
+        # Finest unit of the temporal operands, so their integers are comparable
+        unit = np.result_type(*temporal) if temporal else None
+
+        local_dict = {}
+        for name, values in arrays.items():
+            if values.dtype.kind == 'M':
+                # NaT would compare as the smallest integer; numpy handles it
+                if np.isnat(values).any():
+                    return None
+                # Timestamps compare as their integer representation
+                values = values.astype(unit, copy=False).view(np.int64)
+            elif values.dtype.kind not in 'biuf':
+                return None
+            local_dict[name] = values
+
+        try:
+            return numexpr.evaluate(self.source, local_dict=local_dict, global_dict={})
+        except (TypeError, ValueError, KeyError, NotImplementedError):
+            return None
+
+    @staticmethod
+    def _is_boolean(node: ast.AST) -> bool:
+        """Whether a node always evaluates to booleans (comparisons and logic)."""
+        return isinstance(node, (ast.Compare, ast.BoolOp)) or \
+            (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not))
+
+    def _placeholder(self, match: 're.Match') -> str:
+        """Replace a backticked column name with an identifier."""
+        name = f'__col{len(self._placeholders)}'
+        self._placeholders[name] = match.group(1)
+        return name
+
+    def _translate(self, node: ast.AST) -> str:
+        """Translate a validated AST node into element-wise source."""
+        if isinstance(node, ast.BoolOp):
+            op = _BOOL_OPS[type(node.op)]
+            return '(' + f' {op} '.join(self._translate(v) for v in node.values) + ')'
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._translate(node.operand)
+            if self._is_boolean(node.operand):
+                return f'(~{operand})'
+            # Bitwise ~ of a number is not its negation (~0 == -1)
+            self._fusable = False
+            return f'__np__.logical_not({operand})'
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            return f'({_UNARY_OPS[type(node.op)]}{self._translate(node.operand)})'
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+            return f'({self._translate(node.left)} {_BIN_OPS[type(node.op)]} {self._translate(node.right)})'
+
+        if isinstance(node, ast.Compare):
+            # a < b < c  ->  (a < b) & (b < c)
+            parts = []
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                parts.append(self._translate_comparison(left, op, right))
+                left = right
+            return parts[0] if len(parts) == 1 else '(' + ' & '.join(parts) + ')'
+
+        if isinstance(node, ast.Name):
+            if node.id.startswith('__') and node.id not in self._placeholders:
+                raise ValueError(
+                    f"Column names starting with '__' must be backticked in constraint expression {self.expression!r}"
+                )
+            column = self._placeholders.get(node.id, node.id)
+            self._names[node.id] = column
+            return node.id
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool)):
+            if isinstance(node.value, str):
+                self._fusable = False
+            return repr(node.value)
+
+        raise ValueError(
+            f"Unsupported syntax in constraint expression {self.expression!r}: {type(node).__name__}"
+        )
+
+    def _translate_comparison(self, left: ast.AST, op: ast.cmpop, right: ast.AST) -> str:
+        """Translate a single comparison."""
+        if isinstance(op, (ast.In, ast.NotIn)):
+            if not isinstance(right, (ast.List, ast.Tuple, ast.Set)):
+                raise ValueError(f"'in' needs a literal list in constraint expression {self.expression!r}")
+            values = [self._literal(v) for v in right.elts]
+            self._fusable = False
+            test = f'__isin__({self._translate(left)}, {values!r})'
+            return f'(~{test})' if isinstance(op, ast.NotIn) else test
+
+        if type(op) not in _COMPARE_OPS:
+            raise ValueError(f"Unsupported comparison in constraint expression {self.expression!r}")
+        return f'({self._translate(left)} {_COMPARE_OPS[type(op)]} {self._translate(right)})'
+
+    def _literal(self, node: ast.AST) -> Any:
+        """Get the value of a literal list element."""
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+            return -node.operand.value
+        raise ValueError(f"'in' lists must contain literals in constraint expression {self.expression!r}")
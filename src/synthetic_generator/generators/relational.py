@@ -0,0 +1,279 @@
+"""
+Relational data generator for SynGen.
+
+Tables are generated one after another in dependency order, each in chunks.
+Primary keys are integers; of every parent table only its key array is
+kept, and child rows reference it by index: fan-out children repeat each
+parent key by its drawn group size, other children draw uniform indices
+into it. Data can also be generated in partitions, concurrently and each
+deterministic on its own.
+"""
+
+import os
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterator, Optional, Tuple
+from ..schemas import DataType, DistributionType
+from ..schemas.relational import RelationalSchema, Relationship
+from ..utils.parallel import parallel_map
+from .base import DataGenerator
+from .constraints import ConstraintManager
+from .distributions import DistributionGenerator
+
+
+class RelationalGenerator:
+    """Generates the tables of a relational schema with consistent keys."""
+
+    def __init__(self, schema: RelationalSchema):
+        """
+        Initialize the relational generator.
+
+        Args:
+            schema: Relational schema defining the tables and their keys
+        """
+        self.schema = schema
+        self.generators = {name: DataGenerator(table) for name, table in schema.tables.items()}
+        self.distribution_generator = DistributionGenerator()
+        self.constraint_manager = ConstraintManager()
+
+        # Key arrays of the parent tables, and their columns that child
+        # orderings refer to, filled during a generation run
+        self.keys: Dict[str, np.ndarray] = {}
+        self.values: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def generate_chunks(
+        self,
+        rows: Dict[str, int],
+        chunk_size: int = 100000,
+        seed: Optional[int] = None,
+        partition: int = 0,
+        partitions: int = 1
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Generate every table in dependency order, as a stream of chunks.
+
+        All chunks of a parent table are yielded before those of its
+        children, so they can be written (or loaded) in order.
+
+        With ``partitions``, only one slice of the data is generated: the
+        given share of the rows of every table with a row count, and the
+        fan-out children of those rows. A partition depends only on its
+        index and the seed, so partitions can be generated independently
+        (e.g. on different nodes) and together form one consistent dataset:
+        references only point at parent rows generated in the same
+        partition, so rows dropped by the parent's constraints are never
+        referenced.
+
+        Args:
+            rows: Number of rows per table; tables with a fan-out
+                relationship get theirs from the drawn group sizes
+            chunk_size: Number of rows per chunk
+            seed: Random seed for reproducibility
+            partition: Index of the partition to generate
+            partitions: Number of partitions
+
+        Yields:
+            (table name, DataFrame of at most ``chunk_size`` rows) pairs
+        """
+        if not 0 <= partition < partitions:
+            raise ValueError(f"partition must be in [0, {partitions})")
+
+        if seed is not None:
+            # Independent streams per partition, whatever the partition count
+            state = np.random.SeedSequence(seed, spawn_key=(partition,)).generate_state(4)
+            np.random.seed(state)
+
+        parents = {rel.parent for rel in self.schema.relationships}
+        ordered = {}
+        for rel in self.schema.relationships:
+            ordered.setdefault(rel.parent, set()).update(o['column2'] for o in rel.orderings)
+        self.keys = {}
+        self.values = {}
+
+        for table in self.schema.table_order():
+            primary_key = self.schema.primary_keys.get(table)
+            fan_out = self.schema.fan_out_of(table)
+            stride = None
+            if fan_out is not None:
+                # Child row i belongs to the parent whose group spans i
+                sizes = self._group_sizes(fan_out)
+                bounds = np.cumsum(sizes)
+                starts = bounds - sizes
+                n_rows = int(bounds[-1]) if len(bounds) else 0
+                key_offset = 0
+                stride = fan_out.fan_out.get('max')
+                if primary_key is not None and stride is None and partitions > 1:
+                    raise ValueError(
+                        f"Fan-out of {table} needs a 'max' to key its rows across partitions"
+                    )
+            elif table in rows:
+                # Keys are global row numbers, so partitions do not overlap
+                key_offset = rows[table] * partition // partitions
+                n_rows = rows[table] * (partition + 1) // partitions - key_offset
+            else:
+                raise ValueError(f"Number of rows not given for table: {table}")
+
+            references = [
+                rel for rel in self.schema.relationships
+                if rel.child == table and rel is not fan_out
+            ]
+            collected = [] if table in parents else None
+            collected_values = {col: [] for col in ordered.get(table, ())}
+
+            slot = 0
+            for chunk in self.generators[table].generate_chunks(chunk_size, n_rows):
+                size = min(chunk_size, n_rows - slot)
+                # Rows dropped by constraints leave gaps in the chunk index
+                positions = slot + chunk.index.to_numpy()
+                chunk = chunk.reset_index(drop=True)
+
+                if fan_out is not None:
+                    owners = np.searchsorted(bounds, positions, side='right')
+                    parent_keys = self.keys[fan_out.parent][owners]
+                    self._set_column(chunk, fan_out.foreign_key, parent_keys)
+                    chunk = self._apply_orderings(chunk, fan_out, owners)
+
+                if primary_key is not None:
+                    if stride is not None:
+                        # Numbered within the parent's group, unique across partitions
+                        keys = parent_keys * stride + (positions - starts[owners])
+                    else:
+                        keys = np.arange(key_offset, key_offset + len(chunk), dtype=np.int64)
+                        key_offset += len(chunk)
+                    self._set_column(chunk, primary_key, keys, first=True)
+                    if collected is not None:
+                        collected.append(keys)
+
+                for rel in references:
+                    indices = self._draw_indices(rel, len(chunk))
+                    self._set_column(chunk, rel.foreign_key, self.keys[rel.parent][indices])
+                    chunk = self._apply_orderings(chunk, rel, indices)
+
+                for col, values in collected_values.items():
+                    values.append(chunk[col].to_numpy())
+
+                yield table, chunk
+                slot += size
+
+            if collected is not None:
+                self.keys[table] = np.concatenate(collected) if collected else np.empty(0, dtype=np.int64)
+            if collected_values:
+                self.values[table] = {
+                    col: np.concatenate(values) if values else np.empty(0)
+                    for col, values in collected_values.items()
+                }
+
+    def generate(self, rows: Dict[str, int], seed: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Generate every table in memory.
+
+        Args:
+            rows: Number of rows per table without a fan-out relationship
+            seed: Random seed for reproducibility
+
+        Returns:
+            DataFrames keyed by table name
+        """
+        chunks: Dict[str, list] = {}
+        for table, chunk in self.generate_chunks(rows, seed=seed):
+            chunks.setdefault(table, []).append(chunk)
+        return {
+            table: pd.concat(chunks[table], ignore_index=True) if table in chunks
+            else pd.DataFrame(columns=[col.name for col in self.schema.tables[table].columns])
+            for table in self.schema.table_order()
+        }
+
+    def _draw_indices(self, rel: Relationship, n: int) -> np.ndarray:
+        """Draw uniform references to the rows the parent of a relationship has."""
+        n_parents = len(self.keys[rel.parent])
+        if n_parents == 0:
+            raise ValueError(f"Parent table {rel.parent} of {rel.child} has no rows (in this partition)")
+        return np.random.randint(0, n_parents, n)
+
+    def _apply_orderings(self, chunk: pd.DataFrame, rel: Relationship, indices: np.ndarray) -> pd.DataFrame:
+        """Enforce the orderings of child columns against the referenced parent rows."""
+        if not rel.orderings:
+            return chunk
+        # Parent columns join the chunk under temporary names for the constraint
+        names = {o['column2']: f"__{rel.parent}.{o['column2']}" for o in rel.orderings}
+        for col, name in names.items():
+            chunk[name] = self.values[rel.parent][col][indices]
+        orderings = [dict(o, column2=names[o['column2']]) for o in rel.orderings]
+        chunk = self.constraint_manager.apply_ordering_constraints(chunk, orderings)
+        return chunk.drop(columns=list(names.values()))
+
+    def _group_sizes(self, rel: Relationship) -> np.ndarray:
+        """Draw the number of child rows of every parent row."""
+        spec = rel.fan_out
+        sizes = self.distribution_generator.generate(
+            DistributionType(spec['distribution']), DataType.INTEGER,
+            spec.get('parameters', {}), len(self.keys[rel.parent])
+        )
+        sizes = np.clip(np.round(sizes), spec.get('min', 0), spec.get('max'))
+        return sizes.astype(np.int64)
+
+    @staticmethod
+    def _set_column(chunk: pd.DataFrame, name: str, values: np.ndarray, first: bool = False):
+        """Set a key column, adding it (first or last) if the table lacks it."""
+        if name in chunk.columns or not first:
+            chunk[name] = values
+        else:
+            chunk.insert(0, name, values)
+
+
+def generate_partitions(
+    schema: RelationalSchema,
+    rows: Dict[str, int],
+    path: str,
+    partitions: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    chunk_size: int = 100000
+) -> Dict[str, int]:
+    """
+    Generate a relational dataset partition by partition, in worker processes.
+
+    Every partition of a table is written to ``<path>/<table>/part-<partition>.parquet``,
+    one row group per chunk; each table directory reads back as one dataset. A partition's files
+    only depend on the seed and the partition index (see
+    ``RelationalGenerator.generate_chunks``).
+
+    Args:
+        schema: Relational schema
+        rows: Number of rows per table without a fan-out relationship
+        path: Output directory
+        partitions: Number of partitions
+        workers: Maximum number of worker processes
+        seed: Random seed for reproducibility
+        chunk_size: Number of rows per chunk
+
+    Returns:
+        Number of rows written per table
+    """
+    tasks = [(schema, rows, path, partition, partitions, seed, chunk_size) for partition in range(partitions)]
+    totals = {table: 0 for table in schema.table_order()}
+    # Processes, since each partition seeds the global NumPy random state
+    for counts in parallel_map(_write_partition, tasks, workers=workers, processes=True):
+        for table, count in counts.items():
+            totals[table] += count
+    return totals
+
+
+def _write_partition(task: Tuple) -> Dict[str, int]:
+    """Generate one partition and write its tables, returning the row counts."""
+    from ..export.writers import ParquetChunkWriter
+
+    schema, rows, path, partition, partitions, seed, chunk_size = task
+    writers: Dict[str, ParquetChunkWriter] = {}
+    try:
+        for table, chunk in RelationalGenerator(schema).generate_chunks(
+            rows, chunk_size, seed, partition=partition, partitions=partitions
+        ):
+            if table not in writers:
+                os.makedirs(os.path.join(path, table), exist_ok=True)
+                writers[table] = ParquetChunkWriter(os.path.join(path, table, f"part-{partition:05d}.parquet"))
+            writers[table].write(chunk)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {table: writer.rows for table, writer in writers.items()}
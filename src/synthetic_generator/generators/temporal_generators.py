@@ -5,73 +5,235 @@ This module provides generators for temporal data types
 such as dates and datetimes.
 """
 
+import re
 import numpy as np
-import random
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import pandas as pd
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+
+# strftime directives that depend on the time of day
+_TIME_DIRECTIVES = re.compile(r'%[HIMSfpXcTRrZzs]')
+
+# Formats of temporal columns that do not set one
+DEFAULT_TEMPORAL_FORMATS = {'date': '%Y-%m-%d', 'datetime': '%Y-%m-%d %H:%M:%S'}
+
+# 1970-01-01 was a Thursday (Monday == 0)
+_EPOCH_WEEKDAY = 3
+_MS_PER_HOUR = 3_600_000
+_MS_PER_DAY = 24 * _MS_PER_HOUR
+
+
+def temporal_formats(schema: Any, defaults: bool = True) -> Dict[str, str]:
+    """
+    Map the temporal columns of a schema to their export formats.
+
+    Args:
+        schema: Data schema
+        defaults: Also map columns without a format (``format_string`` or
+            ``parameters['format']``) to ``DEFAULT_TEMPORAL_FORMATS``
+
+    Returns:
+        ``strftime`` format per column name
+    """
+    formats = {}
+    for column in schema.columns:
+        if column.data_type.value not in DEFAULT_TEMPORAL_FORMATS:
+            continue
+        fmt = column.format_string or column.parameters.get('format')
+        if fmt is None and defaults:
+            fmt = DEFAULT_TEMPORAL_FORMATS[column.data_type.value]
+        if fmt is not None:
+            formats[column.name] = fmt
+    return formats
+
+
+class EventStream:
+    """
+    Monotonic event timestamps from a Poisson arrival process.
+
+    With no seasonality the process is homogeneous with ``rate`` events per
+    hour. ``daily_profile`` (24 hourly multipliers) and ``weekly_profile``
+    (7 multipliers, Monday first) turn it into a nonhomogeneous process,
+    sampled by thinning a homogeneous process at the peak rate. The stream
+    keeps its cursor between calls, so consecutive chunks continue in time
+    order and the stream can be consumed indefinitely.
+    """
+
+    def __init__(self, parameters: Dict[str, Any]):
+        """
+        Initialize the event stream.
+
+        Args:
+            parameters: Process parameters ('rate', 'start_datetime',
+                'daily_profile', 'weekly_profile')
+        """
+        self.rate = float(parameters.get('rate', 1.0))
+        if self.rate <= 0:
+            raise ValueError("Event stream 'rate' must be positive")
+
+        self.daily_profile = self._profile(parameters.get('daily_profile'), 24, 'daily_profile')
+        self.weekly_profile = self._profile(parameters.get('weekly_profile'), 7, 'weekly_profile')
+
+        start = parameters.get('start_datetime', datetime(2020, 1, 1))
+        self._cursor = pd.Timestamp(start).to_datetime64().astype('datetime64[ms]').astype(np.int64)
+
+        # Peak intensity in events per millisecond, used as the thinning envelope
+        self._peak = self.rate * self.daily_profile.max() * self.weekly_profile.max() / _MS_PER_HOUR
+        self._acceptance = (self.daily_profile.mean() * self.weekly_profile.mean()
+                            / (self.daily_profile.max() * self.weekly_profile.max()))
+
+    @property
+    def cursor(self) -> np.datetime64:
+        """Timestamp of the last emitted event (or the start of the stream)."""
+        return np.datetime64(int(self._cursor), 'ms')
+
+    def take(self, n_samples: int) -> np.ndarray:
+        """
+        Draw the next ``n_samples`` events.
+
+        Returns:
+            Non-decreasing ``datetime64[ms]`` array
+        """
+        chunks: List[np.ndarray] = []
+        remaining = n_samples
+        cursor = self._cursor
+
+        while remaining > 0:
+            # Oversample candidates so one batch usually suffices
+            batch = int(remaining / self._acceptance * 1.1) + 16
+            gaps = np.random.exponential(1.0 / self._peak, batch)
+            candidates = cursor + np.cumsum(gaps)
+
+            accepted = candidates[np.random.random(batch) * self._peak < self._intensity(candidates)]
+            accepted = accepted[:remaining]
+            if len(accepted):
+                chunks.append(accepted)
+                remaining -= len(accepted)
+                # Memorylessness lets the next batch restart from the last event
+                cursor = accepted[-1] if remaining == 0 else candidates[-1]
+            else:
+                cursor = candidates[-1]
+
+        self._cursor = cursor
+        times = np.concatenate(chunks) if chunks else np.empty(0)
+        return times.astype(np.int64).astype('datetime64[ms]')
+
+    def _intensity(self, times_ms: np.ndarray) -> np.ndarray:
+        """Arrival intensity (events per millisecond) at the given epoch times."""
+        ms = times_ms.astype(np.int64)
+        hours = (ms // _MS_PER_HOUR) % 24
+        weekdays = (ms // _MS_PER_DAY + _EPOCH_WEEKDAY) % 7
+        return self.rate / _MS_PER_HOUR * self.daily_profile[hours] * self.weekly_profile[weekdays]
+
+    @staticmethod
+    def _profile(values: Optional[List[float]], length: int, name: str) -> np.ndarray:
+        """Validate a seasonality profile, defaulting to a flat one."""
+        if values is None:
+            return np.ones(length)
+        profile = np.asarray(values, dtype=float)
+        if profile.shape != (length,) or (profile < 0).any() or profile.max() <= 0:
+            raise ValueError(f"'{name}' must be {length} non-negative multipliers with a positive peak")
+        return profile
 
 
 class TemporalGenerator:
     """Generator for temporal data types."""
-    
+
     def __init__(self):
         """Initialize the temporal generator."""
         pass
-    
+
     def generate_dates(self, parameters: Dict[str, Any], n_samples: int) -> np.ndarray:
-        """Generate dates."""
-        dates = []
-        
-        start_date = parameters.get('start_date', datetime(2020, 1, 1))
-        end_date = parameters.get('end_date', datetime(2024, 12, 31))
-        
-        if isinstance(start_date, str):
-            start_date = datetime.fromisoformat(start_date)
-        if isinstance(end_date, str):
-            end_date = datetime.fromisoformat(end_date)
-        
-        # Convert to date objects
-        start_date = start_date.date()
-        end_date = end_date.date()
-        
-        # Calculate date range
-        date_range = (end_date - start_date).days
-        
-        for _ in range(n_samples):
-            # Generate random days offset
-            days_offset = random.randint(0, date_range)
-            random_date = start_date + timedelta(days=days_offset)
-            
-            # Format date
-            format_str = parameters.get('format', '%Y-%m-%d')
-            date_str = random_date.strftime(format_str)
-            dates.append(date_str)
-        
-        return np.array(dates)
-    
+        """
+        Generate dates.
+
+        Offsets are drawn in bulk as int64 day counts, so the result is a
+        ``datetime64[D]`` array. Formatting is deferred to export time, see
+        :meth:`format_temporal`.
+        """
+        start_date = self._to_datetime64(parameters.get('start_date', datetime(2020, 1, 1)), 'D')
+        end_date = self._to_datetime64(parameters.get('end_date', datetime(2024, 12, 31)), 'D')
+
+        # Calculate date range (inclusive of the end date)
+        date_range = int((end_date - start_date) // np.timedelta64(1, 'D'))
+
+        days_offset = np.random.randint(0, date_range + 1, size=n_samples, dtype=np.int64)
+        return start_date + days_offset.astype('timedelta64[D]')
+
     def generate_datetimes(self, parameters: Dict[str, Any], n_samples: int) -> np.ndarray:
-        """Generate datetimes."""
-        datetimes = []
-        
-        start_datetime = parameters.get('start_datetime', datetime(2020, 1, 1))
-        end_datetime = parameters.get('end_datetime', datetime(2024, 12, 31))
-        
-        if isinstance(start_datetime, str):
-            start_datetime = datetime.fromisoformat(start_datetime)
-        if isinstance(end_datetime, str):
-            end_datetime = datetime.fromisoformat(end_datetime)
-        
-        # Calculate time range in seconds
-        time_range = (end_datetime - start_datetime).total_seconds()
-        
-        for _ in range(n_samples):
-            # Generate random seconds offset
-            seconds_offset = random.randint(0, int(time_range))
-            random_datetime = start_datetime + timedelta(seconds=seconds_offset)
-            
-            # Format datetime
-            format_str = parameters.get('format', '%Y-%m-%d %H:%M:%S')
-            datetime_str = random_datetime.strftime(format_str)
-            datetimes.append(datetime_str)
-        
-        return np.array(datetimes) 
\ No newline at end of file
+        """
+        Generate datetimes.
+
+        Offsets are drawn in bulk as int64 second counts, so the result is a
+        ``datetime64[s]`` array. Formatting is deferred to export time, see
+        :meth:`format_temporal`.
+        """
+        start_datetime = self._to_datetime64(parameters.get('start_datetime', datetime(2020, 1, 1)), 's')
+        end_datetime = self._to_datetime64(parameters.get('end_datetime', datetime(2024, 12, 31)), 's')
+
+        # Calculate time range in seconds (inclusive of the end)
+        time_range = int((end_datetime - start_datetime) // np.timedelta64(1, 's'))
+
+        seconds_offset = np.random.randint(0, time_range + 1, size=n_samples, dtype=np.int64)
+        return start_datetime + seconds_offset.astype('timedelta64[s]')
+
+    def generate_events(self, parameters: Dict[str, Any], n_samples: int) -> np.ndarray:
+        """Generate ordered event timestamps from a fresh :class:`EventStream`."""
+        return EventStream(parameters).take(n_samples)
+
+    @staticmethod
+    def format_temporal(values: Any, format_str: str, max_table_size: Optional[int] = None) -> np.ndarray:
+        """
+        Format temporal values as strings.
+
+        Formats that only use date directives are rendered once per distinct
+        day and gathered through a lookup table, so the cost of ``strftime``
+        scales with the number of days spanned rather than the number of rows.
+        Formats with time-of-day directives fall back to pandas' vectorized
+        ``strftime``.
+
+        Args:
+            values: ``datetime64`` array or Series
+            format_str: ``strftime`` format string
+            max_table_size: Largest day span rendered through a dense table;
+                wider spans use the distinct days only. Defaults to the
+                number of values.
+
+        Returns:
+            Object array of formatted strings, ``None`` where values are missing
+        """
+        values = np.asarray(values)
+        if values.dtype.kind != 'M':
+            values = pd.to_datetime(values).to_numpy()
+
+        if _TIME_DIRECTIVES.search(format_str):
+            formatted = pd.DatetimeIndex(values).strftime(format_str)
+            return np.asarray(formatted, dtype=object)
+
+        days = values.astype('datetime64[D]')
+        missing = np.isnat(days)
+        result = np.empty(len(days), dtype=object)
+        if missing.all():
+            return result
+
+        present = days[~missing]
+        first, last = present.min(), present.max()
+        span = int((last - first) // np.timedelta64(1, 'D')) + 1
+        limit = max_table_size if max_table_size is not None else len(present)
+
+        if span <= max(limit, 1):
+            # Dense table indexed by day offset: O(n) gather, no sort
+            table_days = np.arange(first, last + np.timedelta64(1, 'D'))
+            codes = (present - first).astype(np.int64)
+        else:
+            table_days, codes = np.unique(present, return_inverse=True)
+
+        table = np.array([day.strftime(format_str) for day in table_days.astype(object)], dtype=object)
+        result[~missing] = table[codes]
+        return result
+
+    @staticmethod
+    def _to_datetime64(value: Any, unit: str) -> np.datetime64:
+        """Convert a string, datetime or date to ``datetime64`` of the given unit."""
+        return pd.Timestamp(value).to_datetime64().astype(f'datetime64[{unit}]')
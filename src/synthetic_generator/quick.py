@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from typing import Optional, Union, Dict, Any
-import os
+from typing import Optional, Union, Dict, Any, Iterator
+import numpy as np
 import pandas as pd
 
 from .schemas import DataSchema
 from .schemas import load_template as load_template_schema
 from .schemas.inference import SchemaInferrer
+from .generators import DataGenerator
+from .utils.artifacts import save_artifact, load_artifact
 from . import generate_data
 
+# Version of the saved model layout
+MODEL_FORMAT = 1
+
+# Numeric list parameters stored as arrays in saved models
+ARRAY_PARAMETERS = ('quantiles', 'probabilities')
+
 
 def dataset(
     template: Optional[str] = None,
@@ -49,12 +57,89 @@ class QuickModel:
 
     def __init__(self, schema: DataSchema):
         self._schema = schema
+        # One generator for all samples, so prepared state is reused
+        self._generator = DataGenerator(schema)
 
     def sample(self, rows: int, seed: Optional[int] = None) -> pd.DataFrame:
-        return generate_data(self._schema, n_samples=rows, seed=seed)
+        return self._generator.generate(rows, seed=seed)
+
+    def sample_chunks(self, rows: int, chunk_size: int, seed: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Sample ``rows`` rows as a stream of DataFrames of at most ``chunk_size`` rows."""
+        return self._generator.generate_chunks(chunk_size, rows, seed=seed)
 
     def to_dict(self) -> Dict[str, Any]:
-        return self._schema.to_dict()
+        schema = self._schema.to_dict()
+        for column in schema['columns']:
+            column['parameters'] = {
+                key: value.tolist() if isinstance(value, np.ndarray) else value
+                for key, value in column['parameters'].items()
+            }
+        return schema
+
+    def save(self, path: str) -> None:
+        """
+        Save the fitted model as a binary artifact.
+
+        The schema is stored as JSON, while quantile tables, category
+        probabilities and the Cholesky factors of the correlations are
+        stored as arrays, so ``load`` neither re-fits nor refactors.
+
+        Args:
+            path: Output path (an uncompressed ``.npz`` archive)
+        """
+        schema = self.to_dict()
+        arrays: Dict[str, np.ndarray] = {}
+        for i, column in enumerate(schema['columns']):
+            for key in ARRAY_PARAMETERS:
+                value = column['parameters'].get(key)
+                if value is not None:
+                    name = f'columns/{i}/{key}'
+                    arrays[name] = np.asarray(value, dtype=float)
+                    column['parameters'][key] = {'array': name}
+
+        factors = []
+        for i, (key, factor) in enumerate(self._generator.prepare().correlation_manager.get_factors()):
+            name = f'factors/{i}'
+            arrays[name] = factor
+            factors.append({'key': key, 'array': name})
+
+        metadata = {'format': MODEL_FORMAT, 'schema': schema, 'factors': factors}
+        save_artifact(path, metadata, arrays)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'QuickModel':
+        """
+        Load a model saved with ``save``.
+
+        Args:
+            path: Artifact path
+            mmap: Map the arrays from the file instead of reading them
+
+        Returns:
+            The fitted model, ready to sample
+        """
+        metadata, arrays = load_artifact(path, mmap=mmap)
+        if metadata.get('format') != MODEL_FORMAT:
+            raise ValueError(f"Unsupported model format: {metadata.get('format')}")
+
+        schema = metadata['schema']
+        for column in schema['columns']:
+            for key in ARRAY_PARAMETERS:
+                value = column['parameters'].get(key)
+                if isinstance(value, dict):
+                    column['parameters'][key] = arrays[value['array']]
+
+        model = cls(DataSchema.from_dict(schema))
+        model._generator.correlation_manager.set_factors([
+            (_factor_key(entry['key']), arrays[entry['array']]) for entry in metadata['factors']
+        ])
+        return model
+
+
+def _factor_key(key: list) -> tuple:
+    """Rebuild a correlation factor cache key from its JSON form."""
+    rank, names, pairs = key
+    return rank, tuple(names), tuple(tuple(pair) for pair in pairs)
 
 
 def fit(data: Union[pd.DataFrame, str], sample_size: Optional[int] = None) -> QuickModel:
@@ -62,33 +147,19 @@ def fit(data: Union[pd.DataFrame, str], sample_size: Optional[int] = None) -> Qu
     Fit a simple model by inferring a schema from real data.
 
     Args:
-        data: A pandas DataFrame or a file path to CSV/JSON/Parquet/Excel.
+        data: A pandas DataFrame, or a path to a CSV/JSON/Parquet/Excel file
+            or a directory of such files.
         sample_size: Optional subsample size used during inference.
 
     Returns:
         QuickModel that can sample synthetic rows via .sample().
     """
-    df = _load_dataframe(data)
-    inferred = SchemaInferrer.infer(df, sample_size)
-    return QuickModel(inferred)
-
-
-def _load_dataframe(data: Union[pd.DataFrame, str]) -> pd.DataFrame:
     if isinstance(data, pd.DataFrame):
-        return data
+        return QuickModel(SchemaInferrer.infer(data, sample_size))
     if not isinstance(data, str):
         raise ValueError("data must be a DataFrame or a path string")
 
-    path = data
-    ext = os.path.splitext(path)[1].lower()
-    if ext == ".csv":
-        return pd.read_csv(path)
-    if ext == ".json":
-        return pd.read_json(path)
-    if ext in (".parquet", ".pq"):
-        return pd.read_parquet(path)
-    if ext in (".xlsx", ".xls"):
-        return pd.read_excel(path)
-
-    # Fallback: try CSV
-    return pd.read_csv(path)
+    # Files are profiled chunk by chunk, or sampled while reading
+    inferred = SchemaInferrer.infer_file(data, sample_size)
+    return QuickModel(inferred)
+
@@ -8,6 +8,7 @@ including automatic schema inference and template loading.
 from .base import DataSchema, ColumnSchema, DataType, DistributionType
 from .inference import SchemaInferrer
 from .templates import TemplateLoader
+from .relational import RelationalSchema, Relationship
 
 __all__ = [
     'DataSchema',
@@ -16,6 +17,8 @@ __all__ = [
     'DistributionType',
     'SchemaInferrer',
     'TemplateLoader',
+    'RelationalSchema',
+    'Relationship',
     'load_template'
 ]
 
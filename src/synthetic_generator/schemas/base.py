@@ -2,12 +2,21 @@
 Base schema classes for SynGen data generation.
 """
 
+import hashlib
+import json
+import zlib
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
 from enum import Enum
 
 
+# Largest decompressed size of an ``encode_schema`` encoding, so that
+# untrusted input cannot expand to an unbounded allocation
+MAX_SCHEMA_BYTES = 16 * 1024 * 1024
+
+
 class DataType(Enum):
     """Supported data types for synthetic data generation."""
     INTEGER = "integer"
@@ -37,6 +46,7 @@ class DistributionType(Enum):
     GEOMETRIC = "geometric"
     CATEGORICAL = "categorical"
     CONSTANT = "constant"
+    EMPIRICAL = "empirical"
 
 
 @dataclass
@@ -74,7 +84,8 @@ class ColumnSchema:
                 DistributionType.EXPONENTIAL, DistributionType.GAMMA,
                 DistributionType.BETA, DistributionType.WEIBULL,
                 DistributionType.POISSON, DistributionType.BINOMIAL,
-                DistributionType.GEOMETRIC, DistributionType.CONSTANT
+                DistributionType.GEOMETRIC, DistributionType.CONSTANT,
+                DistributionType.EMPIRICAL
             ]:
                 errors.append(f"Distribution {self.distribution} not compatible with {self.data_type}")
         
@@ -96,7 +107,8 @@ class ColumnSchema:
                 if ('start_date' not in self.parameters or 'end_date' not in self.parameters) and \
                    ('start_datetime' not in self.parameters or 'end_datetime' not in self.parameters):
                     errors.append("Date/Datetime uniform distribution requires 'start_date'/'end_date' or 'start_datetime'/'end_datetime' parameters")
-            else:
+            elif self.data_type not in [DataType.STRING, DataType.EMAIL, DataType.PHONE, DataType.ADDRESS, DataType.NAME]:
+                # Text types are drawn by their text generator instead
                 if 'low' not in self.parameters or 'high' not in self.parameters:
                     errors.append("Uniform distribution requires 'low' and 'high' parameters")
         
@@ -104,9 +116,74 @@ class ColumnSchema:
             if 'categories' not in self.parameters:
                 errors.append("Categorical distribution requires 'categories' parameter")
         
+        elif self.distribution == DistributionType.EMPIRICAL:
+            quantiles = self.parameters.get('quantiles')
+            if quantiles is None or len(quantiles) < 2:
+                errors.append("Empirical distribution requires a 'quantiles' table with at least 2 values")
+            elif (np.diff(np.asarray(quantiles, dtype=float)) < 0).any():
+                errors.append("Empirical distribution 'quantiles' must be non-decreasing")
+        
+        elif self.distribution == DistributionType.POISSON and self.data_type == DataType.DATETIME:
+            if self.parameters.get('rate', 1.0) <= 0:
+                errors.append("Poisson event stream requires a positive 'rate' (events per hour)")
+        
         return errors
 
 
+def _json_default(value: Any) -> Any:
+    """Make NumPy values JSON-serializable."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def canonical_json(data: Dict[str, Any]) -> str:
+    """
+    Serialize a schema dictionary canonically: sorted keys, no whitespace.
+    
+    Equal schemas give equal strings whatever their key order.
+    """
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), default=_json_default)
+
+
+def schema_hash(data: Union[Dict[str, Any], str]) -> str:
+    """Content hash of a schema dictionary, or of its ``canonical_json`` string."""
+    text = data if isinstance(data, str) else canonical_json(data)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def encode_schema(data: Dict[str, Any]) -> bytes:
+    """Compact binary encoding of a schema dictionary (zlib-compressed canonical JSON)."""
+    return zlib.compress(canonical_json(data).encode('utf-8'), 9)
+
+
+def decompress_schema(data: bytes) -> str:
+    """
+    Decompress ``encode_schema`` bytes to their canonical JSON string.
+    
+    Raises:
+        ValueError: If the data is not a complete encoding, or decompresses
+            to more than ``MAX_SCHEMA_BYTES``
+    """
+    decompressor = zlib.decompressobj()
+    try:
+        text = decompressor.decompress(data, MAX_SCHEMA_BYTES)
+    except zlib.error as e:
+        raise ValueError(f"Invalid schema encoding: {e}") from e
+    if decompressor.unconsumed_tail:
+        raise ValueError(f"Encoded schema exceeds {MAX_SCHEMA_BYTES} bytes")
+    if not decompressor.eof:
+        raise ValueError("Invalid schema encoding: truncated data")
+    return text.decode('utf-8')
+
+
+def decode_schema(data: bytes) -> Dict[str, Any]:
+    """Decode a schema dictionary encoded with ``encode_schema``."""
+    return json.loads(decompress_schema(data))
+
+
 @dataclass
 class DataSchema:
     """Complete schema definition for synthetic data generation."""
@@ -153,6 +230,15 @@ class DataSchema:
                     if not -1 <= corr_value <= 1:
                         errors.append(f"Correlation value must be between -1 and 1: {corr_value}")
         
+        # Validate ordering constraints
+        if self.constraints:
+            for ordering in self.constraints.get('ordering_constraints', []):
+                for key in ['column1', 'column2']:
+                    if ordering.get(key) not in column_names:
+                        errors.append(f"Ordering constraint references undefined column: {ordering.get(key)}")
+                if ordering.get('operator', '>') not in ['>', '>=', '<', '<=']:
+                    errors.append(f"Unsupported ordering operator: {ordering.get('operator')}")
+        
         return errors
     
     def to_dict(self) -> Dict[str, Any]:
@@ -208,6 +294,19 @@ class DataSchema:
             constraints=data.get('constraints')
         )
     
+    def to_bytes(self) -> bytes:
+        """Encode schema compactly (see ``encode_schema``)."""
+        return encode_schema(self.to_dict())
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'DataSchema':
+        """Create schema from ``to_bytes`` output."""
+        return cls.from_dict(decode_schema(data))
+    
+    def content_hash(self) -> str:
+        """Content hash of the schema (see ``schema_hash``)."""
+        return schema_hash(self.to_dict())
+    
     @classmethod
     def infer(cls, data: pd.DataFrame, sample_size: Optional[int] = None) -> 'DataSchema':
         """Infer schema from existing data."""
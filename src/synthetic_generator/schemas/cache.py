@@ -0,0 +1,146 @@
+"""
+Content-addressed cache of parsed schemas for SynGen.
+
+Schemas that arrive as dictionaries or as ``encode_schema`` bytes (e.g. in
+API requests) are keyed by their content hash. The first request parses
+and validates a schema; later requests with the same content get the
+cached ``DataSchema``, and the plans built from it (such as a generator
+with compiled constraints), without parsing or validating again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Union
+from .base import DataSchema, decompress_schema, schema_hash
+
+
+class CachedSchema:
+    """
+    A parsed and validated schema, with the plans built from it.
+
+    Attributes:
+        key: Content hash of the schema
+        schema: The parsed schema
+        lock: Lock for callers that use a plan with per-run state
+    """
+
+    def __init__(self, key: str, schema: DataSchema):
+        """
+        Initialize a cache entry.
+
+        Args:
+            key: Content hash of the schema
+            schema: The parsed schema
+        """
+        self.key = key
+        self.schema = schema
+        self.lock = threading.RLock()
+        self._plans: Dict[str, Any] = {}
+
+    def plan(self, name: str, build: Callable[[DataSchema], Any]) -> Any:
+        """
+        Get a plan built from the schema, building it on first use.
+
+        Args:
+            name: Plan name
+            build: Function building the plan from the schema
+
+        Returns:
+            The plan
+        """
+        with self.lock:
+            if name not in self._plans:
+                self._plans[name] = build(self.schema)
+            return self._plans[name]
+
+
+class SchemaCache:
+    """
+    Least-recently-used cache of parsed schemas keyed by content hash.
+
+    Attributes:
+        max_size: Maximum number of cached schemas
+        hits: Number of lookups served from the cache
+        misses: Number of schemas parsed
+    """
+
+    def __init__(self, max_size: int = 128):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of cached schemas
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, CachedSchema]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, schema: Union[Dict[str, Any], bytes]) -> CachedSchema:
+        """
+        Get the cached entry of a schema, parsing and validating it on a miss.
+
+        Args:
+            schema: Schema dictionary, or ``encode_schema`` bytes
+
+        Returns:
+            The cache entry
+
+        Raises:
+            ValueError: If the schema is invalid, or its bytes decompress
+                to more than ``MAX_SCHEMA_BYTES``
+        """
+        if isinstance(schema, bytes):
+            # The encoding is canonical JSON, so hash it without parsing
+            key = schema_hash(decompress_schema(schema))
+        else:
+            key = schema_hash(schema)
+
+        entry = self.lookup(key)
+        if entry is not None:
+            return entry
+
+        if isinstance(schema, bytes):
+            parsed = DataSchema.from_bytes(schema)
+        else:
+            parsed = DataSchema.from_dict(schema)
+        entry = CachedSchema(key, parsed)
+
+        with self._lock:
+            self.misses += 1
+            # Another thread may have parsed the same schema meanwhile
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def lookup(self, key: str) -> Optional[CachedSchema]:
+        """
+        Get a cached entry by content hash.
+
+        Args:
+            key: Content hash, e.g. from a previous ``get``
+
+        Returns:
+            The cache entry, or None if it is not (or no longer) cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def clear(self):
+        """Drop every cached schema."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Cache shared by the web API
+schema_cache = SchemaCache()
@@ -0,0 +1,224 @@
+"""
+Distribution fitting for SynGen schema inference.
+
+Every parametric family that suits a numeric column is fitted from the
+column profile's sufficient statistics (moments, log-moments, range) by
+maximum likelihood or the method of moments. The fits are then scored
+together on one set of quantile bins of the sampled values: a binned
+Kolmogorov-Smirnov distance checks that a fit is acceptable and a binned
+AIC picks the best of the acceptable ones.
+"""
+
+import numpy as np
+from scipy import special, stats
+from typing import Any, Dict, List, Optional, Tuple
+from .base import DistributionType
+from .profile import ColumnProfile
+
+
+# Number of quantile bins the fits are scored on
+FIT_BINS = 100
+
+# Largest binned KS distance of an acceptable fit
+MAX_KS_DISTANCE = 0.05
+
+# AIC difference below which fits count as equally good; the one with
+# fewer parameters is kept, so nested families (exponential in gamma,
+# Poisson in binomial) are not replaced by their generalization by chance
+AIC_TOLERANCE = 2.0
+
+# Number of knots of the quantile table of columns no family fits
+EMPIRICAL_KNOTS = 1024
+
+# Number of fitted parameters, for the AIC penalty
+PARAMETER_COUNTS = {
+    DistributionType.NORMAL: 2,
+    DistributionType.UNIFORM: 2,
+    DistributionType.EXPONENTIAL: 1,
+    DistributionType.GAMMA: 2,
+    DistributionType.BETA: 2,
+    DistributionType.WEIBULL: 2,
+    DistributionType.POISSON: 1,
+    DistributionType.BINOMIAL: 2,
+    DistributionType.GEOMETRIC: 1,
+}
+
+Fit = Tuple[DistributionType, Dict[str, Any]]
+
+
+def frozen_distribution(distribution: DistributionType, parameters: Dict[str, Any]) -> Optional[Any]:
+    """
+    Get the scipy distribution matching a schema distribution.
+
+    Uses the same parameter names and defaults as the samplers of
+    ``DistributionGenerator``.
+
+    Args:
+        distribution: Type of distribution
+        parameters: Distribution parameters
+
+    Returns:
+        Frozen scipy distribution, or None if there is no parametric one
+    """
+    if distribution == DistributionType.NORMAL:
+        return stats.norm(loc=parameters.get('mean', 0.0), scale=parameters.get('std', 1.0))
+    elif distribution == DistributionType.UNIFORM:
+        low = parameters.get('low', 0.0)
+        return stats.uniform(loc=low, scale=parameters.get('high', 1.0) - low)
+    elif distribution == DistributionType.EXPONENTIAL:
+        return stats.expon(scale=parameters.get('scale', 1.0))
+    elif distribution == DistributionType.GAMMA:
+        return stats.gamma(parameters.get('shape', 1.0), scale=parameters.get('scale', 1.0))
+    elif distribution == DistributionType.BETA:
+        return stats.beta(parameters.get('a', 1.0), parameters.get('b', 1.0))
+    elif distribution == DistributionType.WEIBULL:
+        return stats.weibull_min(parameters.get('shape', 1.0), scale=parameters.get('scale', 1.0))
+    elif distribution == DistributionType.POISSON:
+        return stats.poisson(parameters.get('lam', 1.0))
+    elif distribution == DistributionType.BINOMIAL:
+        return stats.binom(parameters.get('n', 1), parameters.get('p', 0.5))
+    elif distribution == DistributionType.GEOMETRIC:
+        return stats.geom(parameters.get('p', 0.5))
+    return None
+
+
+def candidate_fits(profile: ColumnProfile, integer: bool = False) -> List[Fit]:
+    """
+    Fit every family that suits the range of a numeric column.
+
+    Args:
+        profile: Numeric column profile with a positive variance
+        integer: Whether the column holds integers, which adds the
+            discrete families
+
+    Returns:
+        Fitted (distribution, parameters) pairs
+    """
+    mean, var = profile.mean, profile.std ** 2
+    low, high = float(profile.min), float(profile.max)
+
+    fits: List[Fit] = [
+        (DistributionType.NORMAL, {'mean': mean, 'std': float(np.sqrt(var))}),
+        (DistributionType.UNIFORM, {'low': low, 'high': high}),
+    ]
+
+    if low >= 0:
+        fits.append((DistributionType.EXPONENTIAL, {'scale': mean}))
+
+    # Log-moments cover every value only when all values are positive
+    if low > 0 and profile.log_moments.count > 1:
+        log_mean = float(profile.log_moments.mean[0])
+        log_std = float(np.sqrt(profile.log_moments.covariance().iloc[0, 0]))
+        gap = np.log(mean) - log_mean
+        if gap > 0:
+            shape = _gamma_shape(gap)
+            fits.append((DistributionType.GAMMA, {'shape': shape, 'scale': mean / shape}))
+        if log_std > 0:
+            # log X is Gumbel-distributed with variance pi^2 / (6 k^2)
+            shape = float(np.pi / (np.sqrt(6) * log_std))
+            fits.append((DistributionType.WEIBULL, {
+                'shape': shape,
+                'scale': float(np.exp(log_mean + np.euler_gamma / shape))
+            }))
+
+    if not integer and low >= 0 and high <= 1:
+        common = mean * (1 - mean) / var - 1
+        if common > 0:
+            fits.append((DistributionType.BETA, {'a': mean * common, 'b': (1 - mean) * common}))
+
+    if integer and low >= 0:
+        fits.append((DistributionType.POISSON, {'lam': mean}))
+        if var < mean:
+            n = max(int(round(mean ** 2 / (mean - var))), int(high))
+            fits.append((DistributionType.BINOMIAL, {'n': n, 'p': mean / n}))
+        if low >= 1:
+            fits.append((DistributionType.GEOMETRIC, {'p': 1 / mean}))
+
+    return fits
+
+
+def score_fits(values: np.ndarray, fits: List[Fit], bins: int = FIT_BINS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score fitted distributions against observed values.
+
+    The values are cut into (at most) ``bins`` quantile bins; the CDFs of
+    all fits are evaluated at the bin edges as one array, from which the
+    binned KS distance and the binned AIC of every fit follow.
+
+    Args:
+        values: Observed values
+        fits: Fitted (distribution, parameters) pairs
+        bins: Number of quantile bins
+
+    Returns:
+        Binned KS distances and AICs, one per fit
+    """
+    values = np.sort(np.asarray(values, dtype=float))
+    n = len(values)
+    edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+
+    observed = np.searchsorted(values, edges, side='right') / n
+    expected = np.vstack([frozen_distribution(d, p).cdf(edges) for d, p in fits])
+
+    ks = np.abs(expected - observed).max(axis=1)
+
+    counts = np.diff(observed, prepend=0.0, append=1.0) * n
+    mass = np.diff(expected, axis=1, prepend=0.0, append=1.0)
+    log_likelihood = (counts * np.log(np.clip(mass, 1e-12, None))).sum(axis=1)
+    k = np.array([PARAMETER_COUNTS[d] for d, _ in fits])
+    aic = 2 * k - 2 * log_likelihood
+
+    return ks, aic
+
+
+def best_fit(profile: ColumnProfile, integer: bool = False) -> Optional[Fit]:
+    """
+    Pick the best-fitting family of a numeric column.
+
+    Args:
+        profile: Numeric column profile with a positive variance
+        integer: Whether the column holds integers
+
+    Returns:
+        The acceptable fit with the lowest AIC, preferring fewer parameters
+        within ``AIC_TOLERANCE``, or None if no family fits
+    """
+    fits = candidate_fits(profile, integer)
+    ks, aic = score_fits(profile.sample.values, fits)
+    aic[ks > MAX_KS_DISTANCE] = np.inf
+    if not np.isfinite(aic).any():
+        return None
+
+    k = np.array([PARAMETER_COUNTS[d] for d, _ in fits])
+    close = aic <= aic.min() + AIC_TOLERANCE
+    return fits[int(np.lexsort((aic, np.where(close, k, np.iinfo(int).max)))[0])]
+
+
+def empirical_quantiles(profile: ColumnProfile, knots: int = EMPIRICAL_KNOTS) -> List[float]:
+    """
+    Build the quantile table of an ``EMPIRICAL`` distribution.
+
+    The quantiles are interpolated between the values of the uniform
+    sample; the step quantiles of the sketch would repeat values across
+    neighbouring knots. The first and last knots are the exact minimum and
+    maximum.
+
+    Args:
+        profile: Numeric column profile
+        knots: Number of evenly spaced quantiles
+
+    Returns:
+        Quantile values at probabilities ``linspace(0, 1, knots)``
+    """
+    quantiles = np.quantile(profile.sample.values.astype(float), np.linspace(0, 1, knots))
+    quantiles[[0, -1]] = profile.min, profile.max
+    return np.maximum.accumulate(quantiles).tolist()
+
+
+def _gamma_shape(gap: float, iterations: int = 4) -> float:
+    """Gamma shape MLE from log(mean) - mean(log), by Newton's method."""
+    shape = (3 - gap + np.sqrt((gap - 3) ** 2 + 24 * gap)) / (12 * gap)
+    for _ in range(iterations):
+        step = (np.log(shape) - special.digamma(shape) - gap) / (1 / shape - special.polygamma(1, shape))
+        shape = max(shape - step, shape / 10)
+    return float(shape)
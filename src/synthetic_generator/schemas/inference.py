@@ -5,19 +5,79 @@ This module provides functionality to automatically infer
 data schemas from existing data.
 """
 
+import re
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 from .base import DataSchema, ColumnSchema, DataType, DistributionType
+from .profile import ColumnProfile, CorrelationProfile, profile_frame, merge_profiles
+from .fitting import best_fit, empirical_quantiles
+from .readers import list_data_files, iter_file_chunks_with_partitions, sample_rows
+from ..utils.parallel import parallel_map
+
+
+# Smallest absolute correlation kept in an inferred schema
+MIN_CORRELATION = 0.1
+
+# Fisher z-score a kept correlation must reach (two-sided p < 0.001)
+CORRELATION_Z = 3.29
+
+# Values checked against the text patterns, per column
+DETECTION_SAMPLE_SIZE = 1000
+
+# Text columns with a larger share of distinct values are identifiers
+# (emails, names, codes): they are drawn by the type's text generator, so
+# no real value is copied into the schema
+TEXT_DISTINCT_RATIO = 0.5
+
+# Most frequent values kept for other text columns; the rest of the
+# values share one OTHER_CATEGORY
+TEXT_TOP_VALUES = 20
+OTHER_CATEGORY = 'other'
+
+# Text patterns, in priority order; a value counts for the first group it matches
+_TEXT_GROUPS = {
+    DataType.DATETIME: r'\d{4}-\d{2}-\d{2}[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?',
+    DataType.DATE: r'\d{4}-\d{2}-\d{2}|\d{4}/\d{2}/\d{2}|\d{1,2}/\d{1,2}/\d{4}|\d{1,2}\.\d{1,2}\.\d{4}',
+    DataType.EMAIL: r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+    DataType.PHONE: r'\+?(?:\(?\d{1,4}\)?[\s.-]?)?(?:\(?\d{2,4}\)?[\s.-]?)?\d{3,4}[\s.-]?\d{4}',
+    DataType.ADDRESS: r'(?i:\d+[a-z]?\s+[^,]*\b(?:street|st|avenue|ave|road|rd|drive|dr|lane|ln|court|ct'
+                      r'|boulevard|blvd|way|place|pl|highway|hwy|freeway|parkway|pkwy)\b\.?(?:,.*)?)',
+    DataType.NAME: r"[A-Z][a-z]+(?:[ '-][A-Z][a-z]+){1,2}",
+}
+_TEXT_PATTERN = re.compile(
+    '^(?:' + '|'.join(f'(?P<{t.value}>{p})' for t, p in _TEXT_GROUPS.items()) + ')$'
+)
+
+# Share of sampled values that must match for a type to be chosen
+_TEXT_THRESHOLDS = {
+    DataType.DATETIME: 0.8,
+    DataType.DATE: 0.8,
+    DataType.EMAIL: 0.8,
+    DataType.PHONE: 0.8,
+    DataType.ADDRESS: 0.6,
+    DataType.NAME: 0.7,
+}
 
 
 class SchemaInferrer:
-    """Class for inferring data schemas from existing data."""
+    """
+    Class for inferring data schemas from existing data.
+    
+    Every column is first reduced to a mergeable ``ColumnProfile``, and the
+    schema is inferred from the profiles. In-memory DataFrames are
+    profiled exactly; files are profiled chunk by chunk with bounded
+    memory. Columns are independent, so they are profiled and inferred
+    concurrently; ``workers`` bounds the thread pool (1 runs serially).
+    Pairwise correlations of the numeric columns are accumulated alongside
+    in a ``CorrelationProfile``, and the significant ones are kept.
+    """
     
     @staticmethod
     def infer(
         data: pd.DataFrame, 
-        sample_size: Optional[int] = None
+        sample_size: Optional[int] = None,
+        workers: Optional[int] = None
     ) -> DataSchema:
         """
         Infer schema from existing data.
@@ -25,44 +85,209 @@ class SchemaInferrer:
         Args:
             data: Input DataFrame
             sample_size: Number of samples to use for inference
+            workers: Number of columns processed concurrently
             
         Returns:
             Inferred data schema
         """
-        # Sample data if specified
+        # Sample data if specified (files are sampled while reading, see infer_file)
         if sample_size and sample_size < len(data):
             data = data.sample(n=sample_size, random_state=42)
         
-        columns = []
+        # Exact profiles: every value is counted and sampled
+        size = max(len(data), 1)
+        correlations = CorrelationProfile()
+        profiles = profile_frame(
+            data, workers=workers, correlations=correlations, max_tracked_values=size, sample_size=size
+        )
+        return SchemaInferrer.infer_profiles(profiles, workers, correlations)
+    
+    @staticmethod
+    def infer_chunks(
+        chunks: Iterable[pd.DataFrame],
+        workers: Optional[int] = None,
+        **profile_options
+    ) -> DataSchema:
+        """
+        Infer schema from a sequence of DataFrame chunks of one table.
         
-        for col_name in data.columns:
-            col_data = data[col_name]
-            column_schema = SchemaInferrer._infer_column_schema(col_name, col_data)
-            columns.append(column_schema)
+        Args:
+            chunks: DataFrame chunks
+            workers: Number of columns processed concurrently
+            **profile_options: Options for ``ColumnProfile``
+                (max_tracked_values, sample_size, seed)
+            
+        Returns:
+            Inferred data schema
+        """
+        profiles: Dict[str, ColumnProfile] = {}
+        correlations = CorrelationProfile()
+        for chunk in chunks:
+            profile_frame(chunk, profiles, workers, correlations, **profile_options)
+        return SchemaInferrer.infer_profiles(profiles, workers, correlations)
+    
+    @staticmethod
+    def infer_file(
+        path: str,
+        sample_size: Optional[int] = None,
+        chunk_size: int = 100000,
+        workers: Optional[int] = None,
+        **profile_options
+    ) -> DataSchema:
+        """
+        Infer schema from a data file or a directory of data files.
         
-        return DataSchema(columns=columns)
-
-
-def infer_schema_from_data(data: pd.DataFrame, sample_size: Optional[int] = None) -> DataSchema:
-    """Convenience function to infer schema from data."""
-    return SchemaInferrer.infer(data, sample_size)
+        Without ``sample_size`` the whole table is profiled chunk by chunk
+        (see ``profile_file``). With ``sample_size``, a uniform sample of
+        rows is drawn while reading (see ``readers.sample_rows``), so only
+        the sample is ever held in memory, and it is profiled exactly.
+        
+        Args:
+            path: Data file or directory
+            sample_size: Number of rows to sample, or None to profile all rows
+            chunk_size: Rows per chunk or Parquet record batch
+            workers: Number of files, or of columns of a single file, read
+                concurrently
+            **profile_options: Options for ``ColumnProfile``
+        
+        Returns:
+            Inferred data schema
+        """
+        if sample_size:
+            data = sample_rows(path, sample_size, chunk_size=chunk_size, workers=workers)
+            return SchemaInferrer.infer(data, workers=workers)
+        
+        correlations = CorrelationProfile()
+        profiles = SchemaInferrer.profile_file(path, chunk_size, workers, correlations, **profile_options)
+        return SchemaInferrer.infer_profiles(profiles, workers, correlations)
+    
+    @staticmethod
+    def profile_file(
+        path: str,
+        chunk_size: int = 100000,
+        workers: Optional[int] = None,
+        correlations: Optional[CorrelationProfile] = None,
+        **profile_options
+    ) -> Dict[str, ColumnProfile]:
+        """
+        Profile a data file, or a directory of files, chunk by chunk.
+        
+        Memory is bounded by the chunk size and the profile sizes, not by
+        the size of the data. The files of a directory are profiled in
+        parallel and their profiles merged in file order; the columns of a
+        single file are profiled in parallel instead.
+        
+        Args:
+            path: CSV, JSON (Lines), Parquet or Excel file, or a directory
+                of them (Hive partition values become columns)
+            chunk_size: Rows per chunk or Parquet record batch
+            workers: Number of files (or columns) profiled concurrently;
+                None lets the thread pool decide
+            correlations: Correlation profile to update with the file's
+                rows, if any
+            **profile_options: Options for ``ColumnProfile``
+                (max_tracked_values, sample_size, seed)
+            
+        Returns:
+            Profiles keyed by column
+        """
+        profile_options.setdefault('seed', 42)
+        files = list_data_files(path)
+        
+        # Parallelize over files, or over columns when there is one file
+        column_workers = workers if len(files) == 1 else 1
+        
+        def profile_one(file_path: str) -> Tuple[Dict[str, ColumnProfile], CorrelationProfile]:
+            profiles: Dict[str, ColumnProfile] = {}
+            file_correlations = CorrelationProfile()
+            for chunk in iter_file_chunks_with_partitions(file_path, path, chunk_size):
+                profile_frame(chunk, profiles, column_workers, file_correlations, **profile_options)
+            return profiles, file_correlations
+        
+        results = parallel_map(profile_one, files, workers)
+        
+        profiles: Dict[str, ColumnProfile] = {}
+        for result, file_correlations in results:
+            profiles = merge_profiles(profiles, result)
+            if correlations is not None:
+                correlations.merge(file_correlations)
+        return profiles
     
+    @staticmethod
+    def infer_profiles(
+        profiles: Dict[str, ColumnProfile],
+        workers: Optional[int] = None,
+        correlations: Optional[CorrelationProfile] = None
+    ) -> DataSchema:
+        """
+        Infer schema from column profiles.
+        
+        Args:
+            profiles: Profiles keyed by column, in column order
+            workers: Number of columns inferred concurrently
+            correlations: Correlation profile of the same rows, if any
+            
+        Returns:
+            Inferred data schema
+        """
+        columns = parallel_map(SchemaInferrer._infer_column_schema, profiles.values(), workers)
+        
+        inferred = None
+        if correlations is not None:
+            numeric = [
+                column.name for column in columns
+                if column.data_type in [DataType.INTEGER, DataType.FLOAT]
+                and column.distribution != DistributionType.CONSTANT
+            ]
+            inferred = SchemaInferrer._infer_correlations(correlations, numeric)
+        
+        return DataSchema(columns=columns, correlations=inferred)
     
     @staticmethod
-    def _infer_column_schema(column_name: str, column_data: pd.Series) -> ColumnSchema:
+    def _infer_correlations(
+        correlations: CorrelationProfile,
+        names: List[str]
+    ) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Keep the significant correlations between the given columns.
+        
+        A pair is kept if its absolute correlation reaches
+        ``MIN_CORRELATION`` and its Fisher z-score ``atanh(r) sqrt(n - 3)``
+        reaches ``CORRELATION_Z``. Both tests run on the whole matrix at
+        once; only the kept pairs are visited.
+        """
+        names = [name for name in names if name in correlations.columns]
+        if len(names) < 2:
+            return None
+        
+        matrix = correlations.correlation().loc[names, names].to_numpy()
+        index = [correlations.columns.index(name) for name in names]
+        n = correlations.n[np.ix_(index, index)]
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z = np.abs(np.arctanh(np.clip(matrix, -0.999999, 0.999999))) * np.sqrt(np.maximum(n - 3, 0))
+        keep = np.triu((np.abs(matrix) >= MIN_CORRELATION) & (z >= CORRELATION_Z), k=1)
+        
+        inferred: Dict[str, Dict[str, float]] = {}
+        for i, j in zip(*np.nonzero(keep)):
+            inferred.setdefault(names[i], {})[names[j]] = float(matrix[i, j])
+        return inferred or None
+    
+    @staticmethod
+    def _infer_column_schema(profile: ColumnProfile) -> ColumnSchema:
         """Infer schema for a single column."""
         
         # Determine data type
-        data_type = SchemaInferrer._infer_data_type(column_data)
+        data_type = SchemaInferrer._infer_data_type(profile)
         
         # Determine distribution
-        distribution, parameters = SchemaInferrer._infer_distribution(column_data, data_type)
+        distribution, parameters = SchemaInferrer._infer_distribution(profile, data_type)
         
         # Determine constraints
-        constraints = SchemaInferrer._infer_constraints(column_data, data_type)
+        constraints = SchemaInferrer._infer_constraints(profile, data_type)
         
         return ColumnSchema(
-            name=column_name,
+            name=profile.name,
             data_type=data_type,
             distribution=distribution,
             parameters=parameters,
@@ -70,160 +295,162 @@ def infer_schema_from_data(data: pd.DataFrame, sample_size: Optional[int] = None
         )
     
     @staticmethod
-    def _infer_data_type(column_data: pd.Series) -> DataType:
-        """Infer data type from column data."""
+    def _infer_data_type(profile: ColumnProfile) -> DataType:
+        """Infer data type from a column profile."""
         
         # Handle missing values
-        non_null_data = column_data.dropna()
-        
-        if len(non_null_data) == 0:
+        if profile.non_null_count == 0:
             return DataType.STRING
         
         # Check for boolean first (before numeric)
-        if pd.api.types.is_bool_dtype(column_data):
+        if pd.api.types.is_bool_dtype(profile.dtype):
             return DataType.BOOLEAN
         
         # Check for numeric types
-        if pd.api.types.is_numeric_dtype(column_data):
-            if pd.api.types.is_integer_dtype(column_data):
+        if pd.api.types.is_numeric_dtype(profile.dtype):
+            if pd.api.types.is_integer_dtype(profile.dtype):
                 return DataType.INTEGER
             else:
                 return DataType.FLOAT
         
         # Check for datetime
-        if pd.api.types.is_datetime64_any_dtype(column_data):
+        if pd.api.types.is_datetime64_any_dtype(profile.dtype):
             return DataType.DATETIME
         
-        # Check for date (simplified check)
-        try:
-            # Try to convert to datetime to see if it's a date
-            pd.to_datetime(column_data.iloc[0])
-            return DataType.DATE
-        except:
-            pass
-        
-        # Check for specific text patterns
-        sample_values = non_null_data.head(100).astype(str)
-        
-        # Check for email pattern
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if sample_values.str.match(email_pattern).mean() > 0.8:
-            return DataType.EMAIL
-        
-        # Check for phone pattern
-        phone_pattern = r'^[\+]?[1-9][\d]{0,15}$'
-        if sample_values.str.replace(r'[^\d+]', '', regex=True).str.match(phone_pattern).mean() > 0.8:
-            return DataType.PHONE
-        
-        # Check for address pattern (contains street, city, state, zip)
-        address_indicators = ['street', 'avenue', 'road', 'drive', 'lane', 'court']
-        if any(indicator in ' '.join(sample_values).lower() for indicator in address_indicators):
-            return DataType.ADDRESS
-        
-        # Check for name pattern (first last format)
-        name_pattern = r'^[A-Z][a-z]+ [A-Z][a-z]+$'
-        if sample_values.str.match(name_pattern).mean() > 0.7:
-            return DataType.NAME
+        # Check for text patterns (dates, emails, phones, ...) in one pass
+        text_type = SchemaInferrer._detect_text_type(profile.sample_series())
+        if text_type is not None:
+            return text_type
         
         # Check for categorical
-        unique_ratio = len(non_null_data.unique()) / len(non_null_data)
+        unique_ratio = profile.distinct_count / profile.non_null_count
         if unique_ratio < 0.1:  # Less than 10% unique values
             return DataType.CATEGORICAL
         
         return DataType.STRING
     
+    @staticmethod
+    def _detect_text_type(values: pd.Series) -> Optional[DataType]:
+        """
+        Score every text pattern on a bounded sample and pick the best one.
+        
+        One anchored regex with a named group per type is matched against
+        every sampled value at once; a value counts for the first type
+        whose group matches. The type with the highest share of matches
+        wins if the share reaches that type's threshold.
+        """
+        values = values.iloc[:DETECTION_SAMPLE_SIZE].astype(str).str.strip()
+        if len(values) == 0:
+            return None
+        
+        matches = values.str.extract(_TEXT_PATTERN)
+        scores = matches.notna().mean()
+        
+        best, best_score = None, 0.0
+        for data_type, threshold in _TEXT_THRESHOLDS.items():
+            score = scores[data_type.value]
+            if score >= threshold and score > best_score:
+                best, best_score = data_type, score
+        return best
+    
     @staticmethod
     def _infer_distribution(
-        column_data: pd.Series, 
+        profile: ColumnProfile, 
         data_type: DataType
     ) -> tuple[DistributionType, Dict[str, Any]]:
-        """Infer distribution and parameters from column data."""
-        
-        non_null_data = column_data.dropna()
+        """Infer distribution and parameters from a column profile."""
         
-        if len(non_null_data) == 0:
+        if profile.non_null_count == 0:
             return DistributionType.CONSTANT, {'value': None}
         
         if data_type in [DataType.INTEGER, DataType.FLOAT]:
-            return SchemaInferrer._infer_numeric_distribution(non_null_data)
+            return SchemaInferrer._infer_numeric_distribution(profile)
         elif data_type == DataType.CATEGORICAL:
-            return SchemaInferrer._infer_categorical_distribution(non_null_data)
+            return SchemaInferrer._infer_categorical_distribution(profile)
+        elif data_type in [DataType.DATE, DataType.DATETIME]:
+            return SchemaInferrer._infer_temporal_distribution(profile, data_type)
         elif data_type == DataType.BOOLEAN:
+            counts = profile.frequent.counts
             return DistributionType.CATEGORICAL, {
                 'categories': [True, False],
                 'probabilities': [
-                    (non_null_data == True).mean(),
-                    (non_null_data == False).mean()
+                    counts.get(True, 0) / profile.non_null_count,
+                    counts.get(False, 0) / profile.non_null_count
                 ]
             }
         else:
             # For text data, use categorical distribution
-            unique_values = non_null_data.unique()
-            if len(unique_values) <= 20:  # Small number of unique values
+            if profile.distinct_count <= 20:  # Small number of unique values
                 return DistributionType.CATEGORICAL, {
-                    'categories': unique_values.tolist()
+                    'categories': profile.frequent.counts.index.tolist()
                 }
+            elif profile.distinct_count / profile.non_null_count > TEXT_DISTINCT_RATIO:
+                return SchemaInferrer._infer_text_distribution(profile, data_type)
             else:
-                return DistributionType.UNIFORM, {}  # Default for text
+                return SchemaInferrer._infer_top_values(profile)
+    
+    @staticmethod
+    def _infer_text_distribution(
+        profile: ColumnProfile,
+        data_type: DataType
+    ) -> tuple[DistributionType, Dict[str, Any]]:
+        """Infer a text generator for identifier-like columns; plain strings keep their lengths."""
+        parameters = {}
+        if data_type == DataType.STRING:
+            lengths = profile.sample_series().astype(str).str.len()
+            parameters = {'min_length': int(lengths.min()), 'max_length': int(lengths.max())}
+        return DistributionType.UNIFORM, parameters
     
     @staticmethod
-    def _infer_numeric_distribution(column_data: pd.Series) -> tuple[DistributionType, Dict[str, Any]]:
+    def _infer_top_values(profile: ColumnProfile) -> tuple[DistributionType, Dict[str, Any]]:
+        """Infer the most frequent text values, with the others in one bucket."""
+        value_counts = profile.frequent.top(TEXT_TOP_VALUES)
+        categories = value_counts.index.tolist()
+        probabilities = (value_counts / profile.non_null_count).tolist()
+        
+        rest = 1.0 - sum(probabilities)
+        if rest > 0 and OTHER_CATEGORY not in categories:
+            categories.append(OTHER_CATEGORY)
+            probabilities.append(rest)
+        
+        return DistributionType.CATEGORICAL, {
+            'categories': categories,
+            'probabilities': probabilities
+        }
+    
+    @staticmethod
+    def _infer_numeric_distribution(profile: ColumnProfile) -> tuple[DistributionType, Dict[str, Any]]:
         """Infer distribution for numeric data."""
         
         # Safety check: ensure we have numeric data
-        if not pd.api.types.is_numeric_dtype(column_data):
+        if not profile.is_numeric:
             # If not numeric, treat as categorical
             return DistributionType.CATEGORICAL, {
-                'categories': column_data.unique().tolist()
+                'categories': profile.frequent.counts.index.tolist()
             }
         
         # Check if it's constant
-        if column_data.nunique() == 1:
-            return DistributionType.CONSTANT, {'value': column_data.iloc[0]}
+        if profile.distinct_count == 1:
+            value = profile.frequent.counts.index[0]
+            return DistributionType.CONSTANT, {'value': value.item() if hasattr(value, 'item') else value}
         
-        # Calculate basic statistics
-        mean_val = column_data.mean()
-        std_val = column_data.std()
-        min_val = column_data.min()
-        max_val = column_data.max()
+        mean_val = profile.mean
+        std_val = profile.std
         
-        # Check for normal distribution
+        # Fit every suitable family and keep the best acceptable one
         if std_val > 0:
-            # Simple normality test (check if 68% of data is within 1 std)
-            within_one_std = ((column_data >= mean_val - std_val) & 
-                             (column_data <= mean_val + std_val)).mean()
-            
-            if 0.6 <= within_one_std <= 0.8:
-                return DistributionType.NORMAL, {
-                    'mean': mean_val,
-                    'std': std_val
-                }
-        
-        # Check for uniform distribution
-        range_val = max_val - min_val
-        if range_val > 0:
-            # Check if data is roughly uniform
-            bins = np.linspace(min_val, max_val, 10)
-            hist, _ = np.histogram(column_data, bins=bins)
-            hist_std = hist.std()
-            hist_mean = hist.mean()
+            fit = best_fit(profile, integer=pd.api.types.is_integer_dtype(profile.dtype))
+            if fit is not None:
+                distribution, parameters = fit
+                if distribution == DistributionType.UNIFORM:
+                    parameters = {
+                        'low': SchemaInferrer._typed(profile, profile.min),
+                        'high': SchemaInferrer._typed(profile, profile.max)
+                    }
+                return distribution, parameters
             
-            if hist_std / hist_mean < 0.5:  # Low variance in histogram
-                return DistributionType.UNIFORM, {
-                    'low': min_val,
-                    'high': max_val
-                }
-        
-        # Check for exponential distribution
-        if min_val >= 0:
-            # Simple exponential test
-            exp_mean = column_data.mean()
-            exp_std = column_data.std()
-            
-            if abs(exp_mean - exp_std) / exp_mean < 0.2:  # Mean ≈ std for exponential
-                return DistributionType.EXPONENTIAL, {
-                    'scale': exp_mean
-                }
+            # No family fits: keep the shape as a table of quantiles
+            return DistributionType.EMPIRICAL, {'quantiles': empirical_quantiles(profile)}
         
         # Default to normal distribution
         return DistributionType.NORMAL, {
@@ -232,12 +459,39 @@ def infer_schema_from_data(data: pd.DataFrame, sample_size: Optional[int] = None
         }
     
     @staticmethod
-    def _infer_categorical_distribution(column_data: pd.Series) -> tuple[DistributionType, Dict[str, Any]]:
+    def _infer_temporal_distribution(
+        profile: ColumnProfile,
+        data_type: DataType
+    ) -> tuple[DistributionType, Dict[str, Any]]:
+        """Infer a uniform date/datetime range."""
+        
+        if profile.min is not None:
+            low, high = pd.Timestamp(profile.min), pd.Timestamp(profile.max)
+        else:
+            # Text dates: take the range of the parsed sample
+            parsed = pd.to_datetime(profile.sample_series(), errors='coerce')
+            low, high = parsed.min(), parsed.max()
+        
+        if pd.isna(low):
+            return DistributionType.CONSTANT, {'value': None}
+        
+        if data_type == DataType.DATE:
+            return DistributionType.UNIFORM, {
+                'start_date': low.strftime('%Y-%m-%d'),
+                'end_date': high.strftime('%Y-%m-%d')
+            }
+        return DistributionType.UNIFORM, {
+            'start_datetime': low.isoformat(),
+            'end_datetime': high.isoformat()
+        }
+    
+    @staticmethod
+    def _infer_categorical_distribution(profile: ColumnProfile) -> tuple[DistributionType, Dict[str, Any]]:
         """Infer distribution for categorical data."""
         
-        value_counts = column_data.value_counts()
+        value_counts = profile.frequent.top()
         categories = value_counts.index.tolist()
-        probabilities = (value_counts / len(column_data)).tolist()
+        probabilities = (value_counts / profile.non_null_count).tolist()
         
         return DistributionType.CATEGORICAL, {
             'categories': categories,
@@ -246,28 +500,48 @@ def infer_schema_from_data(data: pd.DataFrame, sample_size: Optional[int] = None
     
     @staticmethod
     def _infer_constraints(
-        column_data: pd.Series, 
+        profile: ColumnProfile, 
         data_type: DataType
     ) -> Dict[str, Any]:
-        """Infer constraints from column data."""
+        """Infer constraints from a column profile."""
         
         constraints = {}
         
         # Check for uniqueness
-        if column_data.nunique() == len(column_data):
+        if profile.null_count == 0 and SchemaInferrer._all_distinct(profile):
             constraints['unique'] = True
         
         # Check for null probability
-        null_prob = column_data.isnull().mean()
+        null_prob = profile.null_count / profile.count if profile.count else 0.0
         if null_prob > 0:
             constraints['null_probability'] = null_prob
             constraints['nullable'] = True
         
         # Check for min/max values for numeric data
         if data_type in [DataType.INTEGER, DataType.FLOAT]:
-            non_null_data = column_data.dropna()
-            if len(non_null_data) > 0:
-                constraints['min_value'] = non_null_data.min()
-                constraints['max_value'] = non_null_data.max()
+            if profile.min is not None:
+                constraints['min_value'] = SchemaInferrer._typed(profile, profile.min)
+                constraints['max_value'] = SchemaInferrer._typed(profile, profile.max)
         
-        return constraints 
\ No newline at end of file
+        return constraints
+    
+    @staticmethod
+    def _all_distinct(profile: ColumnProfile) -> bool:
+        """Whether every non-null value is distinct."""
+        if profile.frequent.exact:
+            return len(profile.frequent.counts) == profile.non_null_count
+        # Past the exact counter, accept estimates within three standard errors
+        estimate = profile.distinct.count()
+        return estimate >= profile.non_null_count * (1 - 3 * profile.distinct.relative_error)
+    
+    @staticmethod
+    def _typed(profile: ColumnProfile, value: float) -> Any:
+        """Return a statistic as an int for integer columns."""
+        if pd.api.types.is_integer_dtype(profile.dtype):
+            return int(value)
+        return float(value)
+
+
+def infer_schema_from_data(data: pd.DataFrame, sample_size: Optional[int] = None) -> DataSchema:
+    """Convenience function to infer schema from data."""
+    return SchemaInferrer.infer(data, sample_size)
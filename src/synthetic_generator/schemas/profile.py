@@ -0,0 +1,390 @@
+"""
+Column profiles for SynGen schema inference.
+
+A profile summarizes one column with bounded memory: counts, moments,
+min/max, a distinct-count sketch, frequent values, a quantile sketch and a
+uniform sample. Profiles are fed chunk by chunk and merge with profiles of
+other chunks or files, so a schema can be inferred from data that does not
+fit in memory. A ``CorrelationProfile`` does the same for the pairwise
+correlations of the numeric columns.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+from ..utils.sketches import (
+    OnlineCovariance, QuantileSketch, HyperLogLog, FrequentItems, ReservoirSample
+)
+from ..utils.parallel import parallel_map
+
+
+class ColumnProfile:
+    """
+    Mergeable summary of a single column.
+
+    Attributes:
+        name: Column name
+        dtype: Common dtype of all chunks seen
+        count: Number of values, including missing ones
+        null_count: Number of missing values
+        min: Minimum of a numeric or datetime column
+        max: Maximum of a numeric or datetime column
+        moments: Running mean and variance of a numeric column
+        log_moments: Running mean and variance of the logs of the positive
+            values of a numeric column
+        quantiles: Quantile sketch of a numeric column
+        distinct: Distinct-count sketch
+        frequent: Counts of the most frequent values
+        sample: Uniform sample of the non-null values
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_tracked_values: int = 10000,
+        sample_size: int = 10000,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize an empty profile.
+
+        Args:
+            name: Column name
+            max_tracked_values: Number of distinct values counted exactly
+            sample_size: Size of the uniform sample of values
+            seed: Seed for the sample and the quantile sketch
+        """
+        self.name = name
+        self.dtype: Optional[np.dtype] = None
+        self.count = 0
+        self.null_count = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.moments = OnlineCovariance([name])
+        self.log_moments = OnlineCovariance([name])
+        self.quantiles = QuantileSketch(seed=seed)
+        self.distinct = HyperLogLog()
+        self.frequent = FrequentItems(max_tracked_values)
+        self.sample = ReservoirSample(sample_size, seed=seed)
+
+    @classmethod
+    def from_series(cls, data: pd.Series, **kwargs) -> 'ColumnProfile':
+        """Profile a whole in-memory column."""
+        return cls(str(data.name), **kwargs).update(data)
+
+    @property
+    def non_null_count(self) -> int:
+        """Number of non-missing values."""
+        return self.count - self.null_count
+
+    @property
+    def is_numeric(self) -> bool:
+        """Whether the column is numeric (booleans excluded)."""
+        return self.dtype is not None and self._numeric(self.dtype)
+
+    @property
+    def distinct_count(self) -> float:
+        """Number of distinct non-null values; estimated once too many to count."""
+        if self.frequent.exact:
+            return len(self.frequent.counts)
+        return self.distinct.count()
+
+    @property
+    def mean(self) -> float:
+        """Mean of a numeric column."""
+        return float(self.moments.mean[0]) if self.moments.count else np.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of a numeric column."""
+        return float(np.sqrt(self.moments.covariance().iloc[0, 0]))
+
+    def sample_series(self) -> pd.Series:
+        """The sampled non-null values, with the column's dtype where possible."""
+        values = pd.Series(self.sample.values, name=self.name)
+        if self.dtype is not None and values.dtype != self.dtype:
+            try:
+                values = values.astype(self.dtype)
+            except (TypeError, ValueError):
+                pass
+        return values
+
+    def update(self, data: pd.Series) -> 'ColumnProfile':
+        """
+        Add a chunk of the column.
+
+        Args:
+            data: Column values
+
+        Returns:
+            This profile, for chaining
+        """
+        if len(data) == 0:
+            return self
+
+        self._merge_dtype(data.dtype)
+
+        missing = data.isna()
+        n_missing = int(missing.sum())
+        values = data[~missing] if n_missing else data
+        self.count += len(data)
+        self.null_count += n_missing
+
+        if len(values):
+            if self._numeric(values.dtype):
+                numbers = values.to_numpy(dtype=float)
+                self.moments.update(numbers[:, None])
+                positive = numbers[numbers > 0]
+                self.log_moments.update(np.log(positive)[:, None])
+                self.quantiles.update(numbers)
+                self._merge_range(numbers.min(), numbers.max())
+                # Hash as floats so 1 and 1.0 from differently typed chunks agree
+                self.distinct.update(numbers)
+            else:
+                if pd.api.types.is_datetime64_any_dtype(values.dtype):
+                    self._merge_range(values.min(), values.max())
+                self.distinct.update(values)
+            self.frequent.update(values)
+            self.sample.update(values)
+
+        return self
+
+    def merge(self, other: 'ColumnProfile') -> 'ColumnProfile':
+        """
+        Fold the profile of later rows of the same column into this one.
+
+        Args:
+            other: Profile of the rows that follow this profile's rows
+
+        Returns:
+            This profile, for chaining
+        """
+        if other.count == 0:
+            return self
+        self._merge_dtype(other.dtype)
+
+        self.count += other.count
+        self.null_count += other.null_count
+        if other.min is not None:
+            self._merge_range(other.min, other.max)
+
+        self.moments.merge(other.moments)
+        self.log_moments.merge(other.log_moments)
+        self.quantiles.merge(other.quantiles)
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        self.sample.merge(other.sample)
+        return self
+
+    @staticmethod
+    def _numeric(dtype: np.dtype) -> bool:
+        """Numeric and not boolean."""
+        return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+    def _merge_dtype(self, dtype: Optional[np.dtype]):
+        """Widen the column dtype the way a single read of all chunks would."""
+        if dtype is None:
+            return
+        # np.dtype(None) is float64, so None must be checked before comparing
+        if self.dtype is None:
+            self.dtype = dtype
+        elif self.dtype == dtype:
+            return
+        elif self._numeric(self.dtype) and self._numeric(dtype):
+            self.dtype = np.promote_types(self.dtype, dtype)
+        else:
+            self.dtype = np.dtype(object)
+
+    def _merge_range(self, low: Any, high: Any):
+        """Extend the observed range."""
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+
+class CorrelationProfile:
+    """
+    Mergeable pairwise correlations of the numeric columns of a table.
+
+    For every pair of columns, the count, sums, sums of squares and sum of
+    products over the rows where both are present are accumulated with one
+    set of matrix products per chunk, so missing values only drop the
+    pairs they affect. Values are shifted by a per-column reference (the
+    mean of the first chunk) to keep the sums well conditioned.
+
+    Attributes:
+        columns: Numeric columns seen, in order of appearance
+        shift: Reference value subtracted from each column
+        n: Pairwise counts
+        sums: ``sums[i, j]`` is the sum of column i where j is also present
+        squares: ``squares[i, j]`` is the sum of squares of column i where
+            j is also present
+        products: Pairwise sums of products
+    """
+
+    def __init__(self):
+        """Initialize an empty correlation profile."""
+        self.columns: List[str] = []
+        self.shift = np.empty(0)
+        self.n = np.empty((0, 0))
+        self.sums = np.empty((0, 0))
+        self.squares = np.empty((0, 0))
+        self.products = np.empty((0, 0))
+
+    def update(self, data: pd.DataFrame) -> 'CorrelationProfile':
+        """
+        Add a chunk of rows; non-numeric and boolean columns are ignored.
+
+        Args:
+            data: DataFrame chunk
+
+        Returns:
+            This profile, for chaining
+        """
+        names = [str(col) for col in data.columns]
+        numeric = [i for i, col in enumerate(data.columns) if ColumnProfile._numeric(data[col].dtype)]
+        if not numeric:
+            return self
+
+        block = data.iloc[:, numeric].to_numpy(dtype=float, na_value=np.nan)
+        present = ~np.isnan(block)
+        weights = present.astype(float)
+        filled = np.where(present, block, 0.0)
+        means = filled.sum(axis=0) / np.maximum(weights.sum(axis=0), 1)
+        index = self._index([names[i] for i in numeric], means)
+
+        shifted = np.where(present, filled - self.shift[index], 0.0)
+
+        cells = np.ix_(index, index)
+        self.n[cells] += weights.T @ weights
+        self.sums[cells] += shifted.T @ weights
+        self.squares[cells] += (shifted ** 2).T @ weights
+        self.products[cells] += shifted.T @ shifted
+        return self
+
+    def merge(self, other: 'CorrelationProfile') -> 'CorrelationProfile':
+        """
+        Fold the profile of other rows of the same table into this one.
+
+        Args:
+            other: Profile of other rows
+
+        Returns:
+            This profile, for chaining
+        """
+        if not other.columns:
+            return self
+        index = self._index(other.columns, other.shift)
+
+        # Re-express the other sums relative to this profile's shifts
+        d = other.shift - self.shift[index]
+        n, sums = other.n, other.sums
+        cells = np.ix_(index, index)
+        self.n[cells] += n
+        self.sums[cells] += sums + d[:, None] * n
+        self.squares[cells] += other.squares + 2 * d[:, None] * sums + d[:, None] ** 2 * n
+        self.products[cells] += other.products + d[:, None] * sums.T + d[None, :] * sums + np.outer(d, d) * n
+        return self
+
+    def correlation(self) -> pd.DataFrame:
+        """
+        Get the pairwise Pearson correlation matrix.
+
+        Returns:
+            Correlations labelled by column; NaN where a pair has fewer than
+            two rows or no variance
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self.sums / self.n
+            covariance = self.products / self.n - mean * mean.T
+            variance = self.squares / self.n - mean ** 2
+            values = covariance / np.sqrt(variance * variance.T)
+        values[self.n < 2] = np.nan
+        return pd.DataFrame(np.clip(values, -1, 1), index=self.columns, columns=self.columns)
+
+    def _index(self, names: List[str], shift: np.ndarray) -> np.ndarray:
+        """Positions of columns, adding new ones with the given shifts."""
+        new = [i for i, name in enumerate(names) if name not in self.columns]
+        if new:
+            size = len(self.columns) + len(new)
+            for attr in ['n', 'sums', 'squares', 'products']:
+                grown = np.zeros((size, size))
+                old = getattr(self, attr)
+                grown[:len(old), :len(old)] = old
+                setattr(self, attr, grown)
+            self.columns.extend(names[i] for i in new)
+            self.shift = np.concatenate([self.shift, np.asarray(shift, dtype=float)[new]])
+        position = {name: i for i, name in enumerate(self.columns)}
+        return np.array([position[name] for name in names], dtype=int)
+
+
+def profile_frame(
+    data: pd.DataFrame,
+    profiles: Optional[Dict[str, ColumnProfile]] = None,
+    workers: Optional[int] = 1,
+    correlations: Optional[CorrelationProfile] = None,
+    **kwargs
+) -> Dict[str, ColumnProfile]:
+    """
+    Profile the columns of a DataFrame chunk.
+
+    Args:
+        data: DataFrame chunk
+        profiles: Profiles of the previous chunks to update, if any
+        workers: Number of columns profiled concurrently; None lets the
+            thread pool decide
+        correlations: Correlation profile of the previous chunks to
+            update, if any
+        **kwargs: Arguments for new ``ColumnProfile`` objects
+
+    Returns:
+        Profiles keyed by column, in column order
+    """
+    if profiles is None:
+        profiles = {}
+    if correlations is not None:
+        correlations.update(data)
+    names = [str(col) for col in data.columns]
+    for name in names:
+        if name not in profiles:
+            profiles[name] = ColumnProfile(name, **kwargs)
+
+    # Each column updates its own profile, so columns can run concurrently
+    parallel_map(
+        lambda i: profiles[names[i]].update(data.iloc[:, i]),
+        range(len(names)),
+        workers
+    )
+    return profiles
+
+
+def merge_profiles(
+    left: Dict[str, ColumnProfile],
+    right: Dict[str, ColumnProfile]
+) -> Dict[str, ColumnProfile]:
+    """
+    Merge the profiles of two consecutive parts of a table.
+
+    Columns missing on one side are treated as missing values there.
+
+    Args:
+        left: Profiles of the first part; updated in place
+        right: Profiles of the second part
+
+    Returns:
+        The merged profiles
+    """
+    left_rows = max((p.count for p in left.values()), default=0)
+    right_rows = max((p.count for p in right.values()), default=0)
+
+    for name, profile in right.items():
+        if name not in left:
+            left[name] = ColumnProfile(name, profile.frequent.capacity, profile.sample.capacity)
+            left[name].count = left[name].null_count = left_rows
+        left[name].merge(profile)
+
+    for name, profile in left.items():
+        if name not in right:
+            profile.count += right_rows
+            profile.null_count += right_rows
+
+    return left
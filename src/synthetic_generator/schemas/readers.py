@@ -0,0 +1,281 @@
+"""
+Chunked file readers for SynGen schema inference.
+
+These readers yield a table as a sequence of DataFrames, so large CSV,
+JSON Lines and Parquet files (or directories of them) can be profiled
+without loading them whole, or draw a uniform row sample from them while
+holding only the sample in memory.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..utils.parallel import parallel_map
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pq = None
+
+
+# Supported file extensions
+DATA_EXTENSIONS = ('.csv', '.json', '.jsonl', '.parquet', '.pq', '.xlsx', '.xls')
+
+# Rows read per sampled row when sampling Parquet: larger files are
+# sampled from a random subset of row groups holding about this many
+# rows per requested row
+PARQUET_ROWS_PER_SAMPLE = 20
+
+
+def list_data_files(path: str) -> List[str]:
+    """
+    List the data files of a table.
+
+    Args:
+        path: A data file, or a directory searched recursively (e.g. a
+            Hive-partitioned dataset)
+
+    Returns:
+        Sorted file paths
+    """
+    if not os.path.isdir(path):
+        return [path]
+
+    files = []
+    for root, dirs, names in os.walk(path):
+        # Skip hidden and metadata entries such as _SUCCESS or .crc files
+        dirs[:] = [d for d in dirs if not d.startswith(('.', '_'))]
+        for name in names:
+            if not name.startswith(('.', '_')) and name.lower().endswith(DATA_EXTENSIONS):
+                files.append(os.path.join(root, name))
+    return sorted(files)
+
+
+def partition_values(path: str, root: str) -> Dict[str, str]:
+    """
+    Get Hive partition values (``key=value`` directories) of a file.
+
+    Args:
+        path: File path
+        root: Dataset root directory
+
+    Returns:
+        Partition column values keyed by column
+    """
+    relative = os.path.relpath(os.path.dirname(path), root)
+    values = {}
+    for part in relative.split(os.sep):
+        if '=' in part:
+            key, value = part.split('=', 1)
+            values[key] = value
+    return values
+
+
+def iter_file_chunks(path: str, chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+    """
+    Read a data file as a sequence of DataFrames.
+
+    CSV and JSON Lines are read with pandas' ``chunksize``; Parquet files
+    are read one record batch at a time with pyarrow. Formats without a
+    streaming reader (JSON arrays, Excel, Parquet without pyarrow) are read
+    whole.
+
+    Args:
+        path: File path
+        chunk_size: Maximum rows per chunk
+
+    Yields:
+        DataFrame chunks
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        with pd.read_csv(path, chunksize=chunk_size) as reader:
+            yield from reader
+    elif ext == '.jsonl':
+        with pd.read_json(path, lines=True, chunksize=chunk_size) as reader:
+            yield from reader
+    elif ext == '.json':
+        yield pd.read_json(path)
+    elif ext in ('.parquet', '.pq'):
+        if pq is None:
+            yield pd.read_parquet(path)
+            return
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    elif ext in ('.xlsx', '.xls'):
+        yield pd.read_excel(path)
+    else:
+        # Fallback: try CSV
+        with pd.read_csv(path, chunksize=chunk_size) as reader:
+            yield from reader
+
+
+def iter_table_chunks(path: str, chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+    """
+    Read a file or a directory of files as a sequence of DataFrames.
+
+    Hive partition values of files in ``key=value`` directories are added
+    as columns.
+
+    Args:
+        path: File or directory path
+        chunk_size: Maximum rows per chunk
+
+    Yields:
+        DataFrame chunks
+    """
+    for file_path in list_data_files(path):
+        yield from iter_file_chunks_with_partitions(file_path, path, chunk_size)
+
+
+def iter_file_chunks_with_partitions(
+    path: str,
+    root: str,
+    chunk_size: int = 100000
+) -> Iterator[pd.DataFrame]:
+    """Read a file of a dataset, adding its Hive partition columns."""
+    partitions = partition_values(path, root) if os.path.isdir(root) else {}
+    for chunk in iter_file_chunks(path, chunk_size):
+        if partitions:
+            chunk = chunk.assign(**partitions)
+        yield chunk
+
+
+def sample_rows(
+    path: str,
+    sample_size: int,
+    seed: Optional[int] = 42,
+    chunk_size: int = 100000,
+    workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Draw a uniform random sample of rows from a file or a directory.
+    
+    Every row gets a uniform random key and the rows with the smallest
+    keys are kept (bottom-k sampling), so samples of separate files merge
+    into a uniform sample of the whole table. Streamed formats hold at most
+    ``sample_size`` rows plus one chunk. For Parquet, the smallest keys are
+    drawn directly from the row count in the file metadata, and large files
+    are sampled from a random subset of their row groups (see
+    ``PARQUET_ROWS_PER_SAMPLE``).
+    
+    Args:
+        path: File or directory path
+        sample_size: Number of rows to sample
+        seed: Random seed
+        chunk_size: Rows per chunk for streamed formats
+        workers: Number of files sampled concurrently
+        
+    Returns:
+        Sampled rows; ``attrs['source_rows']`` holds the number of rows read
+        from the source
+    """
+    if sample_size <= 0:
+        raise ValueError("sample_size must be positive")
+    
+    files = list_data_files(path)
+    seeds = np.random.SeedSequence(seed).spawn(len(files))
+    
+    def sample_one(i: int) -> Tuple[pd.DataFrame, np.ndarray, int]:
+        rng = np.random.default_rng(seeds[i])
+        sample, keys, rows = _sample_file(files[i], sample_size, rng, chunk_size)
+        partitions = partition_values(files[i], path) if os.path.isdir(path) else {}
+        if partitions:
+            sample = sample.assign(**partitions)
+        return sample, keys, rows
+    
+    results = parallel_map(sample_one, range(len(files)), workers)
+    
+    samples = [sample for sample, _, _ in results]
+    keys = np.concatenate([k for _, k, _ in results]) if results else np.empty(0)
+    sample, _ = _smallest_keys(
+        pd.concat(samples, ignore_index=True) if samples else pd.DataFrame(), keys, sample_size
+    )
+    sample.attrs['source_rows'] = sum(rows for _, _, rows in results)
+    return sample
+
+
+def _sample_file(
+    path: str,
+    sample_size: int,
+    rng: np.random.Generator,
+    chunk_size: int
+) -> Tuple[pd.DataFrame, np.ndarray, int]:
+    """Bottom-k sample of one file: (rows, their keys, rows in the file)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.pq') and pq is not None:
+        return _sample_parquet(path, sample_size, rng)
+    
+    sample, keys, rows = None, np.empty(0), 0
+    for chunk in iter_file_chunks(path, chunk_size):
+        chunk_keys = rng.random(len(chunk))
+        rows += len(chunk)
+        if sample is not None and len(sample) == sample_size:
+            # Only rows that beat the current k-th key can enter the sample
+            candidates = chunk_keys < keys.max()
+            chunk, chunk_keys = chunk[candidates], chunk_keys[candidates]
+        if sample is None:
+            sample, keys = chunk, chunk_keys
+        elif len(chunk):
+            sample = pd.concat([sample, chunk], ignore_index=True)
+            keys = np.concatenate([keys, chunk_keys])
+        sample, keys = _smallest_keys(sample, keys, sample_size)
+    
+    return (sample if sample is not None else pd.DataFrame()), keys, rows
+
+
+def _sample_parquet(
+    path: str,
+    sample_size: int,
+    rng: np.random.Generator
+) -> Tuple[pd.DataFrame, np.ndarray, int]:
+    """
+    Bottom-k sample of a Parquet file, reading a bounded number of rows.
+    
+    Files of up to ``PARQUET_ROWS_PER_SAMPLE * sample_size`` rows are
+    sampled uniformly. From larger files, row groups are first drawn with
+    probability proportional to their size, until they hold that many
+    rows, and the sample is drawn uniformly from them. Rows are then about
+    equally likely to be sampled whatever their group's size, but rows of one row group are sampled
+    together (a cluster sample), so a file whose row groups differ
+    systematically (e.g. sorted by a column) is represented by fewer
+    distinct groups than a uniform sample would be.
+    """
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    total = metadata.num_rows
+    k = min(sample_size, total)
+    
+    # The k smallest of `total` uniform keys, via exponential spacings
+    spacings = rng.standard_exponential(k) / (total - np.arange(k))
+    keys = rng.permutation(-np.expm1(-np.cumsum(spacings)))
+    if k == 0:
+        return parquet_file.schema_arrow.empty_table().to_pandas(), keys, total
+    
+    sizes = np.array([metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)])
+    budget = PARQUET_ROWS_PER_SAMPLE * k
+    if total <= budget:
+        groups = np.flatnonzero(sizes)
+    else:
+        # Size-weighted random order of the groups; read a prefix within budget
+        order = rng.choice(len(sizes), size=np.count_nonzero(sizes), replace=False, p=sizes / total)
+        count = int(np.searchsorted(np.cumsum(sizes[order]), max(budget, k))) + 1
+        groups = np.sort(order[:count])
+    
+    table = parquet_file.read_row_groups([int(g) for g in groups])
+    positions = np.sort(rng.choice(table.num_rows, k, replace=False))
+    return table.take(positions).to_pandas(), keys, total
+
+
+def _smallest_keys(
+    sample: pd.DataFrame,
+    keys: np.ndarray,
+    k: int
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Keep the k rows with the smallest keys."""
+    if len(keys) <= k:
+        return sample.reset_index(drop=True), keys
+    keep = np.sort(np.argpartition(keys, k - 1)[:k])
+    return sample.iloc[keep].reset_index(drop=True), keys[keep]
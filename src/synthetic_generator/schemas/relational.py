@@ -0,0 +1,142 @@
+"""
+Relational schemas for SynGen.
+
+A relational schema groups several table schemas with their primary keys
+and the foreign-key relationships between them, so that child tables only
+reference keys that exist in their parent tables.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from .base import DataSchema
+
+
+@dataclass
+class Relationship:
+    """
+    A foreign key from a child table to a parent table's primary key.
+
+    With ``fan_out``, the child table has one group of rows per parent row
+    and its size follows from the group sizes, drawn from
+    ``{'distribution': ..., 'parameters': ..., 'min': ..., 'max': ...}``
+    (e.g. ``{'distribution': 'poisson', 'parameters': {'lam': 4}}``).
+    With a ``max``, the child's primary keys are ``parent key * max + i``
+    for the i-th row of each group, so they are unique without numbering
+    the rows of other groups (which partitioned generation needs).
+    Without ``fan_out``, every child row references a parent row drawn uniformly.
+
+    ``orderings`` are ordering constraints between a child column
+    (``column1``) and a column of the referenced parent row (``column2``),
+    with the same options as a schema's ``ordering_constraints`` (e.g. a
+    ship date drawn as the order date plus an offset).
+    """
+
+    parent: str
+    child: str
+    foreign_key: str
+    fan_out: Optional[Dict[str, Any]] = None
+    orderings: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class RelationalSchema:
+    """Tables with primary keys and foreign-key relationships."""
+
+    tables: Dict[str, DataSchema]
+    primary_keys: Dict[str, str] = field(default_factory=dict)
+    relationships: List[Relationship] = field(default_factory=list)
+
+    def __post_init__(self):
+        """Validate schema after initialization."""
+        errors = self.validate()
+        if errors:
+            raise ValueError(f"Relational schema validation failed: {errors}")
+
+    def validate(self) -> List[str]:
+        """Validate the tables, keys and relationships."""
+        errors = []
+
+        for table in self.primary_keys:
+            if table not in self.tables:
+                errors.append(f"Primary key defined for undefined table: {table}")
+
+        fan_out_children = set()
+        for rel in self.relationships:
+            for table in [rel.parent, rel.child]:
+                if table not in self.tables:
+                    errors.append(f"Relationship references undefined table: {table}")
+            if rel.parent not in self.primary_keys:
+                errors.append(f"Parent table {rel.parent} has no primary key")
+            if rel.foreign_key == self.primary_keys.get(rel.child):
+                errors.append(f"Foreign key {rel.child}.{rel.foreign_key} is also its primary key")
+            if rel.fan_out is not None:
+                if rel.child in fan_out_children:
+                    errors.append(f"Table {rel.child} has more than one fan-out relationship")
+                fan_out_children.add(rel.child)
+                if 'distribution' not in rel.fan_out:
+                    errors.append(f"Fan-out of {rel.child}.{rel.foreign_key} requires a 'distribution'")
+            for ordering in rel.orderings:
+                for key, table in [('column1', rel.child), ('column2', rel.parent)]:
+                    if table in self.tables and ordering.get(key) not in {c.name for c in self.tables[table].columns}:
+                        errors.append(f"Ordering {key} {ordering.get(key)!r} is not a column of {table}")
+
+        if not errors:
+            try:
+                self.table_order()
+            except ValueError as e:
+                errors.append(str(e))
+
+        return errors
+
+    def table_order(self) -> List[str]:
+        """
+        Get the tables in dependency order: every parent before its children.
+
+        Returns:
+            Table names; independent tables keep their declared order
+
+        Raises:
+            ValueError: If the relationships form a cycle
+        """
+        parents = {table: {rel.parent for rel in self.relationships if rel.child == table} for table in self.tables}
+        order: List[str] = []
+        while len(order) < len(self.tables):
+            ready = [t for t in self.tables if t not in order and parents[t] <= set(order)]
+            if not ready:
+                cycle = [t for t in self.tables if t not in order]
+                raise ValueError(f"Relationships form a cycle between tables: {cycle}")
+            order.extend(ready)
+        return order
+
+    def fan_out_of(self, table: str) -> Optional[Relationship]:
+        """Get the relationship that sets the size of a table, if any."""
+        for rel in self.relationships:
+            if rel.child == table and rel.fan_out is not None:
+                return rel
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert schema to dictionary."""
+        return {
+            'tables': {name: schema.to_dict() for name, schema in self.tables.items()},
+            'primary_keys': self.primary_keys,
+            'relationships': [
+                {
+                    'parent': rel.parent,
+                    'child': rel.child,
+                    'foreign_key': rel.foreign_key,
+                    'fan_out': rel.fan_out,
+                    'orderings': rel.orderings
+                }
+                for rel in self.relationships
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RelationalSchema':
+        """Create schema from dictionary."""
+        return cls(
+            tables={name: DataSchema.from_dict(schema) for name, schema in data['tables'].items()},
+            primary_keys=data.get('primary_keys', {}),
+            relationships=[Relationship(**rel) for rel in data.get('relationships', [])]
+        )
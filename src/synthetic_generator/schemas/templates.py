@@ -5,8 +5,19 @@ This module provides pre-built templates for common use cases
 in synthetic data generation.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from .base import DataSchema, ColumnSchema, DataType, DistributionType
+from .relational import RelationalSchema
+
+
+# Nations of the relational benchmark template
+NATIONS = [
+    'ALGERIA', 'ARGENTINA', 'BRAZIL', 'CANADA', 'EGYPT',
+    'ETHIOPIA', 'FRANCE', 'GERMANY', 'INDIA', 'INDONESIA',
+    'IRAN', 'IRAQ', 'JAPAN', 'JORDAN', 'KENYA',
+    'MOROCCO', 'MOZAMBIQUE', 'PERU', 'CHINA', 'ROMANIA',
+    'SAUDI ARABIA', 'VIETNAM', 'RUSSIA', 'UNITED KINGDOM', 'UNITED STATES'
+]
 
 
 class TemplateLoader:
@@ -252,6 +263,188 @@ class TemplateLoader:
             ]
         }
     }
+
+    # Relational templates, with their table sizes at scale factor 1
+    _relational_templates = {
+        'tpch': {
+            'tables': {
+                'suppliers': {
+                    'columns': [
+                        {
+                            'name': 'nation',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': NATIONS}
+                        },
+                        {
+                            'name': 'account_balance',
+                            'data_type': 'float',
+                            'distribution': 'uniform',
+                            'parameters': {'low': -999.99, 'high': 9999.99}
+                        }
+                    ]
+                },
+                'products': {
+                    'columns': [
+                        {
+                            'name': 'brand',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': [f'Brand#{m}{n}' for m in range(1, 6) for n in range(1, 6)]}
+                        },
+                        {
+                            'name': 'container',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': ['SM BOX', 'SM PACK', 'MED BOX', 'MED PACK', 'LG BOX', 'LG PACK', 'JUMBO BOX', 'WRAP CASE']}
+                        },
+                        {
+                            'name': 'size',
+                            'data_type': 'integer',
+                            'distribution': 'uniform',
+                            'parameters': {'low': 1, 'high': 51}
+                        },
+                        {
+                            'name': 'retail_price',
+                            'data_type': 'float',
+                            'distribution': 'uniform',
+                            'parameters': {'low': 900.0, 'high': 2100.0}
+                        }
+                    ]
+                },
+                'customers': {
+                    'columns': [
+                        {
+                            'name': 'nation',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': NATIONS}
+                        },
+                        {
+                            'name': 'market_segment',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': ['AUTOMOBILE', 'BUILDING', 'FURNITURE', 'HOUSEHOLD', 'MACHINERY']}
+                        },
+                        {
+                            'name': 'account_balance',
+                            'data_type': 'float',
+                            'distribution': 'uniform',
+                            'parameters': {'low': -999.99, 'high': 9999.99}
+                        }
+                    ]
+                },
+                'orders': {
+                    'columns': [
+                        {
+                            'name': 'order_date',
+                            'data_type': 'date',
+                            'distribution': 'uniform',
+                            'parameters': {'start_date': '1992-01-01', 'end_date': '1998-08-02'}
+                        },
+                        {
+                            'name': 'order_status',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': ['F', 'O', 'P'], 'probabilities': [0.49, 0.49, 0.02]}
+                        },
+                        {
+                            'name': 'order_priority',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': ['1-URGENT', '2-HIGH', '3-MEDIUM', '4-NOT SPECIFIED', '5-LOW']}
+                        },
+                        {
+                            'name': 'total_price',
+                            'data_type': 'float',
+                            'distribution': 'gamma',
+                            'parameters': {'shape': 2.0, 'scale': 75000.0}
+                        }
+                    ]
+                },
+                'lineitems': {
+                    'columns': [
+                        {
+                            'name': 'quantity',
+                            'data_type': 'integer',
+                            'distribution': 'uniform',
+                            'parameters': {'low': 1, 'high': 51}
+                        },
+                        {
+                            'name': 'extended_price',
+                            'data_type': 'float',
+                            'distribution': 'uniform',
+                            'parameters': {'low': 900.0, 'high': 105000.0}
+                        },
+                        {
+                            'name': 'discount',
+                            'data_type': 'float',
+                            'distribution': 'uniform',
+                            'parameters': {'low': 0.0, 'high': 0.1}
+                        },
+                        {
+                            'name': 'tax',
+                            'data_type': 'float',
+                            'distribution': 'uniform',
+                            'parameters': {'low': 0.0, 'high': 0.08}
+                        },
+                        {
+                            'name': 'return_flag',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': ['A', 'N', 'R'], 'probabilities': [0.25, 0.5, 0.25]}
+                        },
+                        {
+                            'name': 'ship_date',
+                            'data_type': 'date',
+                            'distribution': 'uniform',
+                            'parameters': {'start_date': '1992-01-02', 'end_date': '1998-12-01'}
+                        },
+                        {
+                            'name': 'ship_mode',
+                            'data_type': 'categorical',
+                            'distribution': 'categorical',
+                            'parameters': {'categories': ['AIR', 'FOB', 'MAIL', 'RAIL', 'REG AIR', 'SHIP', 'TRUCK']}
+                        }
+                    ]
+                }
+            },
+            'primary_keys': {
+                'suppliers': 'supplier_id',
+                'products': 'product_id',
+                'customers': 'customer_id',
+                'orders': 'order_id'
+            },
+            'relationships': [
+                {
+                    'parent': 'customers',
+                    'child': 'orders',
+                    'foreign_key': 'customer_id',
+                    'fan_out': {'distribution': 'poisson', 'parameters': {'lam': 10}, 'max': 40}
+                },
+                {
+                    'parent': 'orders',
+                    'child': 'lineitems',
+                    'foreign_key': 'order_id',
+                    'fan_out': {'distribution': 'categorical', 'parameters': {'categories': [1, 2, 3, 4, 5, 6, 7]}},
+                    # Items ship 1 to 121 days after their order
+                    'orderings': [
+                        {
+                            'column1': 'ship_date',
+                            'operator': '>',
+                            'column2': 'order_date',
+                            'method': 'offset',
+                            'offset': {'distribution': 'uniform', 'parameters': {'low': 1, 'high': 121}, 'unit': 'D'}
+                        }
+                    ]
+                },
+                {'parent': 'products', 'child': 'lineitems', 'foreign_key': 'product_id'},
+                {'parent': 'suppliers', 'child': 'lineitems', 'foreign_key': 'supplier_id'}
+            ],
+            # About 1GB of CSV; orders (~1.5M) and line items (~6M) follow from the fan-outs
+            'rows': {'suppliers': 10000, 'products': 200000, 'customers': 150000}
+        }
+    }
     
     @classmethod
     def load(cls, template_name: str) -> DataSchema:
@@ -264,6 +457,10 @@ class TemplateLoader:
         Returns:
             Data schema template
         """
+        if template_name in cls._relational_templates:
+            raise ValueError(
+                f"Template '{template_name}' is relational; load it with load_relational()"
+            )
         if template_name not in cls._templates:
             available_templates = list(cls._templates.keys())
             raise ValueError(
@@ -274,20 +471,64 @@ class TemplateLoader:
         template_data = cls._templates[template_name]
         return DataSchema.from_dict(template_data)
     
+    @classmethod
+    def load_relational(cls, template_name: str, scale_factor: float = 1.0) -> Tuple[RelationalSchema, Dict[str, int]]:
+        """
+        Load a relational template, scaled to a scale factor.
+        
+        Table sizes grow linearly with the scale factor, like the TPC-H
+        benchmark: ``'tpch'`` at scale factor 1 is about 1GB of data, at
+        100 about 100GB.
+        
+        Args:
+            template_name: Name of the relational template
+            scale_factor: Size of the data relative to scale factor 1
+            
+        Returns:
+            The relational schema, and the number of rows of its tables
+            without a fan-out relationship (for ``RelationalGenerator``)
+        """
+        if template_name not in cls._relational_templates:
+            available_templates = list(cls._relational_templates.keys())
+            raise ValueError(
+                f"Relational template '{template_name}' not found. "
+                f"Available templates: {available_templates}"
+            )
+        if scale_factor <= 0:
+            raise ValueError("scale_factor must be positive")
+        
+        template_data = cls._relational_templates[template_name]
+        rows = {
+            table: max(1, int(round(count * scale_factor)))
+            for table, count in template_data['rows'].items()
+        }
+        return RelationalSchema.from_dict(template_data), rows
+    
     @classmethod
     def list_templates(cls) -> list[str]:
-        """List all available templates."""
-        return list(cls._templates.keys())
+        """List all available templates, single-table and relational."""
+        return list(cls._templates.keys()) + list(cls._relational_templates.keys())
     
     @classmethod
     def get_template_info(cls, template_name: str) -> Dict[str, Any]:
         """Get information about a template."""
+        if template_name in cls._relational_templates:
+            template_data = cls._relational_templates[template_name]
+            return {
+                'name': template_name,
+                'relational': True,
+                'tables': {name: len(table['columns']) for name, table in template_data['tables'].items()},
+                'columns': sum(len(table['columns']) for table in template_data['tables'].values()),
+                'has_correlations': any('correlations' in table for table in template_data['tables'].values()),
+                'description': cls._get_template_description(template_name)
+            }
         if template_name not in cls._templates:
             raise ValueError(f"Template '{template_name}' not found")
         
         template_data = cls._templates[template_name]
         return {
             'name': template_name,
+            'relational': False,
             'columns': len(template_data['columns']),
             'has_correlations': 'correlations' in template_data,
             'description': cls._get_template_description(template_name)
@@ -300,7 +541,8 @@ class TemplateLoader:
             'customer_data': 'Customer information including demographics and contact details',
             'ecommerce_data': 'E-commerce transaction data with product and order information',
             'medical_data': 'Medical patient data with health metrics and demographics',
-            'financial_data': 'Financial transaction data with amounts and categories'
+            'financial_data': 'Financial transaction data with amounts and categories',
+            'tpch': 'TPC-H-style customers, orders, line items, products and suppliers at a scale factor'
         }
         return descriptions.get(template_name, 'No description available')
 
@@ -1,5 +1,8 @@
 from .package_mana import *
 from .timer import *
+from .sketches import *
+from .parallel import *
+from .artifacts import *
 
 __all__ = [
     # package_mana.py
@@ -9,4 +12,18 @@ __all__ = [
     # timer.py
     'PerformanceTimer',
     'performance',
+
+    # sketches.py
+    'OnlineCovariance',
+    'QuantileSketch',
+    'HyperLogLog',
+    'FrequentItems',
+    'ReservoirSample',
+
+    # parallel.py
+    'parallel_map',
+
+    # artifacts.py
+    'save_artifact',
+    'load_artifact',
 ]
@@ -0,0 +1,88 @@
+"""
+Binary artifacts for fitted models.
+
+An artifact is an uncompressed ``.npz`` archive holding a JSON metadata
+document and named arrays. Uncompressed members sit contiguously in the
+file, so loading maps each array instead of reading it, and takes about
+the same time whatever the size of the arrays.
+"""
+
+import json
+import struct
+import zipfile
+import numpy as np
+from typing import Any, Dict, Tuple
+
+# Archive member holding the JSON metadata document
+METADATA_KEY = '__metadata__'
+
+# Size of a zip local file header before its variable-length fields
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+def save_artifact(path: str, metadata: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Save a JSON metadata document and named arrays as one binary artifact.
+
+    The artifact is an uncompressed ``.npz`` archive, so ``load_artifact``
+    can map the arrays straight from the file.
+
+    Args:
+        path (str): Output path, used as given (no extension is added).
+        metadata (Dict[str, Any]): JSON-serializable metadata.
+        arrays (Dict[str, np.ndarray]): Arrays keyed by name.
+    """
+    payload = {METADATA_KEY: np.frombuffer(json.dumps(metadata).encode('utf-8'), dtype=np.uint8)}
+    payload.update(arrays)
+    with open(path, 'wb') as f:
+        np.savez(f, **payload)
+
+
+def load_artifact(path: str, mmap: bool = True) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Load an artifact written by ``save_artifact``.
+
+    Args:
+        path (str): Artifact path.
+        mmap (bool): Map the arrays read-only from the file instead of
+            reading them; compressed or object arrays are always read.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, np.ndarray]]: The metadata and the
+        arrays keyed by name.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')] if info.filename.endswith('.npy') else info.filename
+            array = _map_member(path, f, info) if mmap and info.compress_type == zipfile.ZIP_STORED else None
+            if array is None:
+                with archive.open(info) as member:
+                    array = np.lib.format.read_array(member)
+            arrays[name] = array
+
+    metadata = json.loads(bytes(arrays.pop(METADATA_KEY)).decode('utf-8'))
+    return metadata, arrays
+
+
+def _map_member(path: str, f, info: zipfile.ZipInfo):
+    """Memory-map an uncompressed ``.npy`` archive member, or None if it cannot be."""
+    f.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+    name_length, extra_length = header[-2], header[-1]
+    f.seek(info.header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    else:
+        return None
+    if dtype.hasobject:
+        return None
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+
+    order = 'F' if fortran_order else 'C'
+    return np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape, order=order)
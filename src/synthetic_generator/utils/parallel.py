@@ -0,0 +1,37 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: Optional[int] = None,
+    processes: bool = False
+) -> List[R]:
+    """
+    Apply a function to every item concurrently, keeping the item order.
+
+    Threads suit work that spends its time in NumPy, pandas or pyarrow,
+    which release the GIL; processes suit pure-Python work, but ``func``
+    and the items must then be picklable.
+
+    Args:
+        func (Callable[[T], R]): Function to apply.
+        items (Iterable[T]): Inputs.
+        workers (Optional[int]): Maximum number of workers; 1 runs serially
+            in the calling thread, None lets the executor decide.
+        processes (bool): Use a process pool instead of a thread pool.
+
+    Returns:
+        List[R]: Results, in the order of ``items``.
+    """
+    items = list(items)
+    if workers == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    pool: Callable[..., Executor] = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool(max_workers=workers) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,522 @@
+"""
+Mergeable streaming statistics.
+
+Every summary in this module can be fed chunk by chunk with ``update`` and
+combined with another summary of the same kind with ``merge``, so partial
+results computed on separate chunks, threads or processes add up to the
+result for the whole data without a second pass.
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+class OnlineCovariance:
+    """
+    Streaming means and co-moments for a fixed set of numeric columns.
+
+    Chunks are reduced with a two-pass update inside the chunk and combined
+    with the pairwise formula of Chan et al., which is numerically stable
+    for very long streams. Rows with a missing value in any tracked column
+    are skipped.
+
+    Attributes:
+        columns (List[str]): Names of the tracked columns.
+        count (int): Number of complete rows seen.
+        mean (np.ndarray): Running column means.
+        comoment (np.ndarray): Running sums of centered cross products.
+    """
+
+    def __init__(self, columns: List[str]):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            columns (List[str]): Names of the columns to track.
+        """
+        self.columns = list(columns)
+        self.count = 0
+        self.mean = np.zeros(len(self.columns))
+        self.comoment = np.zeros((len(self.columns), len(self.columns)))
+
+    def update(self, data: Union[pd.DataFrame, np.ndarray]) -> 'OnlineCovariance':
+        """
+        Add a chunk of rows.
+
+        Args:
+            data (Union[pd.DataFrame, np.ndarray]): A DataFrame containing the
+                tracked columns, or a 2-D array with the columns in order.
+
+        Returns:
+            OnlineCovariance: This accumulator, for chaining.
+        """
+        if isinstance(data, pd.DataFrame):
+            block = data[self.columns].to_numpy(dtype=float, na_value=np.nan)
+        else:
+            block = np.asarray(data, dtype=float)
+
+        block = block[~np.isnan(block).any(axis=1)]
+        if len(block) == 0:
+            return self
+
+        chunk_mean = block.mean(axis=0)
+        centered = block - chunk_mean
+        self._combine(len(block), chunk_mean, centered.T @ centered)
+        return self
+
+    def merge(self, other: 'OnlineCovariance') -> 'OnlineCovariance':
+        """
+        Fold another accumulator over the same columns into this one.
+
+        Args:
+            other (OnlineCovariance): Accumulator fed with other rows.
+
+        Returns:
+            OnlineCovariance: This accumulator, for chaining.
+        """
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge accumulators over different columns")
+        if other.count:
+            self._combine(other.count, other.mean, other.comoment)
+        return self
+
+    def covariance(self, ddof: int = 1) -> pd.DataFrame:
+        """
+        Get the covariance matrix of the rows seen so far.
+
+        Args:
+            ddof (int): Delta degrees of freedom. Defaults to 1.
+
+        Returns:
+            pd.DataFrame: Covariance matrix labelled by column.
+        """
+        denominator = self.count - ddof
+        values = self.comoment / denominator if denominator > 0 else np.full_like(self.comoment, np.nan)
+        return pd.DataFrame(values, index=self.columns, columns=self.columns)
+
+    def correlation(self) -> pd.DataFrame:
+        """
+        Get the Pearson correlation matrix of the rows seen so far.
+
+        Returns:
+            pd.DataFrame: Correlation matrix labelled by column; NaN where a
+            column has no variance.
+        """
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = self.comoment / np.outer(scale, scale)
+        return pd.DataFrame(values, index=self.columns, columns=self.columns)
+
+    def _combine(self, count: int, mean: np.ndarray, comoment: np.ndarray):
+        """Combine summary statistics of another batch (Chan et al.)."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * (self.count * count / total)
+        self.mean = self.mean + delta * (count / total)
+        self.count = total
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a numeric stream (KLL sketch).
+
+    Values are kept in a hierarchy of compactors; an item at level ``h``
+    stands for ``2**h`` input values. When a level outgrows its capacity it
+    is sorted and every other item is promoted, so memory stays at about
+    ``3 * k`` items regardless of the stream length, with a rank error of
+    roughly ``1.7 / k``. Missing values are skipped.
+
+    Attributes:
+        k (int): Capacity of the top level; larger is more accurate.
+        count (int): Number of values seen.
+        levels (List[np.ndarray]): Retained items per level.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k (int): Capacity of the top level. Defaults to 200.
+            seed (Optional[int]): Seed for the compaction offsets, which are
+                drawn from a private generator so the global random state is
+                left alone.
+        """
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: Union[pd.Series, np.ndarray]) -> 'QuantileSketch':
+        """
+        Add a batch of values.
+
+        Args:
+            values (Union[pd.Series, np.ndarray]): Numeric values.
+
+        Returns:
+            QuantileSketch: This sketch, for chaining.
+        """
+        if isinstance(values, pd.Series):
+            values = values.to_numpy(dtype=float, na_value=np.nan)
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.count += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other (QuantileSketch): Sketch fed with other values.
+
+        Returns:
+            QuantileSketch: This sketch, for chaining.
+        """
+        if other.k != self.k:
+            raise ValueError("Cannot merge sketches with different k")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: Union[float, Sequence[float]]) -> Union[float, np.ndarray]:
+        """
+        Get approximate quantiles of the values seen so far.
+
+        Args:
+            q (Union[float, Sequence[float]]): Probabilities in [0, 1].
+
+        Returns:
+            Union[float, np.ndarray]: Quantile values, NaN if the sketch is empty.
+        """
+        q_array = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.count == 0:
+            result = np.full(q_array.shape, np.nan)
+        else:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(items_h), 2 ** h) for h, items_h in enumerate(self.levels)])
+            order = np.argsort(items, kind='stable')
+            cumulative = np.cumsum(weights[order])
+            positions = np.searchsorted(cumulative, q_array * cumulative[-1], side='left')
+            result = items[order][np.minimum(positions, len(items) - 1)]
+        return result if np.ndim(q) else float(result[0])
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a level; lower levels get geometrically less room."""
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Compact levels until every level fits its capacity."""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            items = np.sort(items)
+            # An odd item out stays behind so the total weight is preserved
+            leftover, items = items[:len(items) % 2], items[len(items) % 2:]
+            promoted = items[self._rng.integers(2)::2]
+            self.levels[level] = leftover
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            # Adding a level shrinks the capacities below it
+            level = 0
+
+
+class HyperLogLog:
+    """
+    Approximate distinct count of a stream (HyperLogLog).
+
+    Values are hashed with ``pd.util.hash_pandas_object``; the first
+    ``precision`` bits of the hash pick a register, which keeps the longest
+    run of leading zeros seen in the remaining bits. The relative standard
+    error is about ``1.04 / sqrt(2 ** precision)`` (0.8% by default) for
+    ``2 ** precision`` bytes of memory.
+
+    Attributes:
+        precision (int): Number of index bits.
+        registers (np.ndarray): Register values.
+    """
+
+    def __init__(self, precision: int = 14):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            precision (int): Number of index bits, between 4 and 18.
+                Defaults to 14.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of the estimate."""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values: Union[pd.Series, np.ndarray]) -> 'HyperLogLog':
+        """
+        Add a batch of values; missing values are skipped.
+
+        Args:
+            values (Union[pd.Series, np.ndarray]): Values of any hashable type.
+
+        Returns:
+            HyperLogLog: This sketch, for chaining.
+        """
+        values = pd.Series(values).dropna()
+        if len(values):
+            self.update_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+        return self
+
+    def update_hashes(self, hashes: np.ndarray) -> 'HyperLogLog':
+        """
+        Add a batch of precomputed 64-bit hashes.
+
+        Args:
+            hashes (np.ndarray): Unsigned 64-bit hashes.
+
+        Returns:
+            HyperLogLog: This sketch, for chaining.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        suffix_bits = 64 - self.precision
+        index = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+        # Position of the leftmost 1 bit in the suffix; frexp gives the bit length
+        bit_length = np.frexp(suffix.astype(np.float64))[1]
+        rank = (suffix_bits - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other (HyperLogLog): Sketch fed with other values.
+
+        Returns:
+            HyperLogLog: This sketch, for chaining.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> float:
+        """
+        Estimate the number of distinct values seen.
+
+        Returns:
+            float: Estimated distinct count.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return float(estimate)
+
+
+class FrequentItems:
+    """
+    Counts of the most frequent values of a stream (Misra-Gries).
+
+    Counts are exact while at most ``capacity`` distinct values have been
+    seen. Beyond that, the counts are decremented by the smallest retained
+    count until ``capacity`` values remain, so every value that occurs in
+    more than ``count / capacity`` rows is kept and its count is
+    underestimated by at most ``error``. Values keep the order in which
+    they first appeared.
+
+    Attributes:
+        capacity (int): Maximum number of tracked values.
+        counts (pd.Series): Counts indexed by value.
+        count (int): Number of values seen.
+        error (int): Upper bound of the undercount of each value.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Initialize an empty summary.
+
+        Args:
+            capacity (int): Maximum number of tracked values. Defaults to 10000.
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.count = 0
+        self.error = 0
+
+    @property
+    def exact(self) -> bool:
+        """Whether the counts are exact."""
+        return self.error == 0
+
+    def update(self, values: Union[pd.Series, np.ndarray]) -> 'FrequentItems':
+        """
+        Add a batch of values; missing values are skipped.
+
+        Args:
+            values (Union[pd.Series, np.ndarray]): Values of any hashable type.
+
+        Returns:
+            FrequentItems: This summary, for chaining.
+        """
+        counts = pd.Series(values).value_counts(sort=False)
+        if len(counts):
+            self._combine(counts, 0)
+        return self
+
+    def merge(self, other: 'FrequentItems') -> 'FrequentItems':
+        """
+        Fold another summary into this one.
+
+        Args:
+            other (FrequentItems): Summary fed with other values.
+
+        Returns:
+            FrequentItems: This summary, for chaining.
+        """
+        self._combine(other.counts, other.error)
+        return self
+
+    def top(self, k: Optional[int] = None) -> pd.Series:
+        """
+        Get the most frequent values.
+
+        Args:
+            k (Optional[int]): Number of values, or None for all tracked values.
+
+        Returns:
+            pd.Series: Counts in descending order, indexed by value.
+        """
+        ordered = self.counts.sort_values(ascending=False, kind='stable')
+        return ordered if k is None else ordered.iloc[:k]
+
+    def _combine(self, counts: pd.Series, error: int):
+        """Add counts and shrink back to capacity."""
+        self.count += int(counts.sum())
+        if len(self.counts):
+            counts = pd.concat([self.counts, counts]).groupby(level=0, sort=False).sum()
+        self.counts = counts.astype('int64')
+        self.error += error
+
+        if len(self.counts) > self.capacity:
+            threshold = int(self.counts.nlargest(self.capacity + 1).iloc[-1])
+            self.counts = self.counts[self.counts > threshold] - threshold
+            self.error += threshold
+
+
+class ReservoirSample:
+    """
+    A uniform random sample of fixed size from a stream (reservoir sampling).
+
+    Every value of the stream ends up in the sample with the same
+    probability, whatever the chunking. Two samples of disjoint streams
+    merge into a uniform sample of the combined stream.
+
+    Attributes:
+        capacity (int): Maximum sample size.
+        count (int): Number of values seen.
+        values (np.ndarray): The sampled values.
+    """
+
+    def __init__(self, capacity: int = 10000, seed: Optional[int] = None):
+        """
+        Initialize an empty sample.
+
+        Args:
+            capacity (int): Maximum sample size. Defaults to 10000.
+            seed (Optional[int]): Seed of the private random generator.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.values: np.ndarray = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: Union[pd.Series, np.ndarray]) -> 'ReservoirSample':
+        """
+        Add a batch of values.
+
+        Args:
+            values (Union[pd.Series, np.ndarray]): Values of any type.
+
+        Returns:
+            ReservoirSample: This sample, for chaining.
+        """
+        values = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+        if len(values) == 0:
+            return self
+
+        # Fill the reservoir first
+        room = max(self.capacity - len(self.values), 0)
+        if room:
+            head = values[:room]
+            self.values = head.copy() if len(self.values) == 0 else np.concatenate([self.values, head])
+        seen = self.count + min(room, len(values))
+        rest = values[room:]
+
+        if len(rest):
+            # Value i of the stream replaces a random slot with probability capacity / (i + 1)
+            positions = seen + np.arange(len(rest))
+            slots = self._rng.integers(0, positions + 1)
+            chosen = np.flatnonzero(slots < self.capacity)
+            if len(chosen):
+                # When a slot is drawn more than once, the latest value wins
+                last_first = chosen[::-1]
+                unique_slots, first = np.unique(slots[last_first], return_index=True)
+                if self.values.dtype != rest.dtype:
+                    self.values = self.values.astype(np.result_type(self.values, rest))
+                self.values[unique_slots] = rest[last_first[first]]
+
+        self.count += len(values)
+        return self
+
+    def merge(self, other: 'ReservoirSample') -> 'ReservoirSample':
+        """
+        Fold another sample into this one.
+
+        Args:
+            other (ReservoirSample): Sample of other values.
+
+        Returns:
+            ReservoirSample: This sample, for chaining.
+        """
+        total = self.count + other.count
+        size = min(self.capacity, total)
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.values = other.values[:size].copy()
+        else:
+            # How many of the merged values come from each side
+            from_self = self._rng.hypergeometric(self.count, other.count, size)
+            keep = self._rng.choice(len(self.values), from_self, replace=False)
+            take = self._rng.choice(len(other.values), size - from_self, replace=False)
+            self.values = np.concatenate([self.values[np.sort(keep)], other.values[np.sort(take)]])
+        self.count = total
+        return self
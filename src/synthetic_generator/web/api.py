@@ -5,6 +5,7 @@ API endpoints for Synthetic Generator Web UI.
 import os
 import tempfile
 import json
+import base64
 import pandas as pd
 import numpy as np
 from flask import Blueprint, request, jsonify, send_file
@@ -12,6 +13,7 @@ from werkzeug.utils import secure_filename
 from datetime import datetime
 # Import these functions directly to avoid circular imports
 from ..schemas import DataSchema, ColumnSchema, DataType, DistributionType
+from ..schemas.cache import schema_cache
 
 api_bp = Blueprint('api', __name__)
 
@@ -19,6 +21,36 @@ api_bp = Blueprint('api', __name__)
 ALLOWED_EXTENSIONS = {'csv', 'json', 'xlsx', 'parquet'}
 
 
+def _cached_schema(data):
+    """
+    Get the cache entry of a request's schema.
+    
+    The schema is given inline as a dict, or as base64 of
+    ``DataSchema.to_bytes()``, or by the ``schema_id`` returned by an
+    earlier call. Returns None if neither is given; raises KeyError only
+    for an unknown ``schema_id``, and ValueError for a schema that is
+    malformed, invalid or decompresses to more than ``MAX_SCHEMA_BYTES``.
+    """
+    schema = data.get('schema')
+    if schema:
+        try:
+            if isinstance(schema, str):
+                schema = base64.b64decode(schema)
+            return schema_cache.get(schema)
+        except (KeyError, TypeError, AttributeError) as e:
+            # Malformed schemas fail while parsing, before validation
+            detail = f"missing field {e}" if isinstance(e, KeyError) else str(e)
+            raise ValueError(f"Invalid schema: {detail}") from e
+    
+    schema_id = data.get('schema_id')
+    if not schema_id:
+        return None
+    entry = schema_cache.lookup(schema_id)
+    if entry is None:
+        raise KeyError(schema_id)
+    return entry
+
+
 def allowed_file(filename):
     """Check if file extension is allowed."""
     return '.' in filename and \
@@ -44,31 +76,45 @@ def generate_synthetic_data():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
-        schema_dict = data.get('schema')
         n_samples = data.get('n_samples', 1000)
         seed = data.get('seed')
         privacy_level = data.get('privacy_level')
         
-        if not schema_dict:
+        # Parsed, validated schemas are cached by content hash
+        try:
+            entry = _cached_schema(data)
+        except KeyError:
+            return jsonify({'error': 'Unknown schema_id, send the schema again'}), 404
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if entry is None:
             return jsonify({'error': 'Schema is required'}), 400
-        
-        # Convert schema dict to DataSchema object
-        schema = DataSchema.from_dict(schema_dict)
+        schema = entry.schema
         
         # Import and generate data (avoid circular import)
         from ..generators.base import DataGenerator
-        generator = DataGenerator(schema)
-        result = generator.generate(n_samples, seed)
+        generator = entry.plan('generator', DataGenerator)
+        # The cached generator keeps per-run state, so runs take turns
+        with entry.lock:
+            result = generator.generate(n_samples, seed)
+            constraint_report = generator.constraint_report
+        
+        # Temporal columns are typed; render them as strings for JSON
+        from ..export.formats import format_temporal_columns
+        from ..generators.temporal_generators import temporal_formats
+        formatted = format_temporal_columns(result, temporal_formats(schema))
         
         # Convert to JSON-serializable format
-        data_json = result.to_dict('records')
+        data_json = formatted.to_dict('records')
         
         return jsonify({
             'success': True,
             'data': data_json,
             'shape': result.shape,
             'columns': list(result.columns),
-            'sample_size': len(result)
+            'sample_size': len(result),
+            'constraint_report': constraint_report,
+            'schema_id': entry.key
         })
         
     except Exception as e:
@@ -90,35 +136,40 @@ def infer_data_schema():
             return jsonify({'error': 'Invalid file type'}), 400
         
         # Save uploaded file temporarily
+        sample_size = request.form.get('sample_size', type=int)
         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file.filename.rsplit('.', 1)[1].lower()}") as tmp_file:
             file.save(tmp_file.name)
-            
-            # Read data based on file type
-            if file.filename.endswith('.csv'):
-                data = pd.read_csv(tmp_file.name)
-            elif file.filename.endswith('.json'):
-                data = pd.read_json(tmp_file.name)
-            elif file.filename.endswith('.xlsx'):
-                data = pd.read_excel(tmp_file.name)
-            elif file.filename.endswith('.parquet'):
-                data = pd.read_parquet(tmp_file.name)
-            
+        
+        try:
+            # Infer schema (avoid circular import)
+            from ..schemas.inference import SchemaInferrer
+            from ..schemas.profile import CorrelationProfile
+            from ..schemas.readers import sample_rows
+            if sample_size:
+                # Only the sampled rows are held in memory
+                data = sample_rows(tmp_file.name, sample_size)
+                schema = SchemaInferrer.infer(data)
+                columns = list(data.columns)
+                shape = (data.attrs['source_rows'], len(columns))
+            else:
+                # Profile the upload chunk by chunk instead of loading it whole
+                correlations = CorrelationProfile()
+                profiles = SchemaInferrer.profile_file(tmp_file.name, correlations=correlations)
+                schema = SchemaInferrer.infer_profiles(profiles, correlations=correlations)
+                columns = list(profiles)
+                shape = (max((p.count for p in profiles.values()), default=0), len(columns))
+        finally:
             # Clean up temporary file
             os.unlink(tmp_file.name)
         
-        # Infer schema (avoid circular import)
-        sample_size = request.form.get('sample_size', type=int)
-        from ..schemas.inference import infer_schema_from_data
-        schema = infer_schema_from_data(data, sample_size)
-        
         # Convert schema to dict
         schema_dict = schema.to_dict()
         
         return jsonify({
             'success': True,
             'schema': schema_dict,
-            'original_shape': data.shape,
-            'columns': list(data.columns)
+            'original_shape': shape,
+            'columns': columns
         })
         
     except Exception as e:
@@ -194,12 +245,16 @@ def validate_synthetic_data():
             return jsonify({'error': 'No data provided'}), 400
         
         data_df = pd.DataFrame(data.get('data', []))
-        schema_dict = data.get('schema')
         
-        if not schema_dict:
+        try:
+            entry = _cached_schema(data)
+        except KeyError:
+            return jsonify({'error': 'Unknown schema_id, send the schema again'}), 404
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if entry is None:
             return jsonify({'error': 'Schema is required'}), 400
-        
-        schema = DataSchema.from_dict(schema_dict)
+        schema = entry.schema
         
         # Validate data (avoid circular import)
         validation_results = schema.validate_data(data_df)
@@ -334,7 +389,8 @@ def get_distributions():
             {'value': 'BINOMIAL', 'label': 'Binomial', 'category': 'Discrete'},
             {'value': 'GEOMETRIC', 'label': 'Geometric', 'category': 'Discrete'},
             {'value': 'CATEGORICAL', 'label': 'Categorical', 'category': 'Categorical'},
-            {'value': 'CONSTANT', 'label': 'Constant', 'category': 'Special'}
+            {'value': 'CONSTANT', 'label': 'Constant', 'category': 'Special'},
+            {'value': 'EMPIRICAL', 'label': 'Empirical (quantile table)', 'category': 'Special'}
         ]
         
         return jsonify({
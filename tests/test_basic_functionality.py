@@ -2,8 +2,10 @@
 Basic functionality tests for Synthetic Generator.
 """
 
+import base64
 import pandas as pd
 import numpy as np
+import pytest
 from synthetic_generator import (
     generate_data, 
     infer_schema, 
@@ -187,6 +189,161 @@ def test_constraints():
     assert data["nullable_value"].isnull().sum() > 0  # Should have some null values
 
 
+def test_schema_cache_skips_parsing():
+    """Test schema hashing, binary encoding and the parsed-schema cache."""
+    from synthetic_generator.schemas.base import schema_hash
+    from synthetic_generator.schemas.cache import SchemaCache, schema_cache
+    from synthetic_generator.web import create_app
+
+    schema = load_template("customer_data")
+    schema_dict = schema.to_dict()
+    # Key order does not change the hash
+    reordered = {key: schema_dict[key] for key in reversed(list(schema_dict))}
+    assert schema_hash(reordered) == schema.content_hash()
+
+    encoded = schema.to_bytes()
+    assert len(encoded) < len(str(schema_dict))
+    assert DataSchema.from_bytes(encoded).to_dict() == schema_dict
+
+    cache = SchemaCache(max_size=2)
+    entry = cache.get(schema_dict)
+    assert cache.get(encoded) is entry
+    assert cache.get(reordered) is entry
+    assert (cache.misses, cache.hits) == (1, 2)
+    assert entry.plan("plan", DataSchema.to_dict) is entry.plan("plan", DataSchema.to_dict)
+
+    # The least recently used schema is evicted
+    cache.get(load_template("ecommerce_data").to_dict())
+    cache.get(load_template("financial_data").to_dict())
+    assert cache.lookup(entry.key) is None
+
+    client = create_app().test_client()
+    schema_cache.clear()
+    first = client.post("/api/generate", json={"schema": schema_dict, "n_samples": 50, "seed": 1}).get_json()
+    misses = schema_cache.misses
+    # The same schema by id or in binary form is neither parsed nor validated again
+    by_id = client.post("/api/generate", json={"schema_id": first["schema_id"], "n_samples": 50, "seed": 1}).get_json()
+    binary = base64.b64encode(encoded).decode("ascii")
+    by_bytes = client.post("/api/generate", json={"schema": binary, "n_samples": 50, "seed": 1}).get_json()
+    assert schema_cache.misses == misses
+    assert by_id["data"] == first["data"] == by_bytes["data"]
+    assert client.post("/api/generate", json={"schema_id": "unknown"}).status_code == 404
+
+
+def test_schema_bytes_decompress_within_limit():
+    """Test that binary schemas expanding past the size limit are rejected."""
+    import zlib
+    from synthetic_generator.schemas.base import MAX_SCHEMA_BYTES
+    from synthetic_generator.schemas.cache import SchemaCache
+    from synthetic_generator.web import create_app
+
+    # A small payload that would decompress to more than the limit
+    bomb = zlib.compress(b" " * (MAX_SCHEMA_BYTES + 1), 9)
+    assert len(bomb) < MAX_SCHEMA_BYTES // 100
+    with pytest.raises(ValueError, match="exceeds"):
+        SchemaCache().get(bomb)
+    with pytest.raises(ValueError):
+        DataSchema.from_bytes(bomb)
+    with pytest.raises(ValueError):
+        DataSchema.from_bytes(load_template("customer_data").to_bytes()[:-4])
+
+    client = create_app().test_client()
+    response = client.post("/api/generate", json={"schema": base64.b64encode(bomb).decode("ascii")})
+    assert response.status_code == 400
+    assert "exceeds" in response.get_json()["error"]
+
+
+    # Malformed inline schemas are client errors, not unknown schema ids
+    malformed = {"columns": [{"data_type": "integer", "distribution": "constant"}]}
+    for route in ["/api/generate", "/api/validate"]:
+        response = client.post(route, json={"schema": malformed, "data": [{"a": 1}]})
+        assert response.status_code == 400
+        assert "name" in response.get_json()["error"]
+
+
+def test_streaming_export_rotates_files(tmp_path):
+    """Test that chunked exports append incrementally and rotate by row count."""
+    from synthetic_generator.export import export_data
+    from synthetic_generator.generators import DataGenerator
+
+    generator = DataGenerator(load_template("customer_data"))
+    expected = pd.concat(list(generator.generate_chunks(1000, 4500, seed=3)), ignore_index=True)
+
+    for format_type, read in [("parquet", pd.read_parquet), ("csv", pd.read_csv),
+                              ("jsonl", lambda path: pd.read_json(path, lines=True))]:
+        path = str(tmp_path / f"data.{format_type}")
+        files = export_data(generator.generate_chunks(1000, 4500, seed=3), format_type,
+                            filepath=path, max_rows=2000)
+        assert [len(read(f)) for f in files] == [2000, 2000, 500]
+        written = pd.concat([read(f) for f in files], ignore_index=True)
+        assert np.allclose(written["income"], expected["income"])
+        assert list(written.columns) == list(expected.columns)
+
+    # Parquet gets one row group per chunk
+    import pyarrow.parquet as pq
+    files = export_data(generator.generate_chunks(1000, 4500, seed=3), "parquet",
+                        filepath=str(tmp_path / "single.parquet"))
+    assert files == [str(tmp_path / "single.parquet")]
+    assert pq.ParquetFile(files[0]).metadata.num_row_groups == 5
+
+
+def test_partitioned_parquet_export(tmp_path):
+    """Test that partitioned exports write a Hive dataset with a _metadata summary."""
+    import pyarrow.parquet as pq
+    from synthetic_generator.export import export_data
+    from synthetic_generator.generators import DataGenerator
+
+    data = generate_data(load_template("customer_data"), 3000, seed=5)
+    root = tmp_path / "dataset"
+    files = export_data(data, "parquet", filepath=str(root), partition_by=["is_active", "last_name"], workers=2)
+    assert all(f.startswith("is_active=") and "/last_name=" in f for f in files)
+    assert len(files) == data.groupby(["is_active", "last_name"]).ngroups
+
+    metadata = pq.read_metadata(root / "_metadata")
+    assert metadata.num_rows == 3000
+    assert sorted(metadata.row_group(i).column(0).file_path for i in range(metadata.num_row_groups)) == sorted(files)
+
+    written = pd.read_parquet(root)
+    assert len(written) == 3000
+    assert written.groupby("last_name", observed=True).size().to_dict() == data.groupby("last_name").size().to_dict()
+
+    # Chunks append files to the same dataset
+    chunks = DataGenerator(load_template("customer_data")).generate_chunks(1000, 2500, seed=5)
+    files = export_data(chunks, "parquet", filepath=str(tmp_path / "chunked"), partition_by=["last_name"], workers=1)
+    assert {f.rsplit("/", 1)[-1] for f in files} == {"part-00000.parquet", "part-00001.parquet", "part-00002.parquet"}
+    assert pq.read_metadata(tmp_path / "chunked" / "_metadata").num_rows == 2500
+
+
+def test_exports_apply_schema_date_formats(tmp_path):
+    """Test that exports write temporal columns in the schema's formats, or ISO 8601."""
+    import json
+    from synthetic_generator.export import export_data
+    from synthetic_generator.generators import DataGenerator
+
+    schema = DataSchema(columns=[
+        ColumnSchema(name="shipped", data_type=DataType.DATE, distribution=DistributionType.UNIFORM,
+                     parameters={"start_date": "2024-01-01", "end_date": "2024-01-31", "format": "%d/%m/%Y"}),
+        ColumnSchema(name="ordered", data_type=DataType.DATE, distribution=DistributionType.UNIFORM,
+                     parameters={"start_date": "2024-01-01", "end_date": "2024-01-31"}),
+    ])
+    data = generate_data(schema, 100, seed=2)
+    assert data["shipped"].dtype.kind == "M"
+
+    export_data(data, "json", filepath=str(tmp_path / "data.json"))
+    record = json.loads((tmp_path / "data.json").read_text())[0]
+    assert pd.to_datetime(record["shipped"], format="%d/%m/%Y") == data["shipped"][0]
+    assert record["ordered"].startswith(str(data["ordered"][0].date()))
+
+    chunks = DataGenerator(schema).generate_chunks(40, 100, seed=2)
+    files = export_data(chunks, "jsonl", filepath=str(tmp_path / "data.jsonl"))
+    record = json.loads(open(files[0]).readline())
+    assert len(record["shipped"]) == 10 and record["shipped"][2] == "/"
+    assert record["ordered"][4] == "-"
+
+    export_data(data, "csv", filepath=str(tmp_path / "data.csv"))
+    assert pd.read_csv(tmp_path / "data.csv")["shipped"][0] == data["shipped"][0].strftime("%d/%m/%Y")
+
+
 if __name__ == "__main__":
     # Run tests
     test_basic_data_generation()
@@ -195,4 +352,14 @@ if __name__ == "__main__":
     test_data_validation()
     test_correlations()
     test_constraints()
+    test_schema_cache_skips_parsing()
+    test_schema_bytes_decompress_within_limit()
+    import tempfile
+    from pathlib import Path
+    with tempfile.TemporaryDirectory() as tmp:
+        test_streaming_export_rotates_files(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_partitioned_parquet_export(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_exports_apply_schema_date_formats(Path(tmp))
     print("All tests passed!") 
\ No newline at end of file
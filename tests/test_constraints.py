@@ -0,0 +1,293 @@
+"""
+Constraint tests for Synthetic Generator.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from synthetic_generator import generate_data, DataSchema, ColumnSchema, DataType, DistributionType
+from synthetic_generator.generators import DataGenerator
+from synthetic_generator.utils import QuantileSketch
+
+
+def test_allowed_values_constraint():
+    """Test that values outside allowed_values are replaced in bulk."""
+    schema = DataSchema(
+        columns=[
+            ColumnSchema(
+                name="rating",
+                data_type=DataType.INTEGER,
+                distribution=DistributionType.UNIFORM,
+                parameters={"low": 0, "high": 10}
+            )
+        ]
+    )
+
+    data = generate_data(
+        schema, n_samples=5000, seed=21,
+        constraints={"rating": {"allowed_values": [1, 3, 5]}}
+    )
+
+    assert set(data["rating"].unique()) == {1, 3, 5}
+    assert data["rating"].dtype.kind == "i"
+
+
+def _account_schema(constraints=None):
+    """Schema with two numeric columns and a category."""
+    return DataSchema(
+        columns=[
+            ColumnSchema(
+                name="amount",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.UNIFORM,
+                parameters={"low": 0, "high": 1000}
+            ),
+            ColumnSchema(
+                name="credit_limit",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.UNIFORM,
+                parameters={"low": 0, "high": 1000}
+            ),
+            ColumnSchema(
+                name="tier",
+                data_type=DataType.CATEGORICAL,
+                distribution=DistributionType.CATEGORICAL,
+                parameters={"categories": ["basic", "gold"]}
+            )
+        ],
+        constraints=constraints
+    )
+
+
+def test_expression_constraints():
+    """Test string expressions and dict conditions in row constraints."""
+    schema = _account_schema({
+        "row_constraints": [
+            # Drop rows over the limit, unless they are gold customers
+            {"condition": "amount > credit_limit and tier != 'gold'", "action": "drop"},
+            {"condition": {"amount": {"operator": "<", "value": 10}}, "action": "drop"}
+        ]
+    })
+
+    data = generate_data(schema, n_samples=2000, seed=8)
+    over_limit = data["amount"] > data["credit_limit"]
+    assert (data.loc[over_limit, "tier"] == "gold").all()
+    assert (data["amount"] >= 10).all()
+    assert len(data) < 2000
+
+    # Every dropped row is accounted for by one of the constraints
+    report = data.attrs["constraint_report"]
+    assert [entry["constraint"] for entry in report] == ["row_constraints[0]", "row_constraints[1]"]
+    assert report[0]["evaluated"] == 2000
+    assert report[1]["evaluated"] == 2000 - report[0]["drops"]
+    assert sum(entry["drops"] for entry in report) == 2000 - len(data)
+    assert all(entry["elapsed_ms"] >= 0 for entry in report)
+
+
+def test_invalid_expression_fails_early():
+    """Test that invalid expressions are rejected when the generator is built."""
+    schema = _account_schema({
+        "row_constraints": [{"condition": "amount > __import__('os')", "action": "drop"}]
+    })
+
+    with pytest.raises(ValueError):
+        DataGenerator(schema)
+
+
+def test_global_constraints_apply_in_place():
+    """Test that drops are applied once and modifications only touch masked cells."""
+    df = pd.DataFrame({
+        "amount": [5.0, 50.0, 500.0, 5000.0],
+        "credit_limit": [100.0, 100.0, 100.0, 100.0],
+        "tier": ["basic", "basic", "gold", "basic"]
+    })
+    constraints = {
+        "row_constraints": [
+            {"condition": "amount > 1000", "action": "drop"},
+            {"condition": "tier == 'gold'", "action": "modify", "modification": {"credit_limit": 1000.0}}
+        ],
+        "cross_column_constraints": [
+            {
+                "condition": "amount < 10",
+                "action": "modify",
+                "modification": {"amount": {"type": "function", "function": "mean"}}
+            }
+        ]
+    }
+
+    generator = DataGenerator(_account_schema(constraints))
+    result = generator.constraint_manager.apply_global_constraints(df, constraints)
+
+    assert list(result.index) == [0, 1, 2]
+    assert result["credit_limit"].tolist() == [100.0, 100.0, 1000.0]
+    # Statistics describe the kept rows only
+    assert result.loc[0, "amount"] == pytest.approx((5 + 50 + 500) / 3)
+
+
+def test_quality_constraints_single_pass():
+    """Test quality constraints with exact and streaming quartiles."""
+    schema = DataSchema(
+        columns=[
+            ColumnSchema(
+                name="latency",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.EXPONENTIAL,
+                parameters={"scale": 100}
+            )
+        ],
+        constraints={"quality_constraints": {"max_outlier_ratio": 0.01}}
+    )
+
+    def outlier_ratio(values, q1, q3):
+        iqr = q3 - q1
+        return ((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)).mean()
+
+    # Outliers are judged against the quartiles of the generated values
+    raw = DataGenerator(DataSchema(columns=schema.columns)).generate(20000, seed=4)
+    q1, q3 = raw["latency"].quantile([0.25, 0.75])
+    assert outlier_ratio(raw["latency"], q1, q3) > 0.04
+
+    data = DataGenerator(schema).generate(20000, seed=4)
+    assert outlier_ratio(data["latency"], q1, q3) == pytest.approx(0.01)
+
+    generator = DataGenerator(schema)
+    chunks = list(generator.generate_chunks(5000, n_samples=20000, seed=4))
+    sketch = generator.quantile_sketches["latency"]
+    assert sketch.count == 20000
+
+    full = pd.concat(chunks, ignore_index=True)["latency"]
+    q1, q3 = sketch.quantile([0.25, 0.75])
+    assert outlier_ratio(full, q1, q3) < 0.02
+
+    # Sketches built separately merge into one summary of all values
+    halves = [QuantileSketch(seed=i).update(part) for i, part in enumerate(np.array_split(full.to_numpy(), 2))]
+    merged = halves[0].merge(halves[1])
+    assert merged.count == len(full)
+    assert abs(merged.quantile(0.5) - full.median()) < 0.02 * full.median()
+
+
+def test_ordering_constraints_hold_by_construction():
+    """Test swap and offset ordering constraints."""
+    schema = DataSchema(
+        columns=[
+            ColumnSchema(
+                name="start_date",
+                data_type=DataType.DATE,
+                distribution=DistributionType.UNIFORM,
+                parameters={"start_date": "2024-01-01", "end_date": "2024-12-31"}
+            ),
+            ColumnSchema(
+                name="end_date",
+                data_type=DataType.DATE,
+                distribution=DistributionType.UNIFORM,
+                parameters={"start_date": "2024-01-01", "end_date": "2024-12-31"}
+            ),
+            ColumnSchema(
+                name="low",
+                data_type=DataType.INTEGER,
+                distribution=DistributionType.UNIFORM,
+                parameters={"low": 0, "high": 5}
+            ),
+            ColumnSchema(
+                name="high",
+                data_type=DataType.INTEGER,
+                distribution=DistributionType.UNIFORM,
+                parameters={"low": 0, "high": 5}
+            )
+        ],
+        constraints={
+            "ordering_constraints": [
+                {
+                    "column1": "end_date", "operator": ">", "column2": "start_date",
+                    "method": "offset",
+                    "offset": {"distribution": "exponential", "parameters": {"scale": 10}, "unit": "D"}
+                },
+                {"column1": "low", "operator": "<", "column2": "high"}
+            ]
+        }
+    )
+
+    data = generate_data(schema, n_samples=3000, seed=13)
+    assert len(data) == 3000
+    assert (data["end_date"] > data["start_date"]).all()
+    assert (data["low"] < data["high"]).all()
+    # Offsets follow the requested distribution
+    assert abs((data["end_date"] - data["start_date"]).dt.days.mean() - 10) < 1
+
+
+def test_row_condition_compares_dates_to_strings():
+    """Test that dict conditions compare temporal columns with date strings."""
+    from synthetic_generator import load_template
+
+    schema = load_template("ecommerce_data").to_dict()
+    schema["constraints"] = {
+        "row_constraints": [
+            {"condition": {"order_date": {"operator": ">", "value": "2024-06-01"}}, "action": "drop"}
+        ]
+    }
+
+    data = generate_data(schema, n_samples=2000, seed=1)
+    assert 0 < len(data) < 2000
+    assert (data["order_date"] <= pd.Timestamp("2024-06-01")).all()
+
+
+def test_expressions_compare_mixed_temporal_units():
+    """Test that expressions compare timestamps of different units and NaT like pandas."""
+    from synthetic_generator.generators.expressions import CompiledExpression
+
+    events = np.array(["2024-01-01T00:00:00.500", "2024-01-01T00:00:00.000", "NaT", "2024-01-03"],
+                      dtype="datetime64[ms]")
+    dates = np.array(["2024-01-01", "2024-01-01", "2024-01-01", "2024-01-02"], dtype="datetime64[s]")
+    for df in [pd.DataFrame({"a": events, "b": dates}), pd.DataFrame({"a": events[[0, 1, 3]], "b": dates[[0, 1, 3]]})]:
+        for expression in ["a > b", "a < b", "a >= b", "a != b"]:
+            expected = df.eval(expression).to_numpy()
+            assert (CompiledExpression(expression).evaluate(df) == expected).all(), expression
+
+
+
+def test_compiled_conditions_match_pandas():
+    """Test that compiled conditions keep pandas results for nulls, mixed lists, not and odd names."""
+    from synthetic_generator.generators.constraints import ConstraintManager
+    from synthetic_generator.generators.expressions import CompiledExpression
+
+    manager = ConstraintManager()
+    df = pd.DataFrame({
+        "tier": ["a", None, "c", "b"],
+        "code": [1, 2, 3, 0],
+        "np": [0.5, 1.5, 2.5, 3.5]
+    })
+
+    # Nulls in text columns compare False instead of raising
+    for tier in [df["tier"], df["tier"].astype("string")]:
+        frame = df.assign(tier=tier)
+        mask = manager._evaluate_row_condition(frame, {"tier": {"operator": ">", "value": "a"}})
+        assert mask.tolist() == [False, False, True, True]
+
+    # Lists of mixed types match like pandas isin
+    mask = manager._evaluate_row_condition(df, {"code": {"operator": "in", "value": [1, "x", 3]}})
+    assert mask.tolist() == [True, False, True, False]
+    mask = manager._evaluate_row_condition(df, {"code": {"operator": "not_in", "value": [1, "x"]}})
+    assert mask.tolist() == [False, True, True, True]
+    assert CompiledExpression("code in [1, 'x']").evaluate(df).tolist() == [True, False, False, False]
+
+    # `not` is logical on non-boolean operands
+    assert CompiledExpression("not code").evaluate(df).tolist() == [False, False, False, True]
+    assert CompiledExpression("not (code > 1)").evaluate(df).tolist() == [True, False, False, True]
+
+    # A column named like a module does not shadow the evaluator's helpers
+    result = CompiledExpression("np > 1 and code not in [3]").evaluate(df)
+    assert result.tolist() == [False, True, False, True]
+
+
+if __name__ == "__main__":
+    # Run tests
+    test_allowed_values_constraint()
+    test_expression_constraints()
+    test_invalid_expression_fails_early()
+    test_global_constraints_apply_in_place()
+    test_quality_constraints_single_pass()
+    test_ordering_constraints_hold_by_construction()
+    test_row_condition_compares_dates_to_strings()
+    test_expressions_compare_mixed_temporal_units()
+    test_compiled_conditions_match_pandas()
+    print("All tests passed!")
@@ -0,0 +1,355 @@
+"""
+Generator-level tests for Synthetic Generator.
+"""
+
+import numpy as np
+import pandas as pd
+from synthetic_generator import DataSchema, ColumnSchema, DataType, DistributionType
+from synthetic_generator.generators import DataGenerator, CorrelationManager, RelationalGenerator, generate_partitions
+from synthetic_generator.schemas import RelationalSchema, Relationship, TemplateLoader
+from synthetic_generator.generators.temporal_generators import TemporalGenerator
+
+
+def test_temporal_generation_is_typed():
+    """Test that dates and datetimes are generated as datetime64 arrays."""
+    generator = TemporalGenerator()
+
+    dates = generator.generate_dates(
+        {"start_date": "2023-01-01", "end_date": "2023-01-31"}, 1000
+    )
+    assert dates.dtype == np.dtype("datetime64[D]")
+    assert dates.min() >= np.datetime64("2023-01-01")
+    assert dates.max() <= np.datetime64("2023-01-31")
+
+    datetimes = generator.generate_datetimes(
+        {"start_datetime": "2023-01-01", "end_datetime": "2023-01-02"}, 1000
+    )
+    assert datetimes.dtype == np.dtype("datetime64[s]")
+    assert datetimes.max() <= np.datetime64("2023-01-02T00:00:00")
+
+    # Formatting happens on demand and matches strftime
+    formatted = TemporalGenerator.format_temporal(dates, "%d/%m/%Y")
+    expected = pd.DatetimeIndex(dates).strftime("%d/%m/%Y")
+    assert list(formatted) == list(expected)
+
+
+def test_event_stream_chunks_are_ordered():
+    """Test that Poisson event timestamps stay ordered across chunks."""
+    schema = DataSchema(
+        columns=[
+            ColumnSchema(
+                name="event_time",
+                data_type=DataType.DATETIME,
+                distribution=DistributionType.POISSON,
+                parameters={
+                    "rate": 600,
+                    "start_datetime": "2024-01-01",
+                    # Quiet nights, busy days
+                    "daily_profile": [0.1] * 8 + [1.0] * 16
+                }
+            )
+        ]
+    )
+
+    generator = DataGenerator(schema)
+    chunks = list(generator.generate_chunks(1000, n_samples=5000, seed=7))
+    assert [len(chunk) for chunk in chunks] == [1000] * 5
+
+    events = pd.concat(chunks, ignore_index=True)["event_time"]
+    assert events.is_monotonic_increasing
+    assert events.min() >= pd.Timestamp("2024-01-01")
+
+    # Daytime hours should receive far more events than night hours
+    hours = events.dt.hour
+    assert (hours >= 8).sum() > 5 * (hours < 8).sum()
+
+
+def test_copula_correlations():
+    """Test that the Gaussian copula hits the targets and keeps marginals."""
+    schema = DataSchema(
+        columns=[
+            ColumnSchema(
+                name="x",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.NORMAL,
+                parameters={"mean": 10, "std": 2}
+            ),
+            ColumnSchema(
+                name="y",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.NORMAL,
+                parameters={"mean": 0, "std": 1}
+            ),
+            ColumnSchema(
+                name="count",
+                data_type=DataType.INTEGER,
+                distribution=DistributionType.POISSON,
+                parameters={"lam": 4}
+            )
+        ],
+        correlations={
+            "x": {"y": 0.8, "count": 0.5},
+            "y": {"count": 0.4}
+        }
+    )
+
+    data = DataGenerator(schema).generate(20000, seed=3)
+    corr = data[["x", "y", "count"]].corr()
+    assert abs(corr.loc["x", "y"] - 0.8) < 0.05
+    assert abs(corr.loc["x", "count"] - 0.5) < 0.07
+
+    # Marginals are preserved
+    assert abs(data["x"].mean() - 10) < 0.1
+    assert abs(data["x"].std() - 2) < 0.1
+    assert data["count"].dtype.kind == "i"
+    assert abs(data["count"].mean() - 4) < 0.1
+
+
+def test_iman_conover_preserves_marginals():
+    """Test that Iman-Conover only reorders values to reach rank correlations."""
+    schema = DataSchema(
+        columns=[
+            ColumnSchema(
+                name="income",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.GAMMA,
+                parameters={"shape": 2, "scale": 20000}
+            ),
+            ColumnSchema(
+                name="purchases",
+                data_type=DataType.INTEGER,
+                distribution=DistributionType.POISSON,
+                parameters={"lam": 30}
+            )
+        ],
+        correlations={"income": {"purchases": 0.6}}
+    )
+
+    # Same seed, with and without correlations: the sampled values must match
+    independent = DataGenerator(DataSchema(columns=schema.columns)).generate(10000, seed=5)
+    generator = DataGenerator(schema, correlation_method="iman_conover")
+    correlated = generator.generate(10000, seed=5)
+
+    for col in ["income", "purchases"]:
+        assert np.array_equal(np.sort(independent[col]), np.sort(correlated[col]))
+    assert correlated["purchases"].dtype.kind == "i"
+
+    spearman = correlated["income"].corr(correlated["purchases"], method="spearman")
+    assert abs(spearman - 0.6) < 0.03
+
+    # The reordering scores carry the target correlation exactly
+    target = np.array([[1.0, 0.7167, -0.4158], [0.7167, 1.0, 0.2091], [-0.4158, 0.2091, 1.0]])
+    scores = CorrelationManager._iman_conover_scores(2000, np.linalg.cholesky(target))
+    assert np.allclose(np.corrcoef(scores, rowvar=False), target, atol=1e-10)
+
+
+def test_correlations_keep_other_columns():
+    """Test that correlations write back in place without touching other columns."""
+    df = pd.DataFrame({
+        "a": np.random.normal(0, 1, 1000),
+        "b": np.random.normal(0, 1, 1000),
+        "label": np.random.choice(["x", "y"], 1000),
+        "when": pd.date_range("2024-01-01", periods=1000, freq="h")
+    })
+    label_before = df["label"].copy()
+
+    for method in ["copula", "iman_conover", "pairwise"]:
+        result = CorrelationManager().apply_correlations(df, {"a": {"b": 0.6}}, method=method)
+        assert result is df
+        assert result["a"].dtype == np.float64
+        assert result["when"].dtype.kind == "M"
+        assert result["label"].equals(label_before)
+
+
+def test_streaming_correlation_validation():
+    """Test that chunked statistics match a full pass and validate targets."""
+    schema = DataSchema(
+        columns=[
+            ColumnSchema(
+                name="x",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.NORMAL,
+                parameters={"mean": 0, "std": 1}
+            ),
+            ColumnSchema(
+                name="y",
+                data_type=DataType.FLOAT,
+                distribution=DistributionType.UNIFORM,
+                parameters={"low": 0, "high": 10}
+            ),
+            ColumnSchema(
+                name="group",
+                data_type=DataType.CATEGORICAL,
+                distribution=DistributionType.CATEGORICAL,
+                parameters={"categories": ["a", "b"]}
+            )
+        ],
+        correlations={"x": {"y": 0.7}}
+    )
+
+    generator = DataGenerator(schema)
+    chunks = list(generator.generate_chunks(2500, n_samples=10000, seed=11))
+    full = pd.concat(chunks, ignore_index=True)
+
+    stats = generator.correlation_stats
+    assert stats.count == 10000
+    assert np.isclose(stats.correlation().loc["x", "y"], full["x"].corr(full["y"]))
+
+    # Accumulators from separate workers merge into the same result
+    halves = [generator.correlation_manager.correlation_accumulator(full, schema.correlations)
+              for _ in range(2)]
+    halves[0].update(full.iloc[:3000])
+    halves[1].update(full.iloc[3000:])
+    merged = halves[0].merge(halves[1])
+    assert np.allclose(merged.covariance().values, full[["x", "y"]].cov().values)
+
+    results = generator.correlation_manager.validate_correlations(stats, schema.correlations)
+    assert results["valid"]
+    assert abs(results["correlations"]["x_y"]["actual"] - 0.7) < 0.05
+
+    # Non-numeric columns are skipped, as they are for a DataFrame
+    targets = {"x": {"y": 0.7, "group": 0.3}}
+    for data in [stats, full]:
+        results = generator.correlation_manager.validate_correlations(data, targets)
+        assert results["valid"] and not results["errors"]
+        assert any("group" in warning for warning in results["warnings"])
+
+
+def test_nearest_psd_repair():
+    """Test that an inconsistent correlation spec is repaired."""
+    names = ["a", "b", "c"]
+    target = CorrelationManager.build_correlation_matrix(
+        names, {"a": {"b": 0.9, "c": 0.9}, "b": {"c": -0.9}}
+    )
+    assert np.linalg.eigvalsh(target).min() < 0
+
+    repaired = CorrelationManager.nearest_psd(target)
+    assert np.allclose(np.diag(repaired), 1.0)
+    np.linalg.cholesky(repaired)
+
+
+def test_relational_keys_are_consistent():
+    """Test that child tables only reference existing parent keys."""
+    def table(*columns):
+        return DataSchema(columns=[
+            ColumnSchema(name=name, data_type=DataType.FLOAT,
+                         distribution=DistributionType.UNIFORM, parameters={"low": 0, "high": 1})
+            for name in columns
+        ])
+
+    schema = RelationalSchema(
+        tables={"orders": table("total"), "customers": table("balance"), "items": table("price")},
+        primary_keys={"customers": "customer_id", "orders": "order_id"},
+        relationships=[
+            Relationship(parent="customers", child="orders", foreign_key="customer_id",
+                         fan_out={"distribution": "poisson", "parameters": {"lam": 4}}),
+            Relationship(parent="orders", child="items", foreign_key="order_id"),
+        ]
+    )
+    assert schema.table_order() == ["customers", "orders", "items"]
+    assert RelationalSchema.from_dict(schema.to_dict()).to_dict() == schema.to_dict()
+
+    order = [table for table, _ in RelationalGenerator(schema).generate_chunks(
+        {"customers": 2000, "items": 5000}, chunk_size=1000, seed=1)]
+    assert order == sorted(order, key=["customers", "orders", "items"].index)
+
+    tables = RelationalGenerator(schema).generate({"customers": 2000, "items": 5000}, seed=1)
+    customers, orders, items = tables["customers"], tables["orders"], tables["items"]
+    assert list(customers.columns) == ["customer_id", "balance"]
+    assert customers["customer_id"].is_unique and orders["order_id"].is_unique
+    assert orders["customer_id"].isin(customers["customer_id"]).all()
+    assert items["order_id"].isin(orders["order_id"]).all()
+    assert orders["customer_id"].is_monotonic_increasing
+    assert len(items) == 5000
+    assert abs(len(orders) / len(customers) - 4) < 0.2
+
+    try:
+        RelationalSchema(
+            tables={"a": table("x"), "b": table("y")},
+            primary_keys={"a": "id", "b": "id"},
+            relationships=[Relationship("a", "b", "a_id"), Relationship("b", "a", "b_id")]
+        )
+        assert False, "cyclic relationships were accepted"
+    except ValueError as e:
+        assert "cycle" in str(e)
+
+
+def test_scaled_partitions_are_deterministic(tmp_path):
+    """Test that partitions of a scaled template are consistent and reproducible."""
+    schema, rows = TemplateLoader.load_relational("tpch", scale_factor=0.002)
+    assert rows == {"suppliers": 20, "products": 400, "customers": 300}
+
+    totals = generate_partitions(schema, rows, str(tmp_path), partitions=3, workers=2, seed=7, chunk_size=1000)
+    tables = {name: pd.read_parquet(tmp_path / name) for name in schema.tables}
+    assert totals == {name: len(table) for name, table in tables.items()}
+    assert len(tables["customers"]) == 300
+
+    orders, lineitems = tables["orders"], tables["lineitems"]
+    assert orders["order_id"].is_unique
+    assert tables["customers"]["customer_id"].is_unique
+    assert orders["customer_id"].isin(tables["customers"]["customer_id"]).all()
+    assert lineitems["order_id"].isin(orders["order_id"]).all()
+    assert lineitems["product_id"].isin(tables["products"]["product_id"]).all()
+    assert lineitems["supplier_id"].between(0, 19).all()
+    order_dates = orders.set_index("order_id")["order_date"].loc[lineitems["order_id"]].to_numpy()
+    assert (lineitems["ship_date"].to_numpy() > order_dates).all()
+
+    assert "tpch" in TemplateLoader.list_templates()
+    assert TemplateLoader.get_template_info("tpch")["tables"]["lineitems"] == 7
+
+    # Any partition can be regenerated on its own
+    generator = RelationalGenerator(schema)
+    again = pd.concat([
+        chunk for table, chunk in generator.generate_chunks(rows, 1000, seed=7, partition=1, partitions=3)
+        if table == "orders"
+    ], ignore_index=True)
+    written = pd.read_parquet(tmp_path / "orders" / "part-00001.parquet")
+    pd.testing.assert_frame_equal(again, written, check_dtype=False)
+
+
+def test_partitioned_references_skip_dropped_parent_rows():
+    """Test that partitions only reference parent rows that survived drop constraints."""
+    def table(name, constraints=None):
+        return DataSchema(columns=[
+            ColumnSchema(name=name, data_type=DataType.FLOAT,
+                         distribution=DistributionType.UNIFORM, parameters={"low": 0, "high": 1})
+        ], constraints=constraints)
+
+    dropping = {"row_constraints": [{"condition": "price > 0.5", "action": "drop"}]}
+    schema = RelationalSchema(
+        tables={"products": table("price", dropping), "items": table("amount")},
+        primary_keys={"products": "product_id"},
+        relationships=[Relationship(parent="products", child="items", foreign_key="product_id")]
+    )
+
+    generator = RelationalGenerator(schema)
+    tables = {"products": [], "items": []}
+    for partition in range(3):
+        for name, chunk in generator.generate_chunks({"products": 3000, "items": 3000}, 500, seed=4,
+                                                     partition=partition, partitions=3):
+            tables[name].append(chunk)
+    products = pd.concat(tables["products"], ignore_index=True)
+    items = pd.concat(tables["items"], ignore_index=True)
+
+    assert len(products) < 2000 and (products["price"] <= 0.5).all()
+    assert products["product_id"].is_unique
+    assert len(items) == 3000
+    assert items["product_id"].isin(products["product_id"]).all()
+
+
+if __name__ == "__main__":
+    # Run tests
+    import tempfile
+    from pathlib import Path
+    test_temporal_generation_is_typed()
+    test_event_stream_chunks_are_ordered()
+    test_copula_correlations()
+    test_iman_conover_preserves_marginals()
+    test_correlations_keep_other_columns()
+    test_streaming_correlation_validation()
+    test_nearest_psd_repair()
+    test_relational_keys_are_consistent()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_scaled_partitions_are_deterministic(Path(tmp))
+    test_partitioned_references_skip_dropped_parent_rows()
+    print("All tests passed!")
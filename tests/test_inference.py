@@ -0,0 +1,364 @@
+"""
+Schema inference tests for Synthetic Generator.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from synthetic_generator import ColumnSchema, DataType, DistributionType, generate_data
+from synthetic_generator.schemas import SchemaInferrer
+from synthetic_generator.schemas.profile import ColumnProfile
+from synthetic_generator.schemas.readers import sample_rows
+from synthetic_generator.quick import QuickModel, fit
+
+
+def _sample_table(n=3000, seed=0):
+    """Table with numeric, categorical and nullable columns."""
+    rng = np.random.default_rng(seed)
+    score = rng.normal(50, 10, n)
+    score[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame({
+        "user_id": np.arange(1, n + 1),
+        "age": rng.integers(18, 80, n),
+        "score": score,
+        "wait": rng.exponential(5, n),
+        "segment": rng.choice(["a", "b", "c"], n, p=[0.5, 0.3, 0.2])
+    })
+
+
+def _columns(schema):
+    """Columns of a schema keyed by name."""
+    return {column.name: column for column in schema.columns}
+
+
+def _assert_same_schema(left, right):
+    """Compare two schemas, allowing for floating point differences."""
+    for a, b in zip(left.columns, right.columns):
+        assert (a.name, a.data_type, a.distribution, a.unique, a.nullable) == \
+            (b.name, b.data_type, b.distribution, b.unique, b.nullable)
+        assert a.min_value == pytest.approx(b.min_value)
+        assert a.max_value == pytest.approx(b.max_value)
+        assert a.null_probability == pytest.approx(b.null_probability)
+        for key, value in a.parameters.items():
+            assert b.parameters[key] == (pytest.approx(value) if key != "categories" else value)
+
+
+def test_chunked_inference_matches_in_memory(tmp_path):
+    """Test that chunked file inference gives the in-memory schema."""
+    data = _sample_table()
+    expected = SchemaInferrer.infer(data)
+    columns = _columns(expected)
+    assert columns["segment"].data_type == DataType.CATEGORICAL
+    assert columns["user_id"].unique
+    assert columns["score"].null_probability == pytest.approx(data["score"].isna().mean())
+
+    path = tmp_path / "table.csv"
+    data.to_csv(path, index=False)
+    _assert_same_schema(expected, SchemaInferrer.infer_file(str(path), chunk_size=250))
+
+    # A partitioned Parquet dataset is profiled file by file, in parallel
+    root = tmp_path / "dataset"
+    for i in range(4):
+        part = data.iloc[i * 750:(i + 1) * 750]
+        os.makedirs(root / f"part={i}")
+        part.to_parquet(root / f"part={i}" / "data.parquet", index=False)
+
+    profiles = SchemaInferrer.profile_file(str(root), chunk_size=500, workers=4)
+    assert profiles["score"].count == len(data)
+    assert list(profiles)[-1] == "part"
+    schema = SchemaInferrer.infer_profiles({k: v for k, v in profiles.items() if k != "part"})
+    _assert_same_schema(expected, schema)
+
+
+def test_bounded_profiles_estimate_large_columns():
+    """Test that profiles past their exact limits fall back to sketches."""
+    data = _sample_table(n=20000, seed=1)
+    chunks = (data.iloc[start:start + 2000] for start in range(0, len(data), 2000))
+    columns = _columns(SchemaInferrer.infer_chunks(chunks, max_tracked_values=1000, sample_size=2000))
+
+    expected = _columns(SchemaInferrer.infer(data))
+    assert columns["user_id"].unique
+    assert columns["wait"].distribution == DistributionType.EXPONENTIAL
+    assert columns["segment"].parameters["categories"] == expected["segment"].parameters["categories"]
+    assert columns["score"].parameters["mean"] == pytest.approx(expected["score"].parameters["mean"])
+
+
+def test_parallel_column_inference_matches_serial():
+    """Test that concurrent column inference keeps columns and results."""
+    rng = np.random.default_rng(4)
+    wide = pd.DataFrame({f"f{i}": rng.gamma(2, i + 1, 5000) for i in range(40)})
+    wide["label"] = rng.choice(["yes", "no"], 5000)
+
+    serial = SchemaInferrer.infer(wide, workers=1)
+    parallel = SchemaInferrer.infer(wide, workers=8)
+    assert [c.name for c in parallel.columns] == list(wide.columns)
+    _assert_same_schema(serial, parallel)
+
+
+def test_distribution_fitting_selects_family():
+    """Test that numeric columns get the family they were drawn from."""
+    rng = np.random.default_rng(6)
+    n = 20000
+    data = pd.DataFrame({
+        "normal": rng.normal(50, 10, n),
+        "uniform": rng.uniform(0, 5, n),
+        "exponential": rng.exponential(5, n),
+        "gamma": rng.gamma(3, 2, n),
+        "beta": rng.beta(2, 5, n),
+        "weibull": rng.weibull(1.5, n) * 3,
+        "poisson": rng.poisson(4, n),
+        "binomial": rng.binomial(10, 0.3, n),
+        "geometric": rng.geometric(0.2, n)
+    })
+
+    # Chunked profiles carry the same sufficient statistics
+    chunks = (data.iloc[start:start + 5000] for start in range(0, n, 5000))
+    for schema in [SchemaInferrer.infer(data), SchemaInferrer.infer_chunks(chunks)]:
+        columns = _columns(schema)
+        fitted = {name: column.distribution.value for name, column in columns.items()}
+        # Slightly underdispersed counts are fitted as a near-Poisson binomial
+        assert fitted.pop("poisson") in ("poisson", "binomial")
+        assert fitted == {name: name for name in data.columns if name != "poisson"}
+        assert columns["gamma"].parameters["shape"] == pytest.approx(3, rel=0.05)
+        assert columns["weibull"].parameters["shape"] == pytest.approx(1.5, rel=0.05)
+        assert columns["beta"].parameters["b"] == pytest.approx(5, rel=0.1)
+        assert columns["binomial"].parameters["n"] == 10
+
+
+
+def test_empirical_distribution_for_unfitted_columns():
+    """Test that columns no family fits keep their shape as a quantile table."""
+    rng = np.random.default_rng(7)
+    mixture = np.r_[rng.normal(0, 1, 6000), rng.normal(8, 1, 4000)]
+    data = pd.DataFrame({"x": mixture, "k": np.round(mixture).astype(int)})
+
+    chunks = (data.iloc[start:start + 1000] for start in range(0, len(data), 1000))
+    for schema in [SchemaInferrer.infer(data), SchemaInferrer.infer_chunks(chunks, sample_size=2000)]:
+        column = schema.columns[0]
+        assert column.distribution == DistributionType.EMPIRICAL
+        quantiles = column.parameters["quantiles"]
+        assert len(quantiles) == 1024
+        assert (quantiles[0], quantiles[-1]) == (mixture.min(), mixture.max())
+
+        generated = generate_data(schema, n_samples=20000, seed=8)
+        # Both modes are reproduced, in their proportions
+        assert (generated["x"] > 4).mean() == pytest.approx(0.4, abs=0.03)
+        assert generated["k"].dtype.kind == "i"
+        assert generated["x"].between(mixture.min(), mixture.max()).all()
+
+    invalid = ColumnSchema(
+        name="x", data_type=DataType.FLOAT, distribution=DistributionType.EMPIRICAL,
+        parameters={"quantiles": [3.0, 1.0]}
+    )
+    assert invalid.validate() == ["Empirical distribution 'quantiles' must be non-decreasing"]
+
+
+def test_correlations_are_inferred(tmp_path):
+    """Test that significant correlations are inferred and reproduced."""
+    rng = np.random.default_rng(9)
+    n = 20000
+    income = rng.gamma(4, 10000, n)
+    spend = 0.3 * income + rng.normal(0, 5000, n)
+    spend[rng.random(n) < 0.1] = np.nan
+    data = pd.DataFrame({
+        "income": income,
+        "spend": spend,
+        "age": rng.integers(18, 80, n),
+        "segment": rng.choice(["a", "b"], n)
+    })
+    expected = data["income"].corr(data["spend"])
+
+    schema = SchemaInferrer.infer(data)
+    # Independent columns are left out
+    assert list(schema.correlations) == ["income"]
+    assert schema.correlations["income"] == {"spend": pytest.approx(expected)}
+
+    # Chunked files accumulate the same pairwise moments
+    root = tmp_path / "dataset"
+    for i in range(4):
+        os.makedirs(root / f"part={i}")
+        data.iloc[i * 5000:(i + 1) * 5000].to_parquet(root / f"part={i}" / "data.parquet", index=False)
+    schema = SchemaInferrer.infer_file(str(root), chunk_size=1500, workers=4)
+    assert schema.correlations["income"]["spend"] == pytest.approx(expected)
+
+    sampled = fit(data).sample(20000, seed=3)
+    assert sampled["income"].corr(sampled["spend"]) == pytest.approx(expected, abs=0.05)
+
+
+def test_saved_model_samples_like_fitted(tmp_path):
+    """Test that a saved model loads memory-mapped and samples identically."""
+    rng = np.random.default_rng(10)
+    n = 5000
+    x = np.r_[rng.normal(0, 1, 3000), rng.normal(8, 1, 2000)]
+    data = pd.DataFrame({
+        "x": x,
+        "y": x + rng.normal(0, 1, n),
+        "segment": rng.choice(["a", "b", "c"], n, p=[0.5, 0.3, 0.2])
+    })
+    model = fit(data)
+    path = tmp_path / "model.npz"
+    model.save(str(path))
+
+    loaded = QuickModel.load(str(path))
+    columns = _columns(loaded._schema)
+    assert isinstance(columns["x"].parameters["quantiles"], np.memmap)
+    assert isinstance(columns["segment"].parameters["probabilities"], np.memmap)
+    # The correlation factor is restored, not recomputed
+    assert len(loaded._generator.correlation_manager.get_factors()) == 1
+
+    pd.testing.assert_frame_equal(loaded.sample(1000, seed=4), model.sample(1000, seed=4))
+    assert loaded.to_dict() == model.to_dict()
+
+
+def test_text_type_detection():
+    """Test that text columns are typed from their patterns."""
+    from synthetic_generator.generators.text_generators import TextGenerator
+    text = TextGenerator()
+    rng = np.random.default_rng(5)
+    n = 500
+    data = pd.DataFrame({
+        "email": text.generate_emails({}, n),
+        "phone": text.generate_phones({}, n),
+        "address": text.generate_addresses({}, n),
+        "name": text.generate_names({}, n),
+        "signup": pd.Series(pd.date_range("2023-01-01", periods=n, freq="D")).dt.strftime("%Y-%m-%d"),
+        "seen_at": pd.Series(pd.date_range("2023-01-01", periods=n, freq="h")).dt.strftime("%Y-%m-%d %H:%M:%S"),
+        # Free text that pd.to_datetime would happily accept as a date
+        "token": [f"{w}{i}" for i, w in enumerate(rng.choice(["may", "march", "june"], n))]
+    })
+
+    types = {
+        name: SchemaInferrer._infer_data_type(ColumnProfile.from_series(data[name]))
+        for name in data.columns
+    }
+    assert types == {
+        "email": DataType.EMAIL,
+        "phone": DataType.PHONE,
+        "address": DataType.ADDRESS,
+        "name": DataType.NAME,
+        "signup": DataType.DATE,
+        "seen_at": DataType.DATETIME,
+        "token": DataType.STRING
+    }
+
+    # Text dates get the range of their values
+    columns = _columns(SchemaInferrer.infer(data[["signup", "seen_at"]]))
+    assert columns["signup"].parameters == {"start_date": "2023-01-01", "end_date": "2024-05-14"}
+    assert columns["seen_at"].parameters["end_datetime"] == "2023-01-21T19:00:00"
+
+
+def test_high_cardinality_text_columns_infer_valid_schema():
+    """Test that identifier-like text columns are generated, not copied into the schema."""
+    import json
+    from synthetic_generator.generators.text_generators import TextGenerator
+    text = TextGenerator()
+    rng = np.random.default_rng(6)
+    n = 1000
+    data = pd.DataFrame({
+        "email": [f"user{i}@example.com" for i in range(n)],
+        "name": text.generate_names({}, n),
+        "token": [f"tok{i:05d}" for i in range(n)],
+        "city": rng.choice([f"city{i:03d}" for i in range(300)], n)
+    })
+
+    schema = SchemaInferrer.infer(data)
+    assert schema.validate() == []
+    columns = _columns(schema)
+    assert columns["email"].data_type == DataType.EMAIL
+    assert columns["token"].parameters == {"min_length": 8, "max_length": 8}
+
+    # No value of a unique-per-row column appears in the schema
+    encoded = json.dumps(schema.to_dict())
+    for name in ["email", "token"]:
+        assert columns[name].distribution == DistributionType.UNIFORM
+        assert not any(value in encoded for value in data[name])
+
+    # Other text columns keep their most frequent values and an 'other' bucket
+    city = columns["city"].parameters
+    assert len(city["categories"]) == 21 and city["categories"][-1] == "other"
+    assert np.isclose(sum(city["probabilities"]), 1.0)
+
+    generated = generate_data(schema, 200, seed=1)
+    assert len(generated) == 200
+    # Mostly generated addresses (the uniqueness constraint renames repeats)
+    assert generated["email"].str.contains("@").mean() > 0.9
+    assert not generated["email"].isin(data["email"]).any()
+    assert (generated["token"].str.len() == 8).all()
+
+
+def test_sampling_reader_draws_uniform_rows(tmp_path):
+    """Test that file sampling keeps a uniform sample of the requested size."""
+    data = _sample_table(n=20000, seed=2)
+    csv_path = tmp_path / "table.csv"
+    parquet_path = tmp_path / "table.parquet"
+    data.to_csv(csv_path, index=False)
+    data.to_parquet(parquet_path, index=False, row_group_size=1000)
+
+    for path in [csv_path, parquet_path]:
+        sample = sample_rows(str(path), 2000, seed=3, chunk_size=1500)
+        assert len(sample) == 2000
+        assert sample.attrs["source_rows"] == 20000
+        assert sample["user_id"].is_unique
+        assert set(sample["user_id"]) <= set(data["user_id"])
+        # Rows come from the whole file, not just its beginning
+        assert abs(sample["user_id"].mean() - 10000) < 600
+
+    # Asking for more rows than exist returns every row
+    assert len(sample_rows(str(csv_path), 50000)) == 20000
+
+    model = fit(str(parquet_path), sample_size=2000)
+    columns = _columns(model._schema)
+    assert columns["segment"].data_type == DataType.CATEGORICAL
+    assert len(model.sample(100, seed=1)) == 100
+
+
+def test_parquet_sampling_reads_bounded_row_groups(tmp_path, monkeypatch):
+    """Test that Parquet sampling reads a bounded share of a large file."""
+    import pyarrow.parquet as pq
+
+    data = _sample_table(n=50000, seed=4)
+    path = tmp_path / "large.parquet"
+    data.to_parquet(path, index=False, row_group_size=500)
+
+    read = []
+    for method in ["read_row_group", "read_row_groups"]:
+        def counting_read(self, *args, original=getattr(pq.ParquetFile, method), **kwargs):
+            table = original(self, *args, **kwargs)
+            read.append(table.num_rows)
+            return table
+        monkeypatch.setattr(pq.ParquetFile, method, counting_read)
+
+    sample = sample_rows(str(path), 100, seed=5)
+    assert len(sample) == 100
+    assert sample.attrs["source_rows"] == 50000
+    assert sample["user_id"].is_unique
+    # About 20 rows read per sampled row, in whole row groups
+    assert sum(read) <= 100 * 20 + 500
+
+    # Over repeated samples, rows still come from the whole file
+    means = [sample_rows(str(path), 100, seed=s)["user_id"].mean() for s in range(20)]
+    assert abs(np.mean(means) - 25000) < 3000
+
+
+if __name__ == "__main__":
+    # Run tests
+    import tempfile
+    from pathlib import Path
+    with tempfile.TemporaryDirectory() as tmp:
+        test_chunked_inference_matches_in_memory(Path(tmp))
+    test_parallel_column_inference_matches_serial()
+    test_distribution_fitting_selects_family()
+    test_empirical_distribution_for_unfitted_columns()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_correlations_are_inferred(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_saved_model_samples_like_fitted(Path(tmp))
+    test_text_type_detection()
+    test_high_cardinality_text_columns_infer_valid_schema()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_sampling_reader_draws_uniform_rows(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp, pytest.MonkeyPatch.context() as monkeypatch:
+        test_parquet_sampling_reads_bounded_row_groups(Path(tmp), monkeypatch)
+    test_bounded_profiles_estimate_large_columns()
+    print("All tests passed!")